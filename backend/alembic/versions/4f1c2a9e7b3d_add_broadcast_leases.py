@@ -0,0 +1,41 @@
+"""add_broadcast_leases
+
+Revision ID: 4f1c2a9e7b3d
+Revises: 17e35114e360
+Create Date: 2026-10-17 10:12:41.503117
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4f1c2a9e7b3d"
+down_revision: str | None = "17e35114e360"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "broadcaster_workers",
+        sa.Column("worker_id", sa.String(128), nullable=False),
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("worker_id"),
+    )
+    op.create_table(
+        "broadcast_leases",
+        sa.Column("meeting_id", sa.String(36), nullable=False),
+        sa.Column("worker_id", sa.String(128), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("meeting_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("broadcast_leases")
+    op.drop_table("broadcaster_workers")
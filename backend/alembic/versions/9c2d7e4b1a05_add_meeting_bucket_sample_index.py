@@ -0,0 +1,48 @@
+"""add_meeting_bucket_sample_index
+
+Revision ID: 9c2d7e4b1a05
+Revises: 4f1c2a9e7b3d
+Create Date: 2026-10-17 14:03:27.819204
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9c2d7e4b1a05"
+down_revision: str | None = "4f1c2a9e7b3d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEX_NAME = "ix_engagement_samples_meeting_bucket"
+INDEX_COLUMNS = ["meeting_id", "bucket", "participant_id", "status"]
+
+
+def upgrade() -> None:
+    # Serves the per-meeting bucket range scans in bucket order and, since it
+    # also holds participant_id and status, answers them from the index alone.
+    # It supersedes the single-column meeting_id index.
+    if op.get_bind().dialect.name == "postgresql":
+        # Build without blocking writes to the (large, hot) samples table
+        with op.get_context().autocommit_block():
+            op.create_index(
+                INDEX_NAME, "engagement_samples", INDEX_COLUMNS, postgresql_concurrently=True
+            )
+            op.drop_index(
+                "ix_engagement_samples_meeting_id",
+                table_name="engagement_samples",
+                postgresql_concurrently=True,
+            )
+        return
+    op.create_index(INDEX_NAME, "engagement_samples", INDEX_COLUMNS, unique=False)
+    op.drop_index("ix_engagement_samples_meeting_id", table_name="engagement_samples")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_engagement_samples_meeting_id", "engagement_samples", ["meeting_id"], unique=False
+    )
+    op.drop_index(INDEX_NAME, table_name="engagement_samples")
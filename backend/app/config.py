@@ -1,15 +1,199 @@
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import overload
 
 
 def _default_database_url() -> str:
     return os.environ.get("DATABASE_URL", f"sqlite:///{Path('bsbox.db').absolute()}")
 
 
+def _env_flag(name: str, default: bool = False) -> bool:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+@overload
+def _env_float(name: str) -> float | None: ...
+
+
+@overload
+def _env_float(name: str, default: float) -> float: ...
+
+
+def _env_float(name: str, default: float | None = None) -> float | None:
+    value = os.environ.get(name)
+    return float(value) if value else default
+
+
 @dataclass
 class Settings:
     database_url: str = field(default_factory=_default_database_url)
+    # Connection pool of file and server databases (ignored for in-memory SQLite)
+    db_pool_size: int = field(default_factory=lambda: _env_int("DB_POOL_SIZE", 5))
+    db_max_overflow: int = field(default_factory=lambda: _env_int("DB_MAX_OVERFLOW", 10))
+    db_pool_timeout_seconds: float = field(
+        default_factory=lambda: _env_float("DB_POOL_TIMEOUT_SECONDS", 30.0)
+    )
+    # Test connections on checkout and replace them after this many seconds (-1 never)
+    db_pool_pre_ping: bool = field(default_factory=lambda: _env_flag("DB_POOL_PRE_PING"))
+    db_pool_recycle_seconds: int = field(
+        default_factory=lambda: _env_int("DB_POOL_RECYCLE_SECONDS", -1)
+    )
+    # Checkouts waiting longer than this are logged as a sign of an undersized pool
+    db_pool_slow_checkout_ms: int = field(
+        default_factory=lambda: _env_int("DB_POOL_SLOW_CHECKOUT_MS", 200)
+    )
+    # Compiled SQL cache entries per engine
+    db_query_cache_size: int = field(default_factory=lambda: _env_int("DB_QUERY_CACHE_SIZE", 500))
+    # Prepared statements cached per asyncpg connection; 0 disables (e.g. for pgbouncer)
+    db_prepared_statement_cache_size: int = field(
+        default_factory=lambda: _env_int("DB_PREPARED_STATEMENT_CACHE_SIZE", 100)
+    )
+    # SQLite performance profile applied to every new connection
+    sqlite_pragmas_enabled: bool = field(
+        default_factory=lambda: _env_flag("SQLITE_PRAGMAS_ENABLED", True)
+    )
+    sqlite_journal_mode: str = field(
+        default_factory=lambda: os.environ.get("SQLITE_JOURNAL_MODE", "wal").lower()
+    )
+    sqlite_synchronous: str = field(
+        default_factory=lambda: os.environ.get("SQLITE_SYNCHRONOUS", "normal").lower()
+    )
+    sqlite_mmap_size_bytes: int = field(
+        default_factory=lambda: _env_int("SQLITE_MMAP_SIZE_BYTES", 256 * 1024 * 1024)
+    )
+    sqlite_cache_size_kib: int = field(
+        default_factory=lambda: _env_int("SQLITE_CACHE_SIZE_KIB", 64 * 1024)
+    )
+    sqlite_busy_timeout_ms: int = field(
+        default_factory=lambda: _env_int("SQLITE_BUSY_TIMEOUT_MS", 30000)
+    )
+    # On file SQLite, persist status updates, pings and retention deletes through one
+    # dedicated writer thread; joins, leaves and summaries still use their own sessions
+    sqlite_single_writer: bool = field(
+        default_factory=lambda: _env_flag("SQLITE_SINGLE_WRITER", True)
+    )
+    # Monthly sample partitions kept ready after the current month (PostgreSQL, once
+    # converted with scripts/partition_samples.py)
+    sample_partition_months_ahead: int = field(
+        default_factory=lambda: _env_int("SAMPLE_PARTITION_MONTHS_AHEAD", 2)
+    )
+    # Archive raw samples of summarized meetings after this many days; 0 keeps them
+    sample_retention_days: int = field(default_factory=lambda: _env_int("SAMPLE_RETENTION_DAYS", 0))
+    sample_retention_interval_seconds: float = field(
+        default_factory=lambda: _env_float("SAMPLE_RETENTION_INTERVAL_SECONDS", 3600.0)
+    )
+    # Write-behind batching of WS status updates (opt-in)
+    write_behind_enabled: bool = field(default_factory=lambda: _env_flag("WRITE_BEHIND_ENABLED"))
+    write_behind_flush_interval_ms: int = field(
+        default_factory=lambda: _env_int("WRITE_BEHIND_FLUSH_INTERVAL_MS", 500)
+    )
+    write_behind_max_batch: int = field(
+        default_factory=lambda: _env_int("WRITE_BEHIND_MAX_BATCH", 500)
+    )
+    # Buffered updates beyond this are dropped (oldest first) while the database lags
+    write_behind_max_pending: int = field(
+        default_factory=lambda: _env_int("WRITE_BEHIND_MAX_PENDING", 10_000)
+    )
+    # Per-meeting delta coalescing window; 0 publishes every change immediately
+    delta_coalesce_window_ms: int = field(
+        default_factory=lambda: _env_int("DELTA_COALESCE_WINDOW_MS", 250)
+    )
+    # Channels backend for WS broadcasts: "memory", "postgres" or "redis"
+    channels_backend: str = field(
+        default_factory=lambda: os.environ.get("CHANNELS_BACKEND", "memory").lower()
+    )
+    redis_url: str = field(
+        default_factory=lambda: os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+    )
+    # JSON encoder for broadcasts: "pydantic", "orjson" or "msgspec"
+    ws_json_encoder: str = field(
+        default_factory=lambda: os.environ.get("WS_JSON_ENCODER", "pydantic").lower()
+    )
+    # Smoothing algorithm for engagement series: "none", "kalman" or "steady_state_kalman"
+    smoothing_algorithm: str = field(
+        default_factory=lambda: os.environ.get("SMOOTHING_ALGORITHM", "kalman").lower()
+    )
+    # Snapshot engine: "python" or "numpy" (array-backed, needs the numpy extra)
+    snapshot_engine: str = field(
+        default_factory=lambda: os.environ.get("SNAPSHOT_ENGINE", "python").lower()
+    )
+    # Reuse engagement summaries across joins, updating them incrementally
+    snapshot_cache_enabled: bool = field(
+        default_factory=lambda: _env_flag("SNAPSHOT_CACHE_ENABLED", True)
+    )
+    # Byte budget of serialized snapshots reused across joins; 0 disables
+    snapshot_payload_cache_max_bytes: int = field(
+        default_factory=lambda: _env_int("SNAPSHOT_PAYLOAD_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+    )
+    # Close connections from one central timer per meeting instead of a task per socket
+    meeting_end_scheduler_enabled: bool = field(
+        default_factory=lambda: _env_flag("MEETING_END_SCHEDULER_ENABLED", True)
+    )
+    # Sockets closed concurrently per batch when a meeting ends
+    meeting_end_close_batch_size: int = field(
+        default_factory=lambda: _env_int("MEETING_END_CLOSE_BATCH_SIZE", 100)
+    )
+    # Split periodic broadcasts across workers sharing a (non-memory) channels backend
+    broadcaster_sharding_enabled: bool = field(
+        default_factory=lambda: _env_flag("BROADCASTER_SHARDING_ENABLED", True)
+    )
+    # Lifetime of worker heartbeats and meeting leases; bounds failover time
+    broadcaster_lease_seconds: float = field(
+        default_factory=lambda: _env_float("BROADCASTER_LEASE_SECONDS", 30.0)
+    )
+    # Threads computing periodic rollups off the event loop
+    broadcaster_max_workers: int = field(
+        default_factory=lambda: _env_int("BROADCASTER_MAX_WORKERS", 4)
+    )
+    # Rollups not computed this long after a tick starts are skipped
+    broadcaster_tick_deadline_ms: int = field(
+        default_factory=lambda: _env_int("BROADCASTER_TICK_DEADLINE_MS", 5000)
+    )
+    # Only broadcast meetings whose state or bucket changed since the last tick
+    broadcaster_skip_unchanged: bool = field(
+        default_factory=lambda: _env_flag("BROADCASTER_SKIP_UNCHANGED", True)
+    )
+    # Unchanged meetings are still broadcast this often for liveness
+    broadcaster_heartbeat_seconds: float = field(
+        default_factory=lambda: _env_float("BROADCASTER_HEARTBEAT_SECONDS", 60.0)
+    )
+    # Per-meeting broadcast intervals: busy meetings speed up, idle ones back off
+    broadcaster_adaptive_interval: bool = field(
+        default_factory=lambda: _env_flag("BROADCASTER_ADAPTIVE_INTERVAL", True)
+    )
+    broadcaster_min_interval_seconds: float = field(
+        default_factory=lambda: _env_float("BROADCASTER_MIN_INTERVAL_SECONDS", 2.0)
+    )
+    broadcaster_max_interval_seconds: float = field(
+        default_factory=lambda: _env_float("BROADCASTER_MAX_INTERVAL_SECONDS", 60.0)
+    )
+    # Participant count from which an active meeting gets the minimum interval
+    broadcaster_busy_participants: int = field(
+        default_factory=lambda: _env_int("BROADCASTER_BUSY_PARTICIPANTS", 10)
+    )
+    # Participants count as present if seen this recently (clients ping every 30s)
+    broadcaster_activity_window_seconds: float = field(
+        default_factory=lambda: _env_float("BROADCASTER_ACTIVITY_WINDOW_SECONDS", 90.0)
+    )
+    # Max age of cached live engagement state; None keeps it until evicted
+    live_state_max_age_seconds: float | None = field(
+        default_factory=lambda: _env_float("LIVE_STATE_MAX_AGE_SECONDS")
+    )
+
+    def __post_init__(self) -> None:
+        # With a shared channels backend other workers record statuses this
+        # process never sees, so live state must be refreshed from the database
+        if self.live_state_max_age_seconds is None and self.channels_backend != "memory":
+            self.live_state_max_age_seconds = 10.0
 
 
 settings = Settings()
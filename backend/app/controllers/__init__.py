@@ -1,5 +1,5 @@
 from app.controllers.cities import CitiesController
-from app.controllers.health import health_check
+from app.controllers.health import health_check, metrics_snapshot
 from app.controllers.meeting_rooms import MeetingRoomsController
 from app.controllers.meetings import MeetingsController
 from app.controllers.visit import VisitsController
@@ -10,4 +10,5 @@ __all__ = [
     "CitiesController",
     "MeetingRoomsController",
     "health_check",
+    "metrics_snapshot",
 ]
@@ -1,7 +1,15 @@
 from litestar import get
 
+from app.utils.metrics import metrics
+
 
 @get("/health", sync_to_thread=False)
 def health_check() -> dict:
     """Health check endpoint for container orchestration."""
     return {"status": "ok"}
+
+
+@get("/metrics", sync_to_thread=False)
+def metrics_snapshot() -> dict:
+    """Current values of the in-process metrics."""
+    return metrics.collect()
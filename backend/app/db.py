@@ -1,27 +1,83 @@
 from collections.abc import Generator
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import Pool
 
 from app.config import settings
-from app.db_utils import get_dialect
+from app.db_pool import PoolTelemetry, TimedAsyncAdaptedQueuePool, TimedQueuePool
+from app.db_utils import (
+    apply_sqlite_pragmas,
+    get_async_database_url,
+    get_dialect,
+    is_memory_database,
+    sqlite_pragmas,
+)
 
 
-def _get_connect_args() -> dict:
+def _get_connect_args(is_async: bool = False) -> dict:
     """Return dialect-specific connection arguments."""
     if get_dialect() == "sqlite":
-        return {"check_same_thread": False, "timeout": 30}
+        return {"check_same_thread": False, "timeout": settings.sqlite_busy_timeout_ms / 1000}
+    if is_async:
+        # asyncpg caches prepared statements per connection
+        return {"prepared_statement_cache_size": settings.db_prepared_statement_cache_size}
     return {}
 
 
+def _get_pool_args(poolclass: type[Pool]) -> dict:
+    """Return pool arguments from the settings.
+
+    In-memory SQLite keeps SQLAlchemy's single-connection pool; every other
+    database gets a (timed) queue pool sized by the settings.
+    """
+    args: dict = {
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+    }
+    if not is_memory_database():
+        args.update(
+            poolclass=poolclass,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout_seconds,
+        )
+    return args
+
+
 engine = create_engine(
     settings.database_url,
     echo=False,
     future=True,
     connect_args=_get_connect_args(),
+    query_cache_size=settings.db_query_cache_size,
+    **_get_pool_args(TimedQueuePool),
 )
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 
+# Async engine used by WebSocket handlers and background tasks so database IO
+# never blocks the event loop. Objects stay usable after commit because lazy
+# refreshes are not possible outside of an awaited call.
+async_engine = create_async_engine(
+    get_async_database_url(),
+    echo=False,
+    connect_args=_get_connect_args(is_async=True),
+    query_cache_size=settings.db_query_cache_size,
+    **_get_pool_args(TimedAsyncAdaptedQueuePool),
+)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+if get_dialect() == "sqlite" and settings.sqlite_pragmas_enabled:
+    apply_sqlite_pragmas(engine, sqlite_pragmas())
+    apply_sqlite_pragmas(async_engine.sync_engine, sqlite_pragmas())
+
+# Pool usage of both engines is published on /metrics
+PoolTelemetry("sync", settings.db_pool_slow_checkout_ms / 1000).instrument(engine)
+PoolTelemetry("async", settings.db_pool_slow_checkout_ms / 1000).instrument(
+    async_engine.sync_engine
+)
+
 
 def provide_session() -> Generator[Session, None, None]:
     """Litestar dependency to provide a SQLAlchemy session per request."""
@@ -34,3 +90,12 @@ def provide_session() -> Generator[Session, None, None]:
         raise
     finally:
         session.close()
+
+
+def provide_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Litestar dependency to provide the async session factory.
+
+    WebSocket connections open a short-lived session from it per message
+    instead of holding one session (and pooled connection) per socket.
+    """
+    return AsyncSessionLocal
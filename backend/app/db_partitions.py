@@ -0,0 +1,222 @@
+"""Monthly range partitioning of engagement_samples (PostgreSQL only)."""
+
+import re
+from datetime import UTC, datetime
+
+from sqlalchemy import Connection, text
+
+SAMPLES_TABLE = "engagement_samples"
+DEFAULT_PARTITION = f"{SAMPLES_TABLE}_default"
+
+# Attached monthly partitions and the tables they become once archived
+_PARTITION_NAME = re.compile(rf"^{SAMPLES_TABLE}_p(\d{{4}})(\d{{2}})$")
+_ARCHIVE_PREFIX = f"{SAMPLES_TABLE}_archive_"
+
+# Constraints and indexes of engagement_samples, recreated after a conversion.
+# On the partitioned table the primary key must include the partition key.
+_INDEXES = (
+    f"CREATE INDEX ix_engagement_samples_meeting_bucket ON {SAMPLES_TABLE} "
+    "(meeting_id, bucket, participant_id, status)",
+    f"CREATE INDEX ix_engagement_samples_bucket ON {SAMPLES_TABLE} (bucket)",
+    f"CREATE INDEX ix_engagement_samples_participant_id ON {SAMPLES_TABLE} (participant_id)",
+)
+_CONSTRAINTS = (
+    f"ALTER TABLE {SAMPLES_TABLE} ADD CONSTRAINT uq_sample_bucket UNIQUE (participant_id, bucket)",
+    f"ALTER TABLE {SAMPLES_TABLE} ADD CONSTRAINT engagement_samples_meeting_id_fkey "
+    "FOREIGN KEY (meeting_id) REFERENCES meetings (id)",
+    f"ALTER TABLE {SAMPLES_TABLE} ADD CONSTRAINT engagement_samples_participant_id_fkey "
+    "FOREIGN KEY (participant_id) REFERENCES participants (id)",
+)
+
+
+def month_start(ts: datetime) -> datetime:
+    """Return the first instant (UTC) of the month containing a timestamp."""
+    ts = ts.astimezone(UTC) if ts.tzinfo else ts.replace(tzinfo=UTC)
+    return ts.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    """Shift the start of a month by a number of months."""
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month: datetime) -> str:
+    """Return the name of the partition holding a month's samples."""
+    return f"{SAMPLES_TABLE}_p{month:%Y%m}"
+
+
+def partition_month(name: str) -> datetime | None:
+    """Return the month held by a monthly partition, or None for other tables."""
+    match = _PARTITION_NAME.match(name)
+    if match is None:
+        return None
+    return datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=UTC)
+
+
+def archive_name(month: datetime) -> str:
+    """Return the name a month's partition gets once detached and archived."""
+    return f"{_ARCHIVE_PREFIX}{month:%Y%m}"
+
+
+def is_partitioned(conn: Connection) -> bool:
+    """Whether engagement_samples is a partitioned table."""
+    if conn.dialect.name != "postgresql":
+        return False
+    # relkind is a "char", which drivers return as str or bytes; compare in SQL
+    partitioned = conn.execute(
+        text("SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass(:table)"),
+        {"table": SAMPLES_TABLE},
+    ).scalar()
+    return bool(partitioned)
+
+
+def attached_partitions(conn: Connection) -> dict[str, datetime]:
+    """Return the monthly partitions attached to engagement_samples.
+
+    Returns:
+        Map of partition name -> first instant of its month
+    """
+    names = conn.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:table)"
+        ),
+        {"table": SAMPLES_TABLE},
+    ).scalars()
+    partitions = {name: partition_month(name) for name in names}
+    return {name: month for name, month in partitions.items() if month is not None}
+
+
+def has_default_partition(conn: Connection) -> bool:
+    """Whether the default partition is attached to engagement_samples."""
+    return bool(
+        conn.execute(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = to_regclass(:table) AND c.relname = :default)"
+            ),
+            {"table": SAMPLES_TABLE, "default": DEFAULT_PARTITION},
+        ).scalar()
+    )
+
+
+def ensure_partitions(conn: Connection, start: datetime, end: datetime) -> list[str]:
+    """Create the missing monthly partitions covering a time range.
+
+    Samples of these months may already sit in the default partition, which
+    makes PostgreSQL refuse to create their partitions. The default partition
+    is then detached while the partitions are created, its rows of the new
+    months are moved over, and it is attached again.
+
+    Args:
+        conn: Connection to the database
+        start: Earliest timestamp to cover
+        end: Latest timestamp to cover
+
+    Returns:
+        Names of the created partitions
+    """
+    existing = attached_partitions(conn)
+    missing = []
+    month, last = month_start(start), month_start(end)
+    while month <= last:
+        if partition_name(month) not in existing:
+            missing.append(month)
+        month = add_months(month, 1)
+    if not missing:
+        return []
+
+    default = has_default_partition(conn)
+    if default:
+        conn.execute(text(f"ALTER TABLE {SAMPLES_TABLE} DETACH PARTITION {DEFAULT_PARTITION}"))
+    for month in missing:
+        conn.execute(
+            text(
+                f"CREATE TABLE {partition_name(month)} PARTITION OF {SAMPLES_TABLE} "
+                f"FOR VALUES FROM ('{month.isoformat()}') "
+                f"TO ('{add_months(month, 1).isoformat()}')"
+            )
+        )
+    if default:
+        for month in missing:
+            conn.execute(
+                text(
+                    f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+                    "WHERE bucket >= :start AND bucket < :end RETURNING *) "
+                    f"INSERT INTO {SAMPLES_TABLE} SELECT * FROM moved"
+                ),
+                {"start": month, "end": add_months(month, 1)},
+            )
+        conn.execute(
+            text(f"ALTER TABLE {SAMPLES_TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT")
+        )
+    return [partition_name(month) for month in missing]
+
+
+def partition_samples_table(
+    conn: Connection, months_ahead: int, now: datetime | None = None
+) -> None:
+    """Convert engagement_samples into a table range-partitioned by month.
+
+    Samples are copied into one partition per month, from the oldest sample
+    up to ``months_ahead`` months after the current one. A default partition
+    catches rows outside these ranges, so inserts never fail when the
+    retention job has not created a month's partition in time; the job
+    moves them into the month's partition once it creates it.
+
+    Run through ``python -m scripts.partition_samples`` rather than on
+    startup, since the whole table is rewritten.
+
+    Args:
+        conn: Connection to a PostgreSQL database, inside a transaction
+        months_ahead: Months after the current one to create partitions for
+        now: Current time (defaults to the wall clock)
+    """
+    legacy = f"{SAMPLES_TABLE}_unpartitioned"
+    conn.execute(text(f"ALTER TABLE {SAMPLES_TABLE} RENAME TO {legacy}"))
+    conn.execute(
+        text(
+            f"CREATE TABLE {SAMPLES_TABLE} (LIKE {legacy} INCLUDING DEFAULTS) "
+            "PARTITION BY RANGE (bucket)"
+        )
+    )
+    now = now or datetime.now(tz=UTC)
+    oldest = conn.execute(text(f"SELECT min(bucket) FROM {legacy}")).scalar() or now
+    ensure_partitions(conn, min(oldest, now), add_months(month_start(now), months_ahead))
+    conn.execute(text(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {SAMPLES_TABLE} DEFAULT"))
+    _move_samples(conn, legacy, primary_key="id, bucket")
+
+
+def unpartition_samples_table(conn: Connection) -> None:
+    """Convert a partitioned engagement_samples back into a plain table.
+
+    Archived (detached) partitions are left untouched.
+
+    Args:
+        conn: Connection to a PostgreSQL database, inside a transaction
+    """
+    partitioned = f"{SAMPLES_TABLE}_partitioned"
+    conn.execute(text(f"ALTER TABLE {SAMPLES_TABLE} RENAME TO {partitioned}"))
+    conn.execute(text(f"CREATE TABLE {SAMPLES_TABLE} (LIKE {partitioned} INCLUDING DEFAULTS)"))
+    _move_samples(conn, partitioned, primary_key="id")
+
+
+def _move_samples(conn: Connection, source: str, primary_key: str) -> None:
+    """Copy all samples from a renamed source table and drop it.
+
+    The source still owns the constraint and index names, so they are
+    recreated on the new table only once the source is gone.
+    """
+    conn.execute(text(f"INSERT INTO {SAMPLES_TABLE} SELECT * FROM {source}"))
+    # Keep the id sequence alive when the source table is dropped
+    conn.execute(text(f"ALTER SEQUENCE {SAMPLES_TABLE}_id_seq OWNED BY {SAMPLES_TABLE}.id"))
+    conn.execute(text(f"DROP TABLE {source}"))
+    conn.execute(
+        text(
+            f"ALTER TABLE {SAMPLES_TABLE} ADD CONSTRAINT {SAMPLES_TABLE}_pkey "
+            f"PRIMARY KEY ({primary_key})"
+        )
+    )
+    for statement in (*_CONSTRAINTS, *_INDEXES):
+        conn.execute(text(statement))
@@ -0,0 +1,128 @@
+"""Connection pool classes and pool telemetry."""
+
+import logging
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, QueuePool
+
+from app.utils.metrics import MetricsRegistry, metrics
+
+logger = logging.getLogger(__name__)
+
+# Connection record info key carrying the wait of the checkout in progress
+_WAIT_KEY = "checkout_wait_seconds"
+
+# Histogram buckets for checkout waits, in seconds
+CHECKOUT_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0)
+
+
+class _TimedCheckoutMixin:
+    """Records how long getting a connection from the pool took.
+
+    The wait (queueing for a free connection plus opening a new one) is
+    stored on the connection record and picked up by the ``checkout`` event.
+    """
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        record: ConnectionPoolEntry = super()._do_get()  # type: ignore[misc]
+        record.info[_WAIT_KEY] = time.perf_counter() - started
+        return record
+
+
+class TimedQueuePool(_TimedCheckoutMixin, QueuePool):
+    """QueuePool that records checkout waits."""
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout waits."""
+
+
+class PoolTelemetry:
+    """Publishes an engine's pool usage through pool events.
+
+    Metrics (prefixed with ``db_pool_<name>_``):
+
+    - ``checkout_wait_seconds``: histogram of checkout waits (timed pools only)
+    - ``slow_checkouts``: checkouts waiting longer than ``slow_checkout_seconds``
+    - ``in_use``: connections currently checked out
+    - ``overflow``: checked out connections beyond the pool size
+
+    Slow checkouts are also logged as warnings, so the pool can be sized
+    against the actual WebSocket concurrency.
+    """
+
+    def __init__(
+        self, name: str, slow_checkout_seconds: float, registry: MetricsRegistry = metrics
+    ) -> None:
+        """Initialize the pool metrics.
+
+        Args:
+            name: Name of the engine, used in metric names
+            slow_checkout_seconds: Checkout wait from which a warning is logged
+            registry: Registry the metrics are published in
+        """
+        self.name = name
+        self.slow_checkout_seconds = slow_checkout_seconds
+        prefix = f"db_pool_{name}"
+        self.checkout_wait = registry.histogram(
+            f"{prefix}_checkout_wait_seconds",
+            "Time spent waiting for a pooled connection",
+            CHECKOUT_WAIT_BUCKETS,
+        )
+        self.slow_checkouts = registry.counter(
+            f"{prefix}_slow_checkouts", "Checkouts that waited longer than the threshold"
+        )
+        self.in_use = registry.gauge(f"{prefix}_in_use", "Connections currently checked out")
+        self.overflow = registry.gauge(
+            f"{prefix}_overflow", "Checked out connections beyond the pool size"
+        )
+        self._engine: Engine | None = None
+        self._checked_out = 0
+        self._lock = threading.Lock()
+
+    def instrument(self, engine: Engine) -> None:
+        """Listen to the pool events of an engine.
+
+        Args:
+            engine: Sync engine (use ``AsyncEngine.sync_engine`` for async engines)
+        """
+        self._engine = engine
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+
+    def _on_checkout(self, dbapi_connection, record: ConnectionPoolEntry, proxy) -> None:
+        self._update_usage(1)
+        wait = record.info.pop(_WAIT_KEY, None)
+        if wait is None:
+            return
+        self.checkout_wait.observe(wait)
+        if wait >= self.slow_checkout_seconds:
+            self.slow_checkouts.inc()
+            logger.warning(
+                "Waited %.0f ms for a %s database connection (%d in use, pool size %s); "
+                "consider raising DB_POOL_SIZE or DB_MAX_OVERFLOW",
+                wait * 1000,
+                self.name,
+                self.in_use.value,
+                self._pool_size(),
+            )
+
+    def _on_checkin(self, dbapi_connection, record: ConnectionPoolEntry) -> None:
+        self._update_usage(-1)
+
+    def _update_usage(self, delta: int) -> None:
+        with self._lock:
+            self._checked_out = max(self._checked_out + delta, 0)
+            checked_out = self._checked_out
+        self.in_use.set(checked_out)
+        size = self._pool_size()
+        if size is not None:
+            self.overflow.set(max(checked_out - size, 0))
+
+    def _pool_size(self) -> int | None:
+        pool = self._engine.pool if self._engine is not None else None
+        return pool.size() if isinstance(pool, QueuePool) else None
@@ -1,7 +1,9 @@
 """Database dialect utilities for multi-database support."""
 
+from sqlalchemy import event
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
 
 from app.config import settings
 
@@ -14,8 +16,73 @@ def get_dialect() -> str:
     return "sqlite"
 
 
+def is_memory_database() -> bool:
+    """Whether DATABASE_URL points to an in-memory SQLite database."""
+    url = settings.database_url.lower()
+    if get_dialect() != "sqlite":
+        return False
+    database = url.partition("://")[2].lstrip("/").split("?", 1)[0]
+    return database in ("", ":memory:") or "mode=memory" in url
+
+
+def get_async_database_url() -> str:
+    """Return DATABASE_URL rewritten for the matching asyncio driver.
+
+    SQLite uses aiosqlite and PostgreSQL uses asyncpg; any explicit sync
+    driver suffix (e.g. ``+psycopg2``) is replaced.
+    """
+    url = settings.database_url
+    scheme, sep, rest = url.partition("://")
+    if get_dialect() == "postgresql":
+        return f"postgresql+asyncpg{sep}{rest}"
+    if scheme.split("+", 1)[0] == "sqlite":
+        return f"sqlite+aiosqlite{sep}{rest}"
+    return url
+
+
 def dialect_insert(table):
     """Return dialect-specific insert statement for the configured database."""
     if get_dialect() == "postgresql":
         return pg_insert(table)
     return sqlite_insert(table)
+
+
+def sqlite_pragmas() -> list[str]:
+    """Return the PRAGMA statements of the configured SQLite performance profile.
+
+    WAL lets readers proceed while a write is in progress and, with
+    ``synchronous=NORMAL``, commits without an fsync per transaction. Memory
+    mapping and a larger page cache cut read syscalls; the busy timeout makes
+    writers queue for the write lock instead of failing immediately.
+    In-memory databases only get the settings that apply to them.
+    """
+    pragmas = [
+        f"PRAGMA busy_timeout = {int(settings.sqlite_busy_timeout_ms)}",
+        f"PRAGMA cache_size = {-int(settings.sqlite_cache_size_kib)}",
+        "PRAGMA temp_store = MEMORY",
+    ]
+    if not is_memory_database():
+        pragmas += [
+            f"PRAGMA journal_mode = {settings.sqlite_journal_mode}",
+            f"PRAGMA synchronous = {settings.sqlite_synchronous}",
+            f"PRAGMA mmap_size = {int(settings.sqlite_mmap_size_bytes)}",
+        ]
+    return pragmas
+
+
+def apply_sqlite_pragmas(engine: Engine, pragmas: list[str]) -> None:
+    """Run PRAGMA statements on every new DBAPI connection of an engine.
+
+    Args:
+        engine: Sync engine (use ``AsyncEngine.sync_engine`` for async engines)
+        pragmas: PRAGMA statements to execute
+    """
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
@@ -1,6 +1,7 @@
 from litestar.di import Provide
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.repos import CityRepo, EngagementRepo, MeetingRepo, MeetingRoomRepo, ParticipantRepo
 from app.services import (
     CityService,
@@ -11,7 +12,8 @@ from app.services import (
 )
 from app.services.engagement.bucketing import BucketManager
 from app.services.engagement.smoothing import SmoothingAlgorithm, SmoothingFactory
-from app.services.engagement.summary import SnapshotBuilder
+from app.services.engagement.state import live_state_registry
+from app.services.engagement.summary import SnapshotBuilderFactory, snapshot_cache
 
 
 def provide_meeting_service(session: Session) -> MeetingService:
@@ -30,12 +32,15 @@ def provide_engagement_service(session: Session) -> EngagementService:
 
     # Create components
     bucket_manager = BucketManager()
-    smoothing_strategy = SmoothingFactory.create(SmoothingAlgorithm.KALMAN)
-    snapshot_builder = SnapshotBuilder(
+    smoothing_strategy = SmoothingFactory.create(SmoothingAlgorithm(settings.smoothing_algorithm))
+    snapshot_builder = SnapshotBuilderFactory.create(
         engagement_repo=engagement_repo,
         participant_repo=participant_repo,
         bucket_manager=bucket_manager,
         smoothing_strategy=smoothing_strategy,
+        live_state=live_state_registry,
+        snapshot_cache=snapshot_cache if settings.snapshot_cache_enabled else None,
+        engine=settings.snapshot_engine,
     )
 
     return EngagementService(
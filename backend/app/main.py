@@ -1,29 +1,49 @@
 from pathlib import Path
 
 from litestar import Litestar
-from litestar.channels import ChannelsPlugin
-from litestar.channels.backends.memory import MemoryChannelsBackend
 from litestar.di import Provide
 from litestar.static_files import create_static_files_router
 
+from app.config import settings
 from app.controllers import (
     CitiesController,
     MeetingRoomsController,
     MeetingsController,
     VisitsController,
     health_check,
+    metrics_snapshot,
 )
-from app.db import SessionLocal, provide_session
+from app.db import (
+    AsyncSessionLocal,
+    SessionLocal,
+    async_engine,
+    provide_async_session_factory,
+    provide_session,
+)
+from app.db_partitions import is_partitioned
+from app.db_utils import get_dialect, is_memory_database
 from app.dependencies import dependencies as app_dependencies
 from app.logging_config import configure_logging
 from app.migrations import run_migrations_on_startup
-from app.ws.background import start_broadcaster, stop_broadcaster
+from app.ws.background import (
+    get_sqlite_writer,
+    start_broadcaster,
+    start_delta_coalescer,
+    start_meeting_end_scheduler,
+    start_sample_retention,
+    start_sqlite_writer,
+    start_status_writer,
+    stop_broadcaster,
+    stop_delta_coalescer,
+    stop_meeting_end_scheduler,
+    stop_sample_retention,
+    stop_sqlite_writer,
+    stop_status_writer,
+)
 from app.ws.controllers import meeting_stream_controller
+from app.ws.shared.channels import create_channels_plugin
 
-channels_plugin = ChannelsPlugin(
-    backend=MemoryChannelsBackend(),
-    arbitrary_channels_allowed=True,
-)
+channels_plugin = create_channels_plugin()
 
 
 def setup_logging(app: object | None = None) -> None:
@@ -31,14 +51,50 @@ def setup_logging(app: object | None = None) -> None:
     configure_logging()
 
 
+async def _samples_partitioned() -> bool:
+    """Whether engagement_samples was converted to monthly partitions."""
+    async with async_engine.connect() as conn:
+        return await conn.run_sync(is_partitioned)
+
+
 async def on_startup(app: Litestar) -> None:
     """Application startup hook."""
-    await start_broadcaster(app, SessionLocal, interval_seconds=10)
+    if settings.sqlite_single_writer and get_dialect() == "sqlite" and not is_memory_database():
+        # Hot-path writes (status updates, pings) are then serialized on one thread
+        await start_sqlite_writer(SessionLocal)
+    if settings.write_behind_enabled:
+        await start_status_writer(
+            AsyncSessionLocal,
+            flush_interval_ms=settings.write_behind_flush_interval_ms,
+            max_batch=settings.write_behind_max_batch,
+            writer=get_sqlite_writer(),
+            max_pending=settings.write_behind_max_pending,
+        )
+    if settings.delta_coalesce_window_ms > 0:
+        await start_delta_coalescer(
+            app, AsyncSessionLocal, window_ms=settings.delta_coalesce_window_ms
+        )
+    if settings.meeting_end_scheduler_enabled:
+        await start_meeting_end_scheduler(close_batch_size=settings.meeting_end_close_batch_size)
+    if settings.sample_retention_days > 0 or await _samples_partitioned():
+        await start_sample_retention(
+            AsyncSessionLocal,
+            retention_days=settings.sample_retention_days,
+            months_ahead=settings.sample_partition_months_ahead,
+            interval_seconds=settings.sample_retention_interval_seconds,
+            writer=get_sqlite_writer(),
+        )
+    await start_broadcaster(app, AsyncSessionLocal, interval_seconds=10)
 
 
 async def on_shutdown(app: Litestar) -> None:
     """Application shutdown hook."""
     await stop_broadcaster(app)
+    await stop_meeting_end_scheduler()
+    await stop_delta_coalescer()
+    await stop_sample_retention()
+    await stop_status_writer()
+    await stop_sqlite_writer()
 
 
 def _static_routes():
@@ -69,9 +125,14 @@ def create_app() -> Litestar:
             MeetingRoomsController,
             meeting_stream_controller,
             health_check,
+            metrics_snapshot,
             *_static_routes(),
         ],
-        dependencies={"session": Provide(provide_session), **app_dependencies},
+        dependencies={
+            "session": Provide(provide_session),
+            "async_session_factory": Provide(provide_async_session_factory, sync_to_thread=False),
+            **app_dependencies,
+        },
         plugins=[channels_plugin],
         on_startup=[run_migrations_on_startup, setup_logging, on_startup],
         on_shutdown=[on_shutdown],
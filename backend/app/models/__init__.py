@@ -1,4 +1,5 @@
 from app.models.base import Base
+from app.models.broadcast_lease import BroadcasterWorker, BroadcastLease
 from app.models.city import City
 from app.models.engagement_sample import EngagementSample
 from app.models.meeting import Meeting
@@ -16,4 +17,6 @@ __all__ = [
     "City",
     "MeetingRoom",
     "MeetingSummary",
+    "BroadcasterWorker",
+    "BroadcastLease",
 ]
@@ -0,0 +1,28 @@
+"""Models coordinating periodic broadcasts across workers."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class BroadcasterWorker(Base):
+    """A worker running the periodic broadcaster, kept alive by heartbeats."""
+
+    __tablename__ = "broadcaster_workers"
+
+    worker_id: Mapped[str] = mapped_column(String(128), primary_key=True)
+    heartbeat_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+class BroadcastLease(Base):
+    """Lease granting one worker the periodic broadcasts of a meeting."""
+
+    __tablename__ = "broadcast_leases"
+
+    meeting_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    worker_id: Mapped[str] = mapped_column(String(128), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -10,10 +10,19 @@ from app.models.base import Base
 
 
 class EngagementSample(Base):
+    # On PostgreSQL the table may be range-partitioned by month (see
+    # app.db_partitions); its primary key is then (id, bucket).
     __tablename__ = "engagement_samples"
     __table_args__ = (
         UniqueConstraint("participant_id", "bucket", name="uq_sample_bucket"),
-        Index("ix_engagement_samples_meeting_id", "meeting_id"),
+        # Per-meeting bucket range scans in bucket order, answered from the index
+        Index(
+            "ix_engagement_samples_meeting_bucket",
+            "meeting_id",
+            "bucket",
+            "participant_id",
+            "status",
+        ),
         Index("ix_engagement_samples_bucket", "bucket"),
     )
 
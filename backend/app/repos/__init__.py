@@ -1,3 +1,7 @@
+from app.repos.async_broadcast_lease_repo import AsyncBroadcastLeaseRepo
+from app.repos.async_engagement_repo import AsyncEngagementRepo
+from app.repos.async_meeting_repo import AsyncMeetingRepo
+from app.repos.async_participant_repo import AsyncParticipantRepo
 from app.repos.city_repo import CityRepo
 from app.repos.engagement_repo import EngagementRepo
 from app.repos.meeting_repo import MeetingRepo
@@ -14,4 +18,8 @@ __all__ = [
     "CityRepo",
     "MeetingRoomRepo",
     "MeetingSummaryRepo",
+    "AsyncBroadcastLeaseRepo",
+    "AsyncEngagementRepo",
+    "AsyncMeetingRepo",
+    "AsyncParticipantRepo",
 ]
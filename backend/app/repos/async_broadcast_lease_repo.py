@@ -0,0 +1,108 @@
+"""Async repository for broadcaster membership and meeting leases."""
+
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db_utils import dialect_insert
+from app.models import BroadcasterWorker, BroadcastLease
+from app.utils.datetime import ensure_utc
+
+
+class AsyncBroadcastLeaseRepo:
+    """Stores which workers are alive and which worker broadcasts which meeting."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def current_time(self) -> datetime:
+        """Return the database's current time (the start of the transaction on PostgreSQL)."""
+        now = (await self.session.execute(select(func.now()))).scalar_one()
+        # SQLite's CURRENT_TIMESTAMP is UTC without an offset
+        return ensure_utc(now, on_naive=lambda naive: naive.replace(tzinfo=UTC))
+
+    async def heartbeat(self, worker_id: str, now: datetime, expires_at: datetime) -> None:
+        """Register a worker or extend its membership.
+
+        Args:
+            worker_id: ID of the worker
+            now: Current timestamp
+            expires_at: Time after which the worker is considered dead
+        """
+        stmt = dialect_insert(BroadcasterWorker).values(
+            worker_id=worker_id, heartbeat_at=now, expires_at=expires_at
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["worker_id"],
+            set_={
+                "heartbeat_at": stmt.excluded.heartbeat_at,
+                "expires_at": stmt.excluded.expires_at,
+            },
+        )
+        await self.session.execute(stmt)
+
+    async def get_live_workers(self, now: datetime) -> list[str]:
+        """Return the IDs of all workers whose membership has not expired."""
+        stmt = select(BroadcasterWorker.worker_id).where(BroadcasterWorker.expires_at > now)
+        return list((await self.session.scalars(stmt)).all())
+
+    async def claim(
+        self, meeting_ids: Sequence[str], worker_id: str, now: datetime, expires_at: datetime
+    ) -> set[str]:
+        """Acquire or renew leases on meetings.
+
+        A lease is granted when the meeting has none, when its lease expired or
+        when the worker already holds it. Concurrent claims are serialized by
+        the primary key, so at most one worker holds a meeting at a time.
+
+        Args:
+            meeting_ids: IDs of the meetings to claim
+            worker_id: ID of the claiming worker
+            now: Current timestamp
+            expires_at: Expiry of the granted leases
+
+        Returns:
+            IDs of the meetings the worker holds a lease on
+        """
+        if not meeting_ids:
+            return set()
+        stmt = dialect_insert(BroadcastLease).values(
+            [
+                {"meeting_id": meeting_id, "worker_id": worker_id, "expires_at": expires_at}
+                for meeting_id in meeting_ids
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["meeting_id"],
+            set_={"worker_id": stmt.excluded.worker_id, "expires_at": stmt.excluded.expires_at},
+            where=or_(BroadcastLease.expires_at <= now, BroadcastLease.worker_id == worker_id),
+        ).returning(BroadcastLease.meeting_id)
+        return set((await self.session.scalars(stmt)).all())
+
+    async def release(self, meeting_ids: Sequence[str], worker_id: str) -> None:
+        """Give up the worker's leases on meetings so another worker can claim them."""
+        if not meeting_ids:
+            return
+        await self.session.execute(
+            delete(BroadcastLease)
+            .where(BroadcastLease.worker_id == worker_id)
+            .where(BroadcastLease.meeting_id.in_(meeting_ids))
+        )
+
+    async def remove_worker(self, worker_id: str) -> None:
+        """Deregister a worker and release all of its leases."""
+        await self.session.execute(
+            delete(BroadcastLease).where(BroadcastLease.worker_id == worker_id)
+        )
+        await self.session.execute(
+            delete(BroadcasterWorker).where(BroadcasterWorker.worker_id == worker_id)
+        )
+
+    async def purge_expired(self, before: datetime) -> None:
+        """Delete workers and leases that expired before the given time."""
+        await self.session.execute(delete(BroadcastLease).where(BroadcastLease.expires_at < before))
+        await self.session.execute(
+            delete(BroadcasterWorker).where(BroadcasterWorker.expires_at < before)
+        )
@@ -0,0 +1,51 @@
+"""Async engagement repository for use on the event loop."""
+
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repos.engagement_repo import latest_status_stmt, sample_upsert_stmt
+
+
+class AsyncEngagementRepo:
+    """Async counterpart of EngagementRepo backed by an AsyncSession."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_latest_statuses(
+        self, meeting_ids: Sequence[str], end: datetime | None = None
+    ) -> dict[str, dict[str, str]]:
+        """Return the status of every participant's latest sample across meetings.
+
+        Runs one query for all meetings, returning a single row per participant
+        (see ``latest_status_stmt``).
+
+        Args:
+            meeting_ids: IDs of the meetings
+            end: Ignore samples after this bucket
+
+        Returns:
+            Map of meeting_id -> {participant_id: status}
+        """
+        if not meeting_ids:
+            return {}
+        stmt = latest_status_stmt(self.session.get_bind().dialect.name, meeting_ids, end)
+
+        latest: dict[str, dict[str, str]] = {}
+        for meeting_id, participant_id, status in await self.session.execute(stmt):
+            latest.setdefault(meeting_id, {})[participant_id] = status
+        return latest
+
+    async def bulk_upsert_samples(self, rows: Sequence[Mapping[str, Any]]) -> None:
+        """Upsert many samples with a single multi-row INSERT ... ON CONFLICT.
+
+        Args:
+            rows: Mappings with meeting_id, participant_id, bucket and status keys;
+                the last row per (participant_id, bucket) wins
+        """
+        if not rows:
+            return
+        await self.session.execute(sample_upsert_stmt(rows))
@@ -0,0 +1,60 @@
+"""Async meeting repository for use on the event loop."""
+
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models import Meeting
+from app.utils.datetime import ensure_utc
+
+
+class AsyncMeetingRepo:
+    """Async counterpart of the MeetingRepo read operations."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_with_participants(self, meeting_id: str) -> Meeting | None:
+        """Get a meeting with its location and participants loaded.
+
+        Unlike ``MeetingRepo.get_with_participants``, participants' samples
+        are not loaded: connections only need the participant rows.
+
+        Args:
+            meeting_id: ID of the meeting
+
+        Returns:
+            The meeting, or None if it does not exist
+        """
+        stmt = (
+            select(Meeting)
+            .options(
+                selectinload(Meeting.city),
+                selectinload(Meeting.meeting_room),
+                selectinload(Meeting.ms_teams_meeting),
+                selectinload(Meeting.participants),
+            )
+            .where(Meeting.id == meeting_id)
+        )
+        return (await self.session.scalars(stmt)).first()
+
+    async def get_active_meetings(self, current_time: datetime) -> Sequence[Meeting]:
+        """Get meetings that are currently active (started but not ended).
+
+        Args:
+            current_time: Current timestamp to check against
+
+        Returns:
+            List of active meetings with participants loaded
+        """
+        current_time = ensure_utc(current_time)
+        stmt = (
+            select(Meeting)
+            .options(selectinload(Meeting.participants))
+            .where(Meeting.start_ts <= current_time)
+            .where(Meeting.end_ts > current_time)
+        )
+        return (await self.session.scalars(stmt)).all()
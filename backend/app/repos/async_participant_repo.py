@@ -0,0 +1,48 @@
+"""Async participant repository for use on the event loop."""
+
+from collections.abc import Mapping
+from datetime import datetime
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Participant
+from app.repos.participant_repo import last_seen_update_stmt
+
+
+class AsyncParticipantRepo:
+    """Async counterpart of ParticipantRepo backed by an AsyncSession."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_for_meeting(self, meeting_id: str) -> list[Participant]:
+        """Get all participants for a meeting (fresh query)."""
+        stmt = select(Participant).where(Participant.meeting_id == meeting_id)
+        return list((await self.session.scalars(stmt)).all())
+
+    async def bulk_update_last_status(self, statuses: Mapping[str, str]) -> None:
+        """Set last_status for many participants in one executemany UPDATE.
+
+        Args:
+            statuses: Mapping of participant ID to its latest status
+        """
+        if not statuses:
+            return
+        await self.session.execute(
+            update(Participant),
+            [{"id": pid, "last_status": status} for pid, status in statuses.items()],
+        )
+
+    async def bulk_update_last_seen(self, last_seen: Mapping[str, datetime]) -> None:
+        """Move last_seen_at forward for many participants in one executemany UPDATE.
+
+        Args:
+            last_seen: Mapping of participant ID to when it was last seen
+        """
+        if not last_seen:
+            return
+        await self.session.execute(
+            last_seen_update_stmt(),
+            [{"participant_id": pid, "seen_at": seen} for pid, seen in last_seen.items()],
+        )
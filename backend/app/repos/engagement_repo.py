@@ -1,13 +1,75 @@
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping, Sequence
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import CursorResult, Select, delete, func, select
+from sqlalchemy.orm import Session, aliased
 
-from app.models import EngagementSample
+from app.db_utils import dialect_insert
+from app.models import EngagementSample, MeetingSummary
 from app.schema.websocket.requests import StatusUpdateRequest
 
 
+def sample_upsert_stmt(rows: Sequence[Mapping[str, Any]]):
+    """Build an INSERT ... ON CONFLICT (participant_id, bucket) DO UPDATE for samples.
+
+    PostgreSQL rejects a statement that updates the same row twice, so rows
+    sharing a (participant_id, bucket) are collapsed first; the last one wins.
+
+    Args:
+        rows: Mappings with meeting_id, participant_id, bucket and status keys
+
+    Returns:
+        Dialect-specific upsert statement
+    """
+    unique_rows = {(row["participant_id"], row["bucket"]): row for row in rows}
+    stmt = dialect_insert(EngagementSample).values(list(unique_rows.values()))
+    return stmt.on_conflict_do_update(
+        index_elements=[EngagementSample.participant_id, EngagementSample.bucket],
+        set_={"status": stmt.excluded.status},
+    )
+
+
+def latest_status_stmt(
+    dialect: str, meeting_ids: Sequence[str], end: datetime | None = None
+) -> Select[tuple[str, str, str]]:
+    """Build a query for the status of every participant's latest sample.
+
+    Returns one (meeting_id, participant_id, status) row per participant, so
+    the result grows with the participants rather than with their history.
+    PostgreSQL uses ``DISTINCT ON (participant_id)``; other databases keep the
+    rows whose bucket equals the participant's correlated ``MAX(bucket)``.
+    Both forms are served by the (participant_id, bucket) unique index.
+
+    Args:
+        dialect: Name of the database dialect
+        meeting_ids: IDs of the meetings
+        end: Ignore samples after this bucket
+
+    Returns:
+        Dialect-specific select statement
+    """
+    stmt = select(
+        EngagementSample.meeting_id, EngagementSample.participant_id, EngagementSample.status
+    ).where(EngagementSample.meeting_id.in_(meeting_ids))
+    if end:
+        stmt = stmt.where(EngagementSample.bucket <= end)
+
+    if dialect == "postgresql":
+        return stmt.distinct(EngagementSample.participant_id).order_by(
+            EngagementSample.participant_id, EngagementSample.bucket.desc()
+        )
+
+    # The unique (participant_id, bucket) constraint makes the match unambiguous
+    newer = aliased(EngagementSample)
+    latest_bucket = select(func.max(newer.bucket)).where(
+        newer.participant_id == EngagementSample.participant_id
+    )
+    if end:
+        latest_bucket = latest_bucket.where(newer.bucket <= end)
+    return stmt.where(EngagementSample.bucket == latest_bucket.scalar_subquery())
+
+
 class EngagementRepo:
     def __init__(self, session: Session) -> None:
         self.session = session
@@ -19,30 +81,42 @@ class EngagementRepo:
         bucket: datetime,
         request: StatusUpdateRequest,
     ) -> EngagementSample:
-        """Upsert an engagement sample for a participant at a given time bucket."""
-        stmt = select(EngagementSample).where(
-            EngagementSample.participant_id == participant_id,
-            EngagementSample.bucket == bucket,
-        )
-        existing = self.session.scalars(stmt).first()
-        if existing:
-            existing.status = request.status
-            self.session.add(existing)
-            self.session.flush()
-            self.session.refresh(existing)
-            return existing
-
-        sample = EngagementSample(
-            participant_id=participant_id,
-            meeting_id=meeting_id,
-            bucket=bucket,
-            status=request.status,
-        )
-        self.session.add(sample)
-        self.session.flush()
-        self.session.refresh(sample)
+        """Upsert an engagement sample for a participant at a given time bucket.
+
+        Runs as a single INSERT ... ON CONFLICT ... RETURNING statement, so
+        concurrent updates of the same bucket cannot hit the unique constraint.
+        """
+        stmt = sample_upsert_stmt(
+            [
+                {
+                    "meeting_id": meeting_id,
+                    "participant_id": participant_id,
+                    "bucket": bucket,
+                    "status": request.status,
+                }
+            ]
+        ).returning(EngagementSample)
+        # populate_existing refreshes a sample already loaded in this session
+        sample: EngagementSample = self.session.scalars(
+            stmt, execution_options={"populate_existing": True}
+        ).one()
         return sample
 
+    def bulk_upsert_samples(self, rows: Sequence[Mapping[str, Any]]) -> list[EngagementSample]:
+        """Upsert many samples with a single multi-row statement.
+
+        Args:
+            rows: Mappings with meeting_id, participant_id, bucket and status keys;
+                the last row per (participant_id, bucket) wins
+
+        Returns:
+            The inserted or updated samples
+        """
+        if not rows:
+            return []
+        stmt = sample_upsert_stmt(rows).returning(EngagementSample)
+        return list(self.session.scalars(stmt, execution_options={"populate_existing": True}).all())
+
     def get_samples_for_meeting(
         self, meeting_id: str, start: datetime | None = None, end: datetime | None = None
     ) -> Iterable[EngagementSample]:
@@ -53,3 +127,41 @@ class EngagementRepo:
             stmt = stmt.where(EngagementSample.bucket <= end)
         stmt = stmt.order_by(EngagementSample.bucket.asc())
         return self.session.scalars(stmt).all()
+
+    def get_latest_statuses(
+        self, meeting_ids: Sequence[str], end: datetime | None = None
+    ) -> dict[str, dict[str, str]]:
+        """Return the status of every participant's latest sample across meetings.
+
+        Args:
+            meeting_ids: IDs of the meetings
+            end: Ignore samples after this bucket
+
+        Returns:
+            Map of meeting_id -> {participant_id: status}
+        """
+        if not meeting_ids:
+            return {}
+        stmt = latest_status_stmt(self.session.get_bind().dialect.name, meeting_ids, end)
+        latest: dict[str, dict[str, str]] = {}
+        for meeting_id, participant_id, status in self.session.execute(stmt):
+            latest.setdefault(meeting_id, {})[participant_id] = status
+        return latest
+
+    def delete_summarized_before(self, cutoff: datetime) -> int:
+        """Delete samples older than a cutoff whose meeting has a summary.
+
+        Args:
+            cutoff: Samples with an earlier bucket are deleted
+
+        Returns:
+            Number of deleted samples
+        """
+        stmt = delete(EngagementSample).where(
+            EngagementSample.bucket < cutoff,
+            EngagementSample.meeting_id.in_(select(MeetingSummary.meeting_id)),
+        )
+        result: CursorResult = self.session.execute(  # type: ignore[assignment]
+            stmt, execution_options={"synchronize_session": False}
+        )
+        return result.rowcount
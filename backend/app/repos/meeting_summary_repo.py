@@ -6,6 +6,7 @@ from sqlalchemy import select
 from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.orm import Session
 
+from app.db_utils import dialect_insert
 from app.models.meeting_summary import MeetingSummary
 
 
@@ -72,6 +73,41 @@ class MeetingSummaryRepo:
         # Return the created/updated record
         return self.get(meeting_id)  # type: ignore[return-value]
 
+    def create_if_absent(
+        self,
+        meeting_id: str,
+        max_participants: int,
+        normalized_engagement: float,
+        engagement_level: str,
+    ) -> MeetingSummary | None:
+        """Insert a meeting summary unless one already exists.
+
+        The primary key acts as a guard: of several concurrent writers (across
+        processes) exactly one gets the row back, all others get None.
+
+        Args:
+            meeting_id: The meeting ID
+            max_participants: Maximum number of participants
+            normalized_engagement: Normalized engagement score
+            engagement_level: Engagement level classification
+
+        Returns:
+            The inserted MeetingSummary, or None if a summary already existed
+        """
+        stmt = (
+            dialect_insert(MeetingSummary)
+            .values(
+                meeting_id=meeting_id,
+                max_participants=max_participants,
+                normalized_engagement=normalized_engagement,
+                engagement_level=engagement_level,
+                computed_at=datetime.now(tz=UTC),
+            )
+            .on_conflict_do_nothing(index_elements=["meeting_id"])
+            .returning(MeetingSummary)
+        )
+        return self.session.scalars(stmt).first()
+
     def exists(self, meeting_id: str) -> bool:
         """Check if summary exists for meeting.
 
@@ -1,14 +1,35 @@
 """Participant repository for database operations."""
 
+from collections.abc import Mapping
+from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import func, select
+from sqlalchemy import Update, bindparam, func, or_, select, update
 from sqlalchemy.orm import Session, selectinload
 
 from app.models import Participant
 from app.schema.websocket.requests import JoinRequest
 
 
+def last_seen_update_stmt() -> Update:
+    """Build an executemany UPDATE moving participants' last_seen_at forward.
+
+    Takes ``participant_id`` and ``seen_at`` parameters per row. A participant
+    already seen later (e.g. when leaving after a buffered update) keeps its
+    timestamp.
+
+    Returns:
+        Update statement on the participants table
+    """
+    table = Participant.metadata.tables[Participant.__tablename__]
+    return (
+        update(table)
+        .where(table.c.id == bindparam("participant_id"))
+        .where(or_(table.c.last_seen_at.is_(None), table.c.last_seen_at < bindparam("seen_at")))
+        .values(last_seen_at=bindparam("seen_at"))
+    )
+
+
 class ParticipantRepo:
     """Repository for participant CRUD operations."""
 
@@ -60,6 +81,32 @@ class ParticipantRepo:
         self.session.refresh(participant)
         return participant
 
+    def bulk_update_last_status(self, statuses: Mapping[str, str]) -> None:
+        """Set last_status for many participants in one executemany UPDATE.
+
+        Args:
+            statuses: Mapping of participant ID to its latest status
+        """
+        if not statuses:
+            return
+        self.session.execute(
+            update(Participant),
+            [{"id": pid, "last_status": status} for pid, status in statuses.items()],
+        )
+
+    def bulk_update_last_seen(self, last_seen: Mapping[str, datetime]) -> None:
+        """Move last_seen_at forward for many participants in one executemany UPDATE.
+
+        Args:
+            last_seen: Mapping of participant ID to when it was last seen
+        """
+        if not last_seen:
+            return
+        self.session.execute(
+            last_seen_update_stmt(),
+            [{"participant_id": pid, "seen_at": seen} for pid, seen in last_seen.items()],
+        )
+
     def get_max_participant_count(self, meeting_id: str) -> int:
         """Get the maximum number of participants who joined the meeting.
 
@@ -34,3 +34,32 @@ class DeltaMessage(BaseModel):
 
     type: Literal["delta"] = "delta"
     data: RollupData
+
+
+class SparseRollupData(BaseModel):
+    """Rollup carrying only participants whose value changed (protocol v2).
+
+    ``seq`` increases by one per message within a ``stream`` (one stream per
+    publishing process). ``full`` marks a complete baseline sent on join or
+    in reply to a resync request; a client that sees a gap in ``seq`` asks
+    for one.
+    """
+
+    meeting_id: str
+    bucket: datetime
+    overall: float
+    participants: dict[str, float]  # changed participant_id -> engagement percentage
+    seq: int
+    stream: str
+    full: bool = False
+
+    @field_serializer("bucket")
+    def serialize_bucket(self, bucket: datetime) -> str:
+        return isoformat_utc(bucket)
+
+
+class SparseDeltaMessage(BaseModel):
+    """WebSocket message for sparse engagement updates (protocol v2)."""
+
+    type: Literal["sparse_delta"] = "sparse_delta"
+    data: SparseRollupData
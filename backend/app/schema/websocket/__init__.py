@@ -5,6 +5,7 @@ from app.schema.websocket.broadcasts import SnapshotMessage
 from app.schema.websocket.requests import (
     JoinRequest,
     PingRequest,
+    ResyncRequest,
     StatusUpdateRequest,
     WSRequest,
 )
@@ -26,6 +27,7 @@ __all__ = [
     "JoinRequest",
     "StatusUpdateRequest",
     "PingRequest",
+    "ResyncRequest",
     "WSRequest",
     # Responses
     "JoinedResponse",
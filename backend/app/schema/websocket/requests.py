@@ -16,6 +16,9 @@ class JoinRequest(WSRequestBase):
 
     type: Literal["join"] = "join"
     fingerprint: str = Field(..., description="Device fingerprint for participant identification")
+    protocol: Literal[1, 2] = Field(
+        default=1, description="Delta protocol: 1 = full deltas, 2 = sparse deltas with seq"
+    )
 
     @field_validator("fingerprint")
     @classmethod
@@ -41,10 +44,10 @@ class StatusUpdateRequest(WSRequestBase):
     status: StatusLiteral = Field(..., description="Participant engagement status")
 
     def validate_participant(self, context: "WSContext") -> BaseModel | None:
-        """Check that participant has joined."""
+        """Check that participant has joined (without requiring it to be loaded)."""
         from app.schema.websocket.responses import ErrorResponse
 
-        if not context.participant:
+        if context.participant_id is None:
             return ErrorResponse(message="Not joined")
         return None
 
@@ -62,8 +65,22 @@ class PingRequest(WSRequestBase):
         return None
 
 
+class ResyncRequest(WSRequestBase):
+    """Request for a full engagement baseline after a sparse delta gap."""
+
+    type: Literal["resync"] = "resync"
+
+    def validate_participant(self, context: "WSContext") -> BaseModel | None:
+        """Check that participant has joined."""
+        from app.schema.websocket.responses import ErrorResponse
+
+        if not context.participant:
+            return ErrorResponse(message="Not joined")
+        return None
+
+
 # Discriminated union for automatic request routing
 WSRequest = Annotated[
-    JoinRequest | StatusUpdateRequest | PingRequest,
+    JoinRequest | StatusUpdateRequest | PingRequest | ResyncRequest,
     Field(discriminator="type"),
 ]
@@ -4,6 +4,7 @@ from typing import Literal
 
 from pydantic import BaseModel
 
+from app.schema.engagement.messages import SparseRollupData
 from app.schema.engagement.models import EngagementSummary
 from app.schema.meeting.models import MeetingRead
 
@@ -13,12 +14,14 @@ class JoinedResponse(BaseModel):
 
     Includes a complete engagement snapshot for the joining client,
     eliminating the need to broadcast snapshots to all participants.
+    Clients joining with protocol 2 also get the sparse delta baseline.
     """
 
     type: Literal["joined"] = "joined"
     participant_id: str
     meeting_id: str
     snapshot: EngagementSummary
+    sync: SparseRollupData | None = None
 
 
 class PongResponse(BaseModel):
@@ -6,6 +6,11 @@ from typing import Protocol
 class SmoothingStrategy(Protocol):
     """Protocol for smoothing algorithms."""
 
+    @property
+    def cache_key(self) -> str:
+        """Identify the algorithm and its parameters, e.g. for caching its results."""
+        ...
+
     def smooth(self, flags: list[int], window: int) -> list[float]:
         """Apply smoothing algorithm to binary engagement flags.
 
@@ -5,6 +5,9 @@ from enum import Enum
 from app.services.engagement.smoothing.base import SmoothingStrategy
 from app.services.engagement.smoothing.kalman import KalmanSmoothingStrategy
 from app.services.engagement.smoothing.no_smoothing import NoSmoothingStrategy
+from app.services.engagement.smoothing.steady_state_kalman import (
+    SteadyStateKalmanSmoothingStrategy,
+)
 
 
 class SmoothingAlgorithm(str, Enum):
@@ -12,6 +15,7 @@ class SmoothingAlgorithm(str, Enum):
 
     NONE = "none"
     KALMAN = "kalman"
+    STEADY_STATE_KALMAN = "steady_state_kalman"
 
 
 class SmoothingFactory:
@@ -34,4 +38,6 @@ class SmoothingFactory:
             return NoSmoothingStrategy()
         if algorithm == SmoothingAlgorithm.KALMAN:
             return KalmanSmoothingStrategy()
+        if algorithm == SmoothingAlgorithm.STEADY_STATE_KALMAN:
+            return SteadyStateKalmanSmoothingStrategy()
         raise ValueError(f"Unknown smoothing algorithm: {algorithm}")
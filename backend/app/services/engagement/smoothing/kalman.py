@@ -1,5 +1,10 @@
 """Kalman filter smoothing strategy for engagement data."""
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class KalmanSmoothingStrategy:
     """Applies Kalman filter for optimal smoothing with quick response.
@@ -20,6 +25,11 @@ class KalmanSmoothingStrategy:
         self.process_variance = process_variance
         self.measurement_variance = measurement_variance
 
+    @property
+    def cache_key(self) -> str:
+        """Identify the algorithm and its variances."""
+        return f"kalman(q={self.process_variance!r}, r={self.measurement_variance!r})"
+
     def smooth(self, flags: list[int], window: int) -> list[float]:
         """Apply 1D Kalman filter to engagement flags.
 
@@ -53,3 +63,31 @@ class KalmanSmoothingStrategy:
             estimates.append(estimate)
 
         return estimates
+
+    def smooth_many(self, flags: "np.ndarray") -> "np.ndarray":
+        """Apply the Kalman filter to every row of a flag matrix at once.
+
+        The gain does not depend on the data, so each step updates all rows
+        with the same scalar gain; results are identical to ``smooth`` per row.
+
+        Args:
+            flags: Array of binary engagement values, shape (rows, buckets)
+
+        Returns:
+            float64 array of smoothed engagement percentages, same shape
+        """
+        measurements = flags * 100.0
+        estimates = measurements.copy()
+        if measurements.shape[1] == 0:
+            return estimates
+
+        estimate = measurements[:, 0]
+        error_estimate = 1.0
+        for idx in range(measurements.shape[1]):
+            error_estimate += self.process_variance
+            kalman_gain = error_estimate / (error_estimate + self.measurement_variance)
+            estimate = estimate + kalman_gain * (measurements[:, idx] - estimate)
+            error_estimate = (1 - kalman_gain) * error_estimate
+            estimates[:, idx] = estimate
+
+        return estimates
@@ -1,9 +1,19 @@
 """No smoothing strategy - returns instant binary values."""
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class NoSmoothingStrategy:
     """Returns instant binary values (0% or 100%)."""
 
+    @property
+    def cache_key(self) -> str:
+        """Identify the algorithm (it has no parameters)."""
+        return "none"
+
     def smooth(self, flags: list[int], window: int) -> list[float]:
         """Convert binary flags to percentages without smoothing.
 
@@ -18,3 +28,14 @@ class NoSmoothingStrategy:
             List of engagement percentages (0 or 100)
         """
         return [flag * 100.0 for flag in flags]
+
+    def smooth_many(self, flags: "np.ndarray") -> "np.ndarray":
+        """Convert a matrix of binary flags to percentages.
+
+        Args:
+            flags: Array of binary engagement values, shape (rows, buckets)
+
+        Returns:
+            float64 array of engagement percentages (0 or 100), same shape
+        """
+        return flags * 100.0
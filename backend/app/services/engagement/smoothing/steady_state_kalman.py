@@ -0,0 +1,173 @@
+"""Steady-state Kalman smoothing with a cached gain schedule."""
+
+import math
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class KalmanGainSchedule:
+    """Kalman gain sequence for one (process, measurement) variance pair.
+
+    The gain of the scalar filter depends only on the variances and the step
+    index, never on the measurements. It converges to the closed-form steady
+    state gain; only the transient prefix before convergence is stored and it
+    is extended lazily up to the longest series requested so far.
+    """
+
+    def __init__(
+        self, process_variance: float, measurement_variance: float, tolerance: float
+    ) -> None:
+        """Initialize the schedule.
+
+        Args:
+            process_variance: Expected variance in the process
+            measurement_variance: Expected variance in measurements
+            tolerance: Relative distance to the steady-state gain at which the
+                schedule is considered converged
+        """
+        self.process_variance = process_variance
+        self.measurement_variance = measurement_variance
+        self.tolerance = tolerance
+        # Stationary solution of the Riccati recursion for the predicted error
+        q, r = process_variance, measurement_variance
+        predicted_error = (q + math.sqrt(q * q + 4 * q * r)) / 2
+        self.steady_gain = predicted_error / (predicted_error + r)
+        self.converged = False
+        self._transient: list[float] = []
+        self._error_estimate = 1.0
+        self._lock = threading.Lock()
+
+    def transient(self, length: int) -> list[float]:
+        """Return the gains preceding convergence, computed up to ``length``.
+
+        Steps beyond the returned list use ``steady_gain``.
+
+        Args:
+            length: Number of steps the caller needs gains for
+
+        Returns:
+            Transient gain prefix (shorter than ``length`` once converged)
+        """
+        if self.converged or len(self._transient) >= length:
+            return self._transient
+        with self._lock:
+            while not self.converged and len(self._transient) < length:
+                self._error_estimate += self.process_variance
+                gain = self._error_estimate / (self._error_estimate + self.measurement_variance)
+                self._error_estimate = (1 - gain) * self._error_estimate
+                if abs(gain - self.steady_gain) <= self.tolerance * self.steady_gain:
+                    self.converged = True
+                else:
+                    self._transient.append(gain)
+        return self._transient
+
+
+_schedules: dict[tuple[float, float, float], KalmanGainSchedule] = {}
+_schedules_lock = threading.Lock()
+
+
+def gain_schedule(
+    process_variance: float, measurement_variance: float, tolerance: float
+) -> KalmanGainSchedule:
+    """Return the shared gain schedule for a parameter set.
+
+    Args:
+        process_variance: Expected variance in the process
+        measurement_variance: Expected variance in measurements
+        tolerance: Relative convergence tolerance
+
+    Returns:
+        Gain schedule shared by all strategies with the same parameters
+    """
+    key = (process_variance, measurement_variance, tolerance)
+    with _schedules_lock:
+        schedule = _schedules.get(key)
+        if schedule is None:
+            schedule = _schedules[key] = KalmanGainSchedule(*key)
+        return schedule
+
+
+class SteadyStateKalmanSmoothingStrategy:
+    """Kalman smoothing expressed as a first-order IIR filter.
+
+    Each step computes ``estimate += gain[t] * (measurement - estimate)`` with
+    gains taken from a cached schedule, switching to the steady-state gain
+    after convergence. Results match ``KalmanSmoothingStrategy`` during the
+    transient and stay within the convergence tolerance afterwards.
+    """
+
+    def __init__(
+        self,
+        process_variance: float = 1e-5,
+        measurement_variance: float = 1e-2,
+        tolerance: float = 1e-9,
+    ) -> None:
+        """Initialize the strategy.
+
+        Args:
+            process_variance: Expected variance in the process (how much the
+                true state changes between measurements). Lower values = smoother.
+            measurement_variance: Expected variance in measurements (noise).
+                Lower values = more trust in measurements.
+            tolerance: Relative distance to the steady-state gain at which the
+                cached schedule stops growing
+        """
+        self.schedule = gain_schedule(process_variance, measurement_variance, tolerance)
+
+    @property
+    def cache_key(self) -> str:
+        """Identify the algorithm, its variances and its convergence tolerance."""
+        schedule = self.schedule
+        return (
+            f"kalman_steady(q={schedule.process_variance!r}, "
+            f"r={schedule.measurement_variance!r}, tol={schedule.tolerance!r})"
+        )
+
+    def smooth(self, flags: list[int], window: int) -> list[float]:
+        """Apply the filter to engagement flags.
+
+        Args:
+            flags: List of binary engagement values (0 or 1)
+            window: Window size in minutes (unused by Kalman filter)
+
+        Returns:
+            List of smoothed engagement percentages (0-100)
+        """
+        if not flags:
+            return []
+
+        transient = self.schedule.transient(len(flags))
+        steady_gain = self.schedule.steady_gain
+        estimates = []
+        estimate = flags[0] * 100.0
+        for idx, flag in enumerate(flags):
+            gain = transient[idx] if idx < len(transient) else steady_gain
+            estimate = estimate + gain * (flag * 100.0 - estimate)
+            estimates.append(estimate)
+        return estimates
+
+    def smooth_many(self, flags: "np.ndarray") -> "np.ndarray":
+        """Apply the filter to every row of a flag matrix at once.
+
+        Args:
+            flags: Array of binary engagement values, shape (rows, buckets)
+
+        Returns:
+            float64 array of smoothed engagement percentages, same shape
+        """
+        measurements = flags * 100.0
+        estimates = measurements.copy()
+        if measurements.shape[1] == 0:
+            return estimates
+
+        transient = self.schedule.transient(measurements.shape[1])
+        steady_gain = self.schedule.steady_gain
+        estimate = measurements[:, 0]
+        for idx in range(measurements.shape[1]):
+            gain = transient[idx] if idx < len(transient) else steady_gain
+            estimate = estimate + gain * (measurements[:, idx] - estimate)
+            estimates[:, idx] = estimate
+        return estimates
@@ -0,0 +1,9 @@
+"""Live engagement state package for in-memory rollups."""
+
+from app.services.engagement.state.live_state import (
+    LiveStateRegistry,
+    MeetingEngagementState,
+    live_state_registry,
+)
+
+__all__ = ["LiveStateRegistry", "MeetingEngagementState", "live_state_registry"]
@@ -0,0 +1,220 @@
+"""Live per-meeting engagement state kept in memory.
+
+Rollups only need the latest status of every participant, so instead of
+re-reading the full sample history on every update we keep that state in
+memory and update it incrementally. The state is rebuilt from the database
+whenever it is missing (first access, eviction or process restart).
+"""
+
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from datetime import datetime
+from typing import Protocol
+
+from app.config import settings
+from app.models import Participant
+from app.schema.engagement.models import BucketRollup
+
+ENGAGED_STATUSES = frozenset({"speaking", "engaged"})
+DEFAULT_STATUS = "disengaged"
+
+
+class MeetingEngagementState:
+    """Latest status per participant plus a running engaged count."""
+
+    def __init__(self, meeting_id: str) -> None:
+        """Initialize an empty state for a meeting.
+
+        Args:
+            meeting_id: ID of the meeting this state belongs to
+        """
+        self.meeting_id = meeting_id
+        self.loaded_at = time.monotonic()
+        self.statuses: dict[str, str] = {}
+        self.engaged_count = 0
+        self.version = 0
+
+    def set_status(self, participant_id: str, status: str) -> None:
+        """Set a participant's latest status, keeping the engaged count in sync.
+
+        Args:
+            participant_id: ID of the participant
+            status: New engagement status
+        """
+        previous = self.statuses.get(participant_id)
+        if previous == status:
+            return
+        if previous in ENGAGED_STATUSES:
+            self.engaged_count -= 1
+        if status in ENGAGED_STATUSES:
+            self.engaged_count += 1
+        self.statuses[participant_id] = status
+        self.version += 1
+
+    def add_participant(self, participant_id: str, status: str | None = None) -> None:
+        """Track a participant if not already known.
+
+        Args:
+            participant_id: ID of the participant
+            status: Initial status (defaults to disengaged)
+        """
+        if participant_id not in self.statuses:
+            self.set_status(participant_id, status or DEFAULT_STATUS)
+
+    def copy(self) -> "MeetingEngagementState":
+        """Return an independent copy of the state."""
+        clone = MeetingEngagementState(self.meeting_id)
+        clone.loaded_at = self.loaded_at
+        clone.statuses = dict(self.statuses)
+        clone.engaged_count = self.engaged_count
+        clone.version = self.version
+        return clone
+
+    def rollup(self, bucket: datetime) -> BucketRollup:
+        """Build the rollup for a bucket from the current state.
+
+        Args:
+            bucket: Bucket timestamp (already normalized)
+
+        Returns:
+            BucketRollup with per-participant values and overall average
+        """
+        participants = {
+            pid: 100.0 if status in ENGAGED_STATUSES else 0.0
+            for pid, status in self.statuses.items()
+        }
+        overall = self.engaged_count * 100.0 / len(participants) if participants else 0.0
+        return BucketRollup(bucket=bucket, participants=participants, overall=overall)
+
+
+class PendingStatusSource(Protocol):
+    """Status updates accepted but not yet written to the database."""
+
+    def pending_samples(self, meeting_id: str) -> list[tuple[str, datetime, str]]:
+        """Return (participant_id, bucket, status) tuples of a meeting, ordered by bucket."""
+        ...
+
+
+class LiveStateRegistry:
+    """Process-wide registry of live meeting engagement states.
+
+    When broadcasts are shared between workers, other processes record status
+    updates this registry never sees; ``max_age_seconds`` bounds how stale a
+    cached state may get before it is rebuilt from the database.
+
+    With write-behind enabled, recent updates may still be buffered when a
+    state is rebuilt; ``pending_source`` supplies them so they are applied on
+    top of the persisted statuses.
+    """
+
+    def __init__(self, max_age_seconds: float | None = None) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            max_age_seconds: Rebuild states older than this; None never expires them
+        """
+        self.max_age_seconds = max_age_seconds
+        self.pending_source: PendingStatusSource | None = None
+        self._states: dict[str, MeetingEngagementState] = {}
+        self._lock = threading.Lock()
+
+    def get(self, meeting_id: str) -> MeetingEngagementState | None:
+        """Return the cached state for a meeting, or None on cache miss or expiry."""
+        state = self._states.get(meeting_id)
+        if (
+            state is not None
+            and self.max_age_seconds is not None
+            and time.monotonic() - state.loaded_at > self.max_age_seconds
+        ):
+            return None
+        return state
+
+    def load_statuses(
+        self,
+        meeting_id: str,
+        participants: Iterable[Participant],
+        latest_statuses: Mapping[str, str],
+    ) -> MeetingEngagementState:
+        """Rebuild and cache the state for a meeting from latest statuses.
+
+        Participants are seeded with their persisted ``last_status`` and then
+        overlaid with the status of their latest sample, if any, and finally
+        with their buffered, not yet persisted updates.
+
+        Args:
+            meeting_id: ID of the meeting
+            participants: All participants of the meeting
+            latest_statuses: Map of participant_id -> status of the latest sample
+
+        Returns:
+            The freshly built state
+        """
+        if self.pending_source is not None:
+            latest_statuses = dict(latest_statuses)
+            for participant_id, _bucket, pending in self.pending_source.pending_samples(meeting_id):
+                latest_statuses[participant_id] = pending
+
+        state = MeetingEngagementState(meeting_id)
+        for participant in participants:
+            status = latest_statuses.get(participant.id) or participant.last_status
+            state.set_status(participant.id, status or DEFAULT_STATUS)
+
+        with self._lock:
+            self._states[meeting_id] = state
+        return state
+
+    def rollup(self, meeting_id: str, bucket: datetime) -> BucketRollup | None:
+        """Build a meeting's rollup; safe to call from worker threads.
+
+        The state is copied under the lock that guards its updates, so the
+        rollup is consistent while the event loop keeps applying changes.
+
+        Args:
+            meeting_id: ID of the meeting
+            bucket: Bucket timestamp (already normalized)
+
+        Returns:
+            The rollup, or None if no state is cached for the meeting
+        """
+        state = self.get(meeting_id)
+        if state is None:
+            return None
+        with self._lock:
+            state = state.copy()
+        return state.rollup(bucket)
+
+    def record_status(self, meeting_id: str, participant_id: str, status: str) -> None:
+        """Apply a status change to a cached state.
+
+        No-op on cache miss: the next read rebuilds the state from the
+        database plus the buffered updates of ``pending_source``, which
+        together include the change.
+        """
+        state = self._states.get(meeting_id)
+        if state is not None:
+            with self._lock:
+                state.set_status(participant_id, status)
+
+    def add_participant(self, meeting_id: str, participant_id: str, status: str | None) -> None:
+        """Track a newly joined participant in a cached state."""
+        state = self._states.get(meeting_id)
+        if state is not None:
+            with self._lock:
+                state.add_participant(participant_id, status)
+
+    def discard(self, meeting_id: str) -> None:
+        """Drop the cached state for a meeting."""
+        with self._lock:
+            self._states.pop(meeting_id, None)
+
+    def retain(self, meeting_ids: Iterable[str]) -> None:
+        """Drop cached states for all meetings not in ``meeting_ids``."""
+        keep = set(meeting_ids)
+        with self._lock:
+            for meeting_id in [mid for mid in self._states if mid not in keep]:
+                del self._states[meeting_id]
+
+
+# Shared registry used by the application wiring
+live_state_registry = LiveStateRegistry(max_age_seconds=settings.live_state_max_age_seconds)
@@ -1,5 +1,13 @@
 """Summary package for engagement snapshots."""
 
+from app.services.engagement.summary.factory import SnapshotBuilderFactory, SnapshotEngine
 from app.services.engagement.summary.snapshot_builder import SnapshotBuilder
+from app.services.engagement.summary.snapshot_cache import SnapshotCache, snapshot_cache
 
-__all__ = ["SnapshotBuilder"]
+__all__ = [
+    "SnapshotBuilder",
+    "SnapshotBuilderFactory",
+    "SnapshotCache",
+    "SnapshotEngine",
+    "snapshot_cache",
+]
@@ -0,0 +1,136 @@
+"""Array-backed snapshot builder (requires the numpy extra)."""
+
+from datetime import datetime
+
+import numpy as np
+
+from app.schema.engagement.models import EngagementPoint
+from app.services.engagement.summary.snapshot_builder import SnapshotBuilder
+
+# Marker for buckets without a sample, replaced by forward-fill
+_NO_SAMPLE = -1
+
+
+class ArraySnapshotBuilder(SnapshotBuilder):
+    """Snapshot builder that computes series over a participants x buckets matrix.
+
+    Samples are scattered into an int8 status matrix and forward-filled with a
+    running index maximum, smoothing runs over all rows at once (via the
+    strategy's ``smooth_many`` when it has one) and the overall series is the
+    column mean. Output is identical to ``SnapshotBuilder``.
+    """
+
+    def _build_status_matrix(
+        self,
+        buckets: list[datetime],
+        participant_ids: list[str],
+        sample_map: dict[str, dict[datetime, str]],
+        initial_status: dict[str, str],
+    ) -> np.ndarray:
+        """Build the forward-filled binary engagement matrix.
+
+        Args:
+            buckets: List of bucket timestamps
+            participant_ids: IDs of participants (one row each, in order)
+            sample_map: Map of participant_id -> bucket -> status
+            initial_status: Status assumed before a participant's first sample
+
+        Returns:
+            int8 array of shape (participants, buckets) with 0/1 flags
+        """
+        # Column 0 holds the initial status so forward-fill always finds a value
+        column_of = {bucket: column for column, bucket in enumerate(buckets, start=1)}
+
+        status = np.full((len(participant_ids), len(buckets) + 1), _NO_SAMPLE, dtype=np.int8)
+        for row, pid in enumerate(participant_ids):
+            status[row, 0] = self._engaged_value(initial_status.get(pid, "disengaged"))
+            for bucket, sample_status in sample_map.get(pid, {}).items():
+                column = column_of.get(bucket)
+                if column is not None:
+                    status[row, column] = self._engaged_value(sample_status)
+
+        # Forward-fill: index of the last column holding a sample, per cell
+        columns = np.arange(status.shape[1])
+        last_sample = np.where(status != _NO_SAMPLE, columns, 0)
+        np.maximum.accumulate(last_sample, axis=1, out=last_sample)
+        filled = np.take_along_axis(status, last_sample, axis=1)
+        return filled[:, 1:]
+
+    def _smooth_matrix(self, flags: np.ndarray) -> np.ndarray:
+        """Smooth every row of the flag matrix.
+
+        Args:
+            flags: Binary flag matrix of shape (participants, buckets)
+
+        Returns:
+            float64 matrix of smoothed engagement percentages
+        """
+        smooth_many = getattr(self.smoothing_strategy, "smooth_many", None)
+        if smooth_many is not None:
+            return np.asarray(smooth_many(flags), dtype=np.float64)
+
+        smoothing_window = max(flags.shape[1], 1)
+        smoothed = np.empty(flags.shape, dtype=np.float64)
+        for row, row_flags in enumerate(flags.tolist()):
+            smoothed[row] = self.smoothing_strategy.smooth(row_flags, smoothing_window)
+        return smoothed
+
+    def _series_from_samples(
+        self,
+        buckets: list[datetime],
+        participant_ids: list[str],
+        sample_map: dict[str, dict[datetime, str]],
+        initial_status: dict[str, str],
+    ) -> dict[str, list[float]]:
+        """Compute smoothed engagement series from bucketed samples.
+
+        Args:
+            buckets: List of bucket timestamps
+            participant_ids: IDs of participants
+            sample_map: Map of participant_id -> bucket -> status
+            initial_status: Status assumed before a participant's first sample
+
+        Returns:
+            Map of participant_id -> smoothed values
+        """
+        flags = self._build_status_matrix(buckets, participant_ids, sample_map, initial_status)
+        smoothed = self._smooth_matrix(flags)
+        return dict(zip(participant_ids, smoothed.tolist(), strict=True))
+
+    def _compute_series(
+        self,
+        meeting_id: str,
+        buckets: list[datetime],
+        participant_ids: list[str],
+        initial_status: dict[str, str],
+        start: datetime,
+        end: datetime,
+    ) -> tuple[dict[str, list[float]], list[EngagementPoint]]:
+        """Compute smoothed per-participant series and the overall series.
+
+        Args:
+            meeting_id: ID of the meeting
+            buckets: List of bucket timestamps
+            participant_ids: IDs of participants
+            initial_status: Status assumed before a participant's first sample
+            start: Start timestamp for loading samples
+            end: End timestamp for loading samples
+
+        Returns:
+            Tuple of (participant_id -> smoothed values, overall engagement points)
+        """
+        sample_map = self._load_sample_map(meeting_id, start=start, end=end)
+        flags = self._build_status_matrix(buckets, participant_ids, sample_map, initial_status)
+        smoothed = self._smooth_matrix(flags)
+
+        if participant_ids:
+            overall = smoothed.sum(axis=0) / len(participant_ids)
+        else:
+            overall = np.zeros(len(buckets), dtype=np.float64)
+
+        participant_series = dict(zip(participant_ids, smoothed.tolist(), strict=True))
+        overall_points = [
+            EngagementPoint(bucket=bucket, value=value)
+            for bucket, value in zip(buckets, overall.tolist(), strict=True)
+        ]
+        return participant_series, overall_points
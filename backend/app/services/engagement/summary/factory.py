@@ -0,0 +1,72 @@
+"""Factory for creating snapshot builders."""
+
+from enum import StrEnum
+
+from app.repos import EngagementRepo, ParticipantRepo
+from app.services.engagement.bucketing import BucketManager
+from app.services.engagement.smoothing.base import SmoothingStrategy
+from app.services.engagement.state import LiveStateRegistry
+from app.services.engagement.summary.snapshot_builder import SnapshotBuilder
+from app.services.engagement.summary.snapshot_cache import SnapshotCache
+
+
+class SnapshotEngine(StrEnum):
+    """Available snapshot computation engines."""
+
+    PYTHON = "python"
+    NUMPY = "numpy"
+
+
+class SnapshotBuilderFactory:
+    """Factory for creating snapshot builders."""
+
+    @staticmethod
+    def create(
+        engagement_repo: EngagementRepo,
+        participant_repo: ParticipantRepo,
+        bucket_manager: BucketManager,
+        smoothing_strategy: SmoothingStrategy,
+        live_state: LiveStateRegistry | None = None,
+        snapshot_cache: SnapshotCache | None = None,
+        engine: SnapshotEngine | str = SnapshotEngine.PYTHON,
+    ) -> SnapshotBuilder:
+        """Create a snapshot builder for the given engine.
+
+        Args:
+            engagement_repo: Repository for engagement samples
+            participant_repo: Repository for participants
+            bucket_manager: Manager for time bucketing
+            smoothing_strategy: Strategy for smoothing engagement data
+            live_state: Registry of live meeting states used for rollups
+            snapshot_cache: Optional cache of incrementally maintained summaries
+            engine: ``python`` (default) or ``numpy``; both produce identical
+                summaries, the latter requires the numpy extra
+
+        Returns:
+            A snapshot builder instance
+
+        Raises:
+            ValueError: If the engine is not supported
+            RuntimeError: If the numpy engine is selected without numpy installed
+        """
+        engine = SnapshotEngine(engine)
+        builder_cls: type[SnapshotBuilder] = SnapshotBuilder
+        if engine == SnapshotEngine.NUMPY:
+            try:
+                from app.services.engagement.summary.array_snapshot_builder import (
+                    ArraySnapshotBuilder,
+                )
+            except ImportError as exc:
+                raise RuntimeError(
+                    "SNAPSHOT_ENGINE=numpy requires the numpy extra (pip install 'bsbox[numpy]')"
+                ) from exc
+            builder_cls = ArraySnapshotBuilder
+
+        return builder_cls(
+            engagement_repo=engagement_repo,
+            participant_repo=participant_repo,
+            bucket_manager=bucket_manager,
+            smoothing_strategy=smoothing_strategy,
+            live_state=live_state,
+            snapshot_cache=snapshot_cache,
+        )
@@ -8,13 +8,14 @@ from typing import Any
 from app.models import Meeting
 from app.repos import EngagementRepo, ParticipantRepo
 from app.schema.engagement.models import (
-    BucketRollup,
     EngagementPoint,
     EngagementSummary,
     ParticipantEngagementSeries,
 )
 from app.services.engagement.bucketing import BucketManager
 from app.services.engagement.smoothing.base import SmoothingStrategy
+from app.services.engagement.state import LiveStateRegistry, MeetingEngagementState
+from app.services.engagement.summary.snapshot_cache import CachedSnapshot, SnapshotCache
 from app.utils.datetime import ensure_utc
 
 
@@ -27,6 +28,8 @@ class SnapshotBuilder:
         participant_repo: ParticipantRepo,
         bucket_manager: BucketManager,
         smoothing_strategy: SmoothingStrategy,
+        live_state: LiveStateRegistry | None = None,
+        snapshot_cache: SnapshotCache | None = None,
     ) -> None:
         """Initialize snapshot builder with dependencies.
 
@@ -35,11 +38,17 @@ class SnapshotBuilder:
             participant_repo: Repository for participants
             bucket_manager: Manager for time bucketing
             smoothing_strategy: Strategy for smoothing engagement data
+            live_state: Registry of live meeting states used for rollups
+                (defaults to a private registry)
+            snapshot_cache: Optional cache of incrementally maintained
+                summaries; when None every summary is built from scratch
         """
         self.engagement_repo = engagement_repo
         self.participant_repo = participant_repo
         self.bucket_manager = bucket_manager
         self.smoothing_strategy = smoothing_strategy
+        self.live_state = live_state if live_state is not None else LiveStateRegistry()
+        self.snapshot_cache = snapshot_cache
 
     @staticmethod
     def _engaged_value(status: str) -> int:
@@ -161,6 +170,61 @@ class SnapshotBuilder:
             overall.append(EngagementPoint(bucket=bucket, value=avg))
         return overall
 
+    def _compute_series(
+        self,
+        meeting_id: str,
+        buckets: list[datetime],
+        participant_ids: list[str],
+        initial_status: dict[str, str],
+        start: datetime,
+        end: datetime,
+    ) -> tuple[dict[str, list[float]], list[EngagementPoint]]:
+        """Compute smoothed per-participant series and the overall series.
+
+        Args:
+            meeting_id: ID of the meeting
+            buckets: List of bucket timestamps
+            participant_ids: IDs of participants
+            initial_status: Status assumed before a participant's first sample
+            start: Start timestamp for loading samples
+            end: End timestamp for loading samples
+
+        Returns:
+            Tuple of (participant_id -> smoothed values, overall engagement points)
+        """
+        sample_map = self._load_sample_map(meeting_id, start=start, end=end)
+        participant_series = self._series_from_samples(
+            buckets, participant_ids, sample_map, initial_status
+        )
+        return participant_series, self._compose_overall(buckets, participant_series)
+
+    def _series_from_samples(
+        self,
+        buckets: list[datetime],
+        participant_ids: list[str],
+        sample_map: dict[str, dict[datetime, str]],
+        initial_status: dict[str, str],
+    ) -> dict[str, list[float]]:
+        """Compute smoothed engagement series from bucketed samples.
+
+        Args:
+            buckets: List of bucket timestamps
+            participant_ids: IDs of participants
+            sample_map: Map of participant_id -> bucket -> status
+            initial_status: Status assumed before a participant's first sample
+
+        Returns:
+            Map of participant_id -> smoothed values
+        """
+        flags = self._build_flags(buckets, participant_ids, sample_map, initial_status)
+
+        # Apply smoothing to each participant's flags
+        participant_series: dict[str, list[float]] = {}
+        for pid, pid_flags in flags.items():
+            smoothing_window = max(len(pid_flags), 1)
+            participant_series[pid] = self.smoothing_strategy.smooth(pid_flags, smoothing_window)
+        return participant_series
+
     def build_engagement_summary(
         self, meeting: Meeting, bucket_minutes: int = 1
     ) -> EngagementSummary:
@@ -179,18 +243,18 @@ class SnapshotBuilder:
         end = self.bucket_manager.bucketize(min(ensure_utc(meeting.end_ts), current_time))
         buckets = self.bucket_manager.generate_buckets(start, end, bucket_minutes)
 
+        if self.snapshot_cache is not None:
+            return self._cached_summary(
+                self.snapshot_cache, meeting.id, start, end, buckets, bucket_minutes
+            )
+
         # Query participants fresh to include newly joined participants
         participants = self.participant_repo.get_for_meeting(meeting.id)
         participant_ids = [p.id for p in participants]
-        sample_map = self._load_sample_map(meeting.id, start=start, end=end)
         initial_status = {p.id: p.last_status or "disengaged" for p in participants}
-        flags = self._build_flags(buckets, participant_ids, sample_map, initial_status)
-
-        # Apply smoothing to each participant's flags
-        participant_series: dict[str, list[float]] = {}
-        for pid, pid_flags in flags.items():
-            smoothing_window = max(len(pid_flags), 1)
-            participant_series[pid] = self.smoothing_strategy.smooth(pid_flags, smoothing_window)
+        participant_series, overall_points = self._compute_series(
+            meeting.id, buckets, participant_ids, initial_status, start, end
+        )
 
         # Compose output
         fingerprint_by_participant = {p.id: p.device_fingerprint for p in participants}
@@ -200,7 +264,6 @@ class SnapshotBuilder:
             participant_series=participant_series,
             fingerprint_by_participant=fingerprint_by_participant,
         )
-        overall_points = self._compose_overall(buckets, participant_series)
 
         return EngagementSummary(
             meeting_id=meeting.id,
@@ -211,32 +274,85 @@ class SnapshotBuilder:
             overall=overall_points,
         )
 
-    def bucket_rollup(self, meeting: Meeting, bucket: datetime) -> dict[str, Any]:
-        """Compute engagement rollup for a specific bucket using last known statuses."""
-        bucket = self.bucket_manager.bucketize(bucket)
+    def _cached_summary(
+        self,
+        cache: SnapshotCache,
+        meeting_id: str,
+        start: datetime,
+        end: datetime,
+        buckets: list[datetime],
+        bucket_minutes: int,
+    ) -> EngagementSummary:
+        """Return the summary from the snapshot cache, updating it incrementally.
 
-        # Query participants (includes historical entries)
-        participants = self.participant_repo.get_for_meeting(meeting.id)
-        participant_ids = [p.id for p in participants]
+        Args:
+            cache: Snapshot cache to read from and populate
+            meeting_id: ID of the meeting
+            start: First bucket of the meeting
+            end: Last bucket of the summary
+            buckets: List of bucket timestamps
+            bucket_minutes: Bucket size in minutes
 
-        # Seed with persisted last_status
-        latest_status: dict[str, str] = {p.id: p.last_status or "disengaged" for p in participants}
+        Returns:
+            Up-to-date engagement summary (shared; must not be mutated)
+        """
+        key = (meeting_id, bucket_minutes, self.smoothing_strategy.cache_key)
+        snapshot = cache.get(key)
+        if snapshot is None or not snapshot.extends(buckets):
+            # Cache miss or rescheduled meeting: load participants and samples once
+            snapshot = CachedSnapshot(meeting_id, start, bucket_minutes)
+            sample_map = self._load_sample_map(meeting_id, start=start, end=end)
+            for participant in self.participant_repo.get_for_meeting(meeting_id):
+                snapshot.add_participant(
+                    participant.id, participant.device_fingerprint, participant.last_status
+                )
+                snapshot.participants[participant.id].samples = sample_map.get(participant.id, {})
+            # Updates still buffered by the write-behind queue are not in the database yet
+            pending_source = self.live_state.pending_source
+            if pending_source is not None:
+                for participant_id, bucket, status in pending_source.pending_samples(meeting_id):
+                    snapshot.record_status(
+                        participant_id, self.bucket_manager.bucketize(bucket), status
+                    )
+            cache.store(key, snapshot)
 
-        # Overlay with latest samples up to the bucket
-        samples = self.engagement_repo.get_samples_for_meeting(meeting.id, end=bucket)
-        for sample in samples:
-            latest_status[sample.participant_id] = sample.status
+        return snapshot.refresh(buckets, end, self._series_from_samples)
 
-        participant_values: dict[str, float] = {}
-        for pid in participant_ids:
-            status = latest_status.get(pid, "disengaged")
-            participant_values[pid] = 100.0 if status in {"speaking", "engaged"} else 0.0
+    def load_live_state(self, meeting_id: str, bucket: datetime) -> MeetingEngagementState:
+        """Return the live state for a meeting, rebuilding it from the DB on cache miss.
 
-        overall_value = (
-            sum(participant_values.values()) / len(participant_values)
-            if participant_values
-            else 0.0
-        )
+        Args:
+            meeting_id: ID of the meeting
+            bucket: Bucket up to which samples are considered on rebuild
+
+        Returns:
+            Live engagement state for the meeting
+        """
+        state = self.live_state.get(meeting_id)
+        if state is not None:
+            return state
 
-        rollup = BucketRollup(bucket=bucket, participants=participant_values, overall=overall_value)
-        return dict(rollup.model_dump())
+        # Cache miss: load participants and only their latest statuses
+        participants = self.participant_repo.get_for_meeting(meeting_id)
+        latest = self.engagement_repo.get_latest_statuses([meeting_id], end=bucket)
+        return self.live_state.load_statuses(meeting_id, participants, latest.get(meeting_id, {}))
+
+    def bucket_rollup(self, meeting: Meeting, bucket: datetime) -> dict[str, Any]:
+        """Compute engagement rollup for a specific bucket using last known statuses.
+
+        Reads the in-memory live state; the database is only touched when the
+        state for the meeting has to be rebuilt. A cached state always holds
+        the current statuses, so the rollup is only accurate for the current
+        bucket: past buckets are labelled but not replayed.
+
+        Args:
+            meeting: The meeting to compute the rollup for
+            bucket: Bucket to label the rollup with; also bounds the samples
+                read when the state is rebuilt
+
+        Returns:
+            Dictionary with 'bucket', 'participants', and 'overall' keys
+        """
+        bucket = self.bucket_manager.bucketize(bucket)
+        state = self.load_live_state(meeting.id, bucket)
+        return dict(state.rollup(bucket).model_dump())
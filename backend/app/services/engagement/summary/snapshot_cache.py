@@ -0,0 +1,311 @@
+"""Incremental per-meeting cache of engagement summaries.
+
+Every joining client receives the full engagement history of its meeting.
+Instead of rebuilding it from the database for each join, summaries are
+cached per (meeting, bucket size, smoothing parameters) together with the
+bucketed samples they were computed from. Status updates and joins are
+applied to the cached samples as they happen, so the next request only
+recomputes the participants that changed and the buckets that opened since;
+points of unchanged buckets are reused as-is.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from app.config import settings
+from app.schema.engagement.models import (
+    EngagementPoint,
+    EngagementSummary,
+    ParticipantEngagementSeries,
+)
+
+SnapshotKey = tuple[str, int, str]
+
+# Computes smoothed series for (buckets, participant_ids, sample_map, initial_status)
+SeriesFunction = Callable[
+    [list[datetime], list[str], dict[str, dict[datetime, str]], dict[str, str]],
+    dict[str, list[float]],
+]
+
+
+@dataclass
+class CachedParticipant:
+    """Cached inputs and outputs of one participant's engagement series."""
+
+    participant_id: str
+    device_fingerprint: str
+    initial_status: str
+    samples: dict[datetime, str] = field(default_factory=dict)
+    values: list[float] = field(default_factory=list)
+    points: list[EngagementPoint] = field(default_factory=list)
+    series: ParticipantEngagementSeries | None = None
+    dirty: bool = True
+
+
+def _reuse_points(
+    buckets: list[datetime],
+    old_values: list[float],
+    old_points: list[EngagementPoint],
+    values: list[float],
+) -> tuple[list[EngagementPoint], int]:
+    """Rebuild a point list, keeping the points of the unchanged prefix.
+
+    Returns:
+        Tuple of (points, index of the first changed value)
+    """
+    first_changed = 0
+    limit = min(len(old_values), len(values))
+    while first_changed < limit and old_values[first_changed] == values[first_changed]:
+        first_changed += 1
+    if first_changed == len(values) == len(old_points):
+        return old_points, first_changed
+    points = old_points[:first_changed] + [
+        EngagementPoint(bucket=buckets[idx], value=values[idx])
+        for idx in range(first_changed, len(values))
+    ]
+    return points, first_changed
+
+
+class CachedSnapshot:
+    """Incrementally maintained engagement summary of one meeting."""
+
+    def __init__(self, meeting_id: str, start: datetime, bucket_minutes: int) -> None:
+        """Initialize an empty snapshot.
+
+        Args:
+            meeting_id: ID of the meeting
+            start: First bucket of the meeting
+            bucket_minutes: Bucket size in minutes
+        """
+        self.meeting_id = meeting_id
+        self.start = start
+        self.bucket_minutes = bucket_minutes
+        self.loaded_at = time.monotonic()
+        self.buckets: list[datetime] = []
+        self.participants: dict[str, CachedParticipant] = {}
+        self.column_sums: list[float] = []
+        # Number of leading participants included in column_sums
+        self.summed_count = 0
+        self.overall_points: list[EngagementPoint] = []
+        self.summary: EngagementSummary | None = None
+        self.lock = threading.RLock()
+
+    def add_participant(
+        self, participant_id: str, device_fingerprint: str, status: str | None
+    ) -> None:
+        """Track a participant if not already known (appended to the order).
+
+        Args:
+            participant_id: ID of the participant
+            device_fingerprint: Device fingerprint of the participant
+            status: Last known status (defaults to disengaged)
+        """
+        with self.lock:
+            if participant_id in self.participants:
+                return
+            self.participants[participant_id] = CachedParticipant(
+                participant_id=participant_id,
+                device_fingerprint=device_fingerprint,
+                initial_status=status or "disengaged",
+            )
+            self.summary = None
+
+    def record_status(self, participant_id: str, bucket: datetime, status: str) -> bool:
+        """Apply a status update to the cached samples.
+
+        The update becomes the participant's sample for ``bucket`` and their
+        last status, mirroring what the database write does.
+
+        Args:
+            participant_id: ID of the participant
+            bucket: Bucketed timestamp of the update
+            status: New engagement status
+
+        Returns:
+            False if the participant is unknown to this snapshot
+        """
+        with self.lock:
+            participant = self.participants.get(participant_id)
+            if participant is None:
+                return False
+            participant.samples[bucket] = status
+            participant.initial_status = status
+            participant.dirty = True
+            self.summary = None
+            return True
+
+    def extends(self, buckets: list[datetime]) -> bool:
+        """Whether ``buckets`` start with the cached buckets.
+
+        False when the meeting was rescheduled (or its end moved earlier), in
+        which case the snapshot has to be rebuilt.
+        """
+        return buckets[: len(self.buckets)] == self.buckets
+
+    def refresh(
+        self, buckets: list[datetime], end: datetime, series_for: SeriesFunction
+    ) -> EngagementSummary:
+        """Bring the snapshot up to date and return the summary.
+
+        Only participants whose samples changed and, when buckets were
+        appended, the series' new tails are recomputed. Closed buckets keep
+        their points unless a participant's values actually changed.
+
+        Args:
+            buckets: Current bucket timestamps
+            end: Current end of the summary
+            series_for: Function computing smoothed series from samples
+
+        Returns:
+            The up-to-date summary (shared; must not be mutated)
+
+        Raises:
+            ValueError: If ``buckets`` do not extend the cached buckets
+        """
+        with self.lock:
+            if not self.extends(buckets):
+                raise ValueError("Buckets do not extend the cached snapshot")
+            old_count = len(self.buckets)
+            if self.summary is not None and len(buckets) == old_count and self.summary.end == end:
+                return self.summary
+
+            appended = len(buckets) > old_count
+            changed = [p for p in self.participants.values() if p.dirty or appended]
+            series = series_for(
+                buckets,
+                [p.participant_id for p in changed],
+                {p.participant_id: p.samples for p in changed},
+                {p.participant_id: p.initial_status for p in changed},
+            )
+
+            # Earliest column whose sum must be recomputed over all participants
+            resum_from = old_count
+            for position, participant in enumerate(self.participants.values()):
+                if participant.participant_id not in series:
+                    continue
+                values = series[participant.participant_id]
+                is_new = not participant.values
+                participant.points, first_changed = _reuse_points(
+                    buckets, participant.values, participant.points, values
+                )
+                if first_changed < len(values) or participant.series is None:
+                    participant.series = ParticipantEngagementSeries(
+                        participant_id=participant.participant_id,
+                        device_fingerprint=participant.device_fingerprint,
+                        series=participant.points,
+                    )
+                if not (is_new and position >= self.summed_count):
+                    resum_from = min(resum_from, first_changed)
+                participant.values = values
+                participant.dirty = False
+
+            self._update_overall(buckets, old_count, resum_from)
+            self.buckets = list(buckets)
+            self.summary = EngagementSummary(
+                meeting_id=self.meeting_id,
+                start=self.start,
+                end=end,
+                bucket_minutes=self.bucket_minutes,
+                participants=[p.series for p in self.participants.values() if p.series],
+                overall=self.overall_points,
+            )
+            return self.summary
+
+    def _update_overall(self, buckets: list[datetime], old_count: int, resum_from: int) -> None:
+        """Update column sums and overall points after participant series changed.
+
+        Sums are accumulated over participants in order, exactly like a full
+        rebuild. Participants appended since the last refresh are added on top
+        of the existing sums; anything else is re-summed from ``resum_from``.
+        """
+        rows = [p.values for p in self.participants.values()]
+        summed = self.summed_count
+        sums = self.column_sums[:resum_from]
+        for row in rows[summed:]:
+            for idx in range(resum_from):
+                sums[idx] += row[idx]
+        sums.extend(sum(column) for column in zip(*(row[resum_from:] for row in rows), strict=True))
+        if not rows:
+            sums = [0.0] * len(buckets)
+        self.column_sums = sums
+        self.summed_count = len(rows)
+
+        count = len(rows)
+        overall = [total / count if count else 0.0 for total in sums]
+        old_overall = [point.value for point in self.overall_points[:old_count]]
+        self.overall_points, _ = _reuse_points(buckets, old_overall, self.overall_points, overall)
+
+
+class SnapshotCache:
+    """Process-wide cache of incrementally maintained engagement summaries.
+
+    Like the live state registry, ``max_age_seconds`` bounds how stale a
+    snapshot may get when other processes write to the same meetings.
+    """
+
+    def __init__(self, max_age_seconds: float | None = None) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_age_seconds: Rebuild snapshots older than this; None never expires them
+        """
+        self.max_age_seconds = max_age_seconds
+        self._meetings: dict[str, dict[tuple[int, str], CachedSnapshot]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: SnapshotKey) -> CachedSnapshot | None:
+        """Return the cached snapshot for a key, or None on cache miss or expiry."""
+        meeting_id, bucket_minutes, algorithm = key
+        snapshot = self._meetings.get(meeting_id, {}).get((bucket_minutes, algorithm))
+        if (
+            snapshot is not None
+            and self.max_age_seconds is not None
+            and time.monotonic() - snapshot.loaded_at > self.max_age_seconds
+        ):
+            return None
+        return snapshot
+
+    def store(self, key: SnapshotKey, snapshot: CachedSnapshot) -> None:
+        """Cache a snapshot, replacing any previous one for the key."""
+        meeting_id, bucket_minutes, algorithm = key
+        with self._lock:
+            self._meetings.setdefault(meeting_id, {})[(bucket_minutes, algorithm)] = snapshot
+
+    def add_participant(
+        self, meeting_id: str, participant_id: str, device_fingerprint: str, status: str | None
+    ) -> None:
+        """Add a joined participant to all cached snapshots of its meeting."""
+        for snapshot in list(self._meetings.get(meeting_id, {}).values()):
+            snapshot.add_participant(participant_id, device_fingerprint, status)
+
+    def record_status(
+        self, meeting_id: str, participant_id: str, bucket: datetime, status: str
+    ) -> None:
+        """Apply a status update to all cached snapshots of its meeting.
+
+        Snapshots that do not know the participant are dropped so they are
+        rebuilt from the database.
+        """
+        for key, snapshot in list(self._meetings.get(meeting_id, {}).items()):
+            if not snapshot.record_status(participant_id, bucket, status):
+                with self._lock:
+                    self._meetings.get(meeting_id, {}).pop(key, None)
+
+    def discard(self, meeting_id: str) -> None:
+        """Drop all cached snapshots of a meeting."""
+        with self._lock:
+            self._meetings.pop(meeting_id, None)
+
+    def retain(self, meeting_ids: Iterable[str]) -> None:
+        """Drop snapshots of all meetings not in ``meeting_ids``."""
+        keep = set(meeting_ids)
+        with self._lock:
+            for meeting_id in [mid for mid in self._meetings if mid not in keep]:
+                del self._meetings[meeting_id]
+
+
+# Shared cache used by the application wiring
+snapshot_cache = SnapshotCache(max_age_seconds=settings.live_state_max_age_seconds)
@@ -41,13 +41,7 @@ class EngagementService:
         Raises:
             ValueError: If the bucketed time is outside meeting bounds
         """
-        bucket = self.bucket_manager.bucketize(current_time)
-
-        # Validate bucket is within meeting time bounds
-        meeting = participant.meeting
-        meeting_start = self.bucket_manager.bucketize(meeting.start_ts)
-        meeting_end = self.bucket_manager.bucketize(meeting.end_ts)
-        self.bucket_manager.validate_bucket_in_meeting(bucket, meeting_start, meeting_end)
+        bucket = self._meeting_bucket(participant.meeting, current_time)
 
         self.engagement_repo.upsert_sample(
             meeting_id=participant.meeting_id,
@@ -56,8 +50,75 @@ class EngagementService:
             request=request,
         )
         self.participant_repo.update_last_status(participant, request.status)
+        self._track_status(participant.meeting_id, participant.id, bucket, request.status)
         return bucket
 
+    def apply_status(
+        self,
+        meeting: Meeting,
+        participant_id: str,
+        request: StatusUpdateRequest,
+        current_time: datetime,
+    ) -> datetime:
+        """Apply a status update to the live state without persisting it.
+
+        Used when status writes are batched by a write-behind queue; the caller
+        is responsible for queuing the write. The live state is loaded first so
+        a later rebuild cannot drop the not-yet-persisted status. Nothing is
+        read from or written to the participant row.
+
+        Args:
+            meeting: The meeting the participant joined
+            participant_id: ID of the participant recording the status
+            request: The status update request containing the status
+            current_time: The current timestamp
+
+        Returns:
+            The bucketed timestamp
+
+        Raises:
+            ValueError: If the bucketed time is outside meeting bounds
+        """
+        bucket = self._meeting_bucket(meeting, current_time)
+        self.snapshot_builder.load_live_state(meeting.id, bucket)
+        self._track_status(meeting.id, participant_id, bucket, request.status)
+        return bucket
+
+    def _track_status(
+        self, meeting_id: str, participant_id: str, bucket: datetime, status: str
+    ) -> None:
+        """Apply a status update to the in-memory live state and snapshot cache."""
+        self.snapshot_builder.live_state.record_status(meeting_id, participant_id, status)
+        if self.snapshot_builder.snapshot_cache is not None:
+            self.snapshot_builder.snapshot_cache.record_status(
+                meeting_id, participant_id, bucket, status
+            )
+
+    def _meeting_bucket(self, meeting: Meeting, current_time: datetime) -> datetime:
+        """Bucketize a timestamp and validate it lies within the meeting."""
+        bucket = self.bucket_manager.bucketize(current_time)
+        meeting_start = self.bucket_manager.bucketize(meeting.start_ts)
+        meeting_end = self.bucket_manager.bucketize(meeting.end_ts)
+        self.bucket_manager.validate_bucket_in_meeting(bucket, meeting_start, meeting_end)
+        return bucket
+
+    def register_participant(self, participant: Participant) -> None:
+        """Track a joined participant in the live engagement state.
+
+        Args:
+            participant: The participant that joined the meeting
+        """
+        self.snapshot_builder.live_state.add_participant(
+            participant.meeting_id, participant.id, participant.last_status
+        )
+        if self.snapshot_builder.snapshot_cache is not None:
+            self.snapshot_builder.snapshot_cache.add_participant(
+                participant.meeting_id,
+                participant.id,
+                participant.device_fingerprint,
+                participant.last_status,
+            )
+
     def build_engagement_summary(self, meeting: Meeting, bucket_minutes: int = 1) -> EngagementSummary:
         """Build complete engagement summary for a meeting.
 
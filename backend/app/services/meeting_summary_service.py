@@ -85,3 +85,31 @@ class MeetingSummaryService:
             normalized_engagement=data["normalized_engagement"],  # type: ignore[arg-type]
             engagement_level=data["engagement_level"],  # type: ignore[arg-type]
         )
+
+    def persist_summary_once(self, meeting: Meeting) -> tuple[MeetingSummary, bool]:
+        """Persist the meeting summary unless another writer already did.
+
+        Unlike ``persist_summary`` an existing summary is never overwritten,
+        so callers racing on the same meeting (possibly in other processes)
+        can tell whether they produced the summary.
+
+        Args:
+            meeting: The meeting to persist summary for
+
+        Returns:
+            Tuple of (persisted MeetingSummary, whether this call created it)
+        """
+        existing = self.meeting_summary_repo.get(meeting.id)
+        if existing:
+            return existing, False
+
+        data = self.compute_summary_data(meeting)
+        created = self.meeting_summary_repo.create_if_absent(
+            meeting_id=meeting.id,
+            max_participants=data["max_participants"],  # type: ignore[arg-type]
+            normalized_engagement=data["normalized_engagement"],  # type: ignore[arg-type]
+            engagement_level=data["engagement_level"],  # type: ignore[arg-type]
+        )
+        if created is None:
+            return self.meeting_summary_repo.get(meeting.id), False  # type: ignore[return-value]
+        return created, True
@@ -0,0 +1,206 @@
+"""Lightweight in-process metrics.
+
+Background components publish their health (queue depths, pending timers,
+tick durations, ...) here; the values are exposed as JSON by the
+``/metrics`` endpoint.
+"""
+
+import bisect
+import threading
+from collections.abc import Callable, Sequence
+from typing import Any, TypeVar
+
+# Default histogram bucket upper bounds, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Gauge:
+    """A value that can go up and down."""
+
+    def __init__(self, name: str, description: str) -> None:
+        """Initialize a gauge at zero.
+
+        Args:
+            name: Metric name
+            description: Human readable description
+        """
+        self.name = name
+        self.description = description
+        self.value: float = 0
+
+    def set(self, value: float) -> None:
+        """Set the current value."""
+        self.value = value
+
+    def collect(self) -> float:
+        """Return the current value."""
+        return self.value
+
+
+class Counter:
+    """A monotonically increasing count."""
+
+    def __init__(self, name: str, description: str) -> None:
+        """Initialize a counter at zero.
+
+        Args:
+            name: Metric name
+            description: Human readable description
+        """
+        self.name = name
+        self.description = description
+        self.value: float = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1) -> None:
+        """Increase the count."""
+        with self._lock:
+            self.value += amount
+
+    def collect(self) -> float:
+        """Return the current count."""
+        return self.value
+
+
+class Histogram:
+    """Distribution of observed values over fixed buckets."""
+
+    def __init__(
+        self, name: str, description: str, buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            name: Metric name
+            description: Human readable description
+            buckets: Sorted bucket upper bounds; an implicit +Inf bucket is added
+        """
+        self.name = name
+        self.description = description
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record an observation."""
+        with self._lock:
+            self.counts[bisect.bisect_left(self.buckets, value)] += 1
+            self.count += 1
+            self.sum += value
+
+    def collect(self) -> dict[str, float | dict[str, int]]:
+        """Return count, sum and cumulative bucket counts (keyed by upper bound)."""
+        with self._lock:
+            cumulative, total = {}, 0
+            for bound, count in zip((*self.buckets, float("inf")), self.counts, strict=True):
+                total += count
+                cumulative[str(bound)] = total
+            return {"count": self.count, "sum": self.sum, "buckets": cumulative}
+
+
+class Collector:
+    """A metric whose value is read from a callback when collected."""
+
+    def __init__(self, name: str, description: str, read: Callable[[], Any]) -> None:
+        """Initialize the collector.
+
+        Args:
+            name: Metric name
+            description: Human readable description
+            read: Callback returning the current (JSON-serializable) value
+        """
+        self.name = name
+        self.description = description
+        self.read = read
+
+    def collect(self) -> Any:
+        """Return the callback's current value."""
+        return self.read()
+
+
+Metric = Gauge | Counter | Histogram | Collector
+M = TypeVar("M", Gauge, Counter, Histogram, Collector)
+
+
+class MetricsRegistry:
+    """Named collection of metrics."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def gauge(self, name: str, description: str = "") -> Gauge:
+        """Return the gauge with the given name, creating it if needed.
+
+        Args:
+            name: Metric name
+            description: Human readable description (used on creation)
+
+        Returns:
+            The registered gauge
+        """
+        return self._get_or_create(name, lambda: Gauge(name, description), Gauge)
+
+    def counter(self, name: str, description: str = "") -> Counter:
+        """Return the counter with the given name, creating it if needed.
+
+        Args:
+            name: Metric name
+            description: Human readable description (used on creation)
+
+        Returns:
+            The registered counter
+        """
+        return self._get_or_create(name, lambda: Counter(name, description), Counter)
+
+    def histogram(
+        self, name: str, description: str = "", buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Return the histogram with the given name, creating it if needed.
+
+        Args:
+            name: Metric name
+            description: Human readable description (used on creation)
+            buckets: Bucket upper bounds (used on creation)
+
+        Returns:
+            The registered histogram
+        """
+        return self._get_or_create(name, lambda: Histogram(name, description, buckets), Histogram)
+
+    def collector(self, name: str, read: Callable[[], Any], description: str = "") -> Collector:
+        """Register a callback metric, replacing the callback of an existing one.
+
+        Args:
+            name: Metric name
+            read: Callback returning the current value
+            description: Human readable description (used on creation)
+
+        Returns:
+            The registered collector
+        """
+        metric = self._get_or_create(name, lambda: Collector(name, description, read), Collector)
+        metric.read = read
+        return metric
+
+    def _get_or_create(self, name: str, factory: Callable[[], M], kind: type[M]) -> M:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = factory()
+            if not isinstance(metric, kind):
+                raise ValueError(
+                    f"Metric {name!r} is already registered as {type(metric).__name__}"
+                )
+            return metric
+
+    def collect(self) -> dict[str, Any]:
+        """Return the current values of all metrics by name."""
+        with self._lock:
+            return {name: metric.collect() for name, metric in sorted(self._metrics.items())}
+
+
+# Shared registry used by the application
+metrics = MetricsRegistry()
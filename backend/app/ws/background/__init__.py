@@ -1,7 +1,59 @@
 """Background tasks for WebSocket operations."""
 
+from app.ws.background.delta_coalescer import DeltaCoalescer
 from app.ws.background.factory import BroadcasterFactory
-from app.ws.background.lifecycle import start_broadcaster, stop_broadcaster
+from app.ws.background.lifecycle import (
+    get_delta_coalescer,
+    get_meeting_end_scheduler,
+    get_sample_retention,
+    get_sqlite_writer,
+    get_status_writer,
+    start_broadcaster,
+    start_delta_coalescer,
+    start_meeting_end_scheduler,
+    start_sample_retention,
+    start_sqlite_writer,
+    start_status_writer,
+    stop_broadcaster,
+    stop_delta_coalescer,
+    stop_meeting_end_scheduler,
+    stop_sample_retention,
+    stop_sqlite_writer,
+    stop_status_writer,
+)
+from app.ws.background.meeting_end import MeetingEndJobs, meeting_end_jobs
+from app.ws.background.meeting_end_scheduler import MeetingEndScheduler
 from app.ws.background.periodic_broadcaster import PeriodicBroadcaster
+from app.ws.background.sample_retention import RetentionReport, SampleRetention
+from app.ws.background.sqlite_writer import SQLiteWriter
+from app.ws.background.write_behind import StatusWriteBehind
 
-__all__ = ["BroadcasterFactory", "PeriodicBroadcaster", "start_broadcaster", "stop_broadcaster"]
+__all__ = [
+    "BroadcasterFactory",
+    "DeltaCoalescer",
+    "MeetingEndJobs",
+    "MeetingEndScheduler",
+    "PeriodicBroadcaster",
+    "RetentionReport",
+    "SampleRetention",
+    "SQLiteWriter",
+    "StatusWriteBehind",
+    "get_delta_coalescer",
+    "get_meeting_end_scheduler",
+    "get_sample_retention",
+    "get_sqlite_writer",
+    "get_status_writer",
+    "meeting_end_jobs",
+    "start_broadcaster",
+    "start_delta_coalescer",
+    "start_meeting_end_scheduler",
+    "start_sample_retention",
+    "start_sqlite_writer",
+    "start_status_writer",
+    "stop_broadcaster",
+    "stop_delta_coalescer",
+    "stop_meeting_end_scheduler",
+    "stop_sample_retention",
+    "stop_sqlite_writer",
+    "stop_status_writer",
+]
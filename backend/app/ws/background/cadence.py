@@ -0,0 +1,135 @@
+"""Adaptive per-meeting intervals for periodic broadcasts."""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from app.utils.datetime import ensure_utc
+
+
+def _assume_utc(naive: datetime) -> datetime:
+    return naive.replace(tzinfo=UTC)
+
+
+@dataclass
+class MeetingCadence:
+    """Current broadcast interval of one meeting."""
+
+    interval: float
+    next_due: float
+    participants: int = 0
+    version: int | None = None
+
+
+class AdaptiveCadence:
+    """Decides how often each meeting gets a periodic broadcast.
+
+    Meetings start at ``base_interval``. After every broadcast the interval
+    is adapted to the meeting:
+
+    - busy (state changed since its last broadcast and at least
+      ``busy_participants`` participants): ``min_interval``
+    - active (state changed, more than one participant): ``base_interval``
+    - idle or single-participant: backed off by ``backoff`` up to
+      ``max_interval``
+
+    Participants only count while present: seen (joined, pinged or sent a
+    status) within the last ``activity_window`` seconds, so people who left
+    long ago do not keep a meeting busy.
+
+    The broadcaster ticks every ``min_interval`` and only handles meetings
+    that are due.
+    """
+
+    def __init__(
+        self,
+        base_interval: float,
+        min_interval: float,
+        max_interval: float,
+        busy_participants: int = 10,
+        backoff: float = 2.0,
+        activity_window: float = 90.0,
+    ) -> None:
+        """Initialize the cadence policy.
+
+        Args:
+            base_interval: Interval of new and active meetings, in seconds
+            min_interval: Interval of busy meetings (and the broadcaster's tick)
+            max_interval: Upper bound for backed-off meetings
+            busy_participants: Participant count from which active meetings are busy
+            backoff: Factor applied to the interval of idle meetings
+            activity_window: Seconds since a participant was last seen during
+                which they count as present
+        """
+        self.base_interval = base_interval
+        self.min_interval = min(min_interval, base_interval)
+        self.max_interval = max(max_interval, base_interval)
+        self.busy_participants = busy_participants
+        self.backoff = backoff
+        self.activity_window = activity_window
+        self._meetings: dict[str, MeetingCadence] = {}
+
+    def is_due(self, meeting_id: str, now: float) -> bool:
+        """Whether a meeting should be broadcast at monotonic time ``now``."""
+        cadence = self._meetings.get(meeting_id)
+        return cadence is None or cadence.next_due <= now
+
+    def present_participants(self, last_seen: Iterable[datetime | None], now: datetime) -> int:
+        """Count the participants seen within ``activity_window`` of ``now``.
+
+        Args:
+            last_seen: ``last_seen_at`` of every participant of a meeting
+            now: Current timestamp
+
+        Returns:
+            Number of present participants
+        """
+        since = ensure_utc(now) - timedelta(seconds=self.activity_window)
+        # SQLite returns naive timestamps; they are stored in UTC
+        return sum(
+            1
+            for seen in last_seen
+            if seen is not None and ensure_utc(seen, on_naive=_assume_utc) >= since
+        )
+
+    def update(self, meeting_id: str, now: float, participants: int, version: int) -> float:
+        """Adapt a meeting's interval after it was handled by a tick.
+
+        Args:
+            meeting_id: ID of the meeting
+            now: Monotonic time of the tick
+            participants: Number of present participants of the meeting
+            version: Version of the meeting's live state
+
+        Returns:
+            The meeting's new interval in seconds
+        """
+        cadence = self._meetings.get(meeting_id)
+        if cadence is None:
+            interval = self.base_interval
+        elif cadence.version == version or participants <= 1:
+            interval = min(cadence.interval * self.backoff, self.max_interval)
+        elif participants >= self.busy_participants:
+            interval = self.min_interval
+        else:
+            interval = self.base_interval
+
+        # Ticks fire slightly late; keep the schedule aligned to the tick grid
+        next_due = now + interval - self.min_interval / 2
+        self._meetings[meeting_id] = MeetingCadence(
+            interval=interval, next_due=next_due, participants=participants, version=version
+        )
+        return interval
+
+    def retain(self, meeting_ids: Iterable[str]) -> None:
+        """Forget meetings not in ``meeting_ids``."""
+        keep = set(meeting_ids)
+        for meeting_id in [mid for mid in self._meetings if mid not in keep]:
+            del self._meetings[meeting_id]
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Return the current interval and participant count of every meeting."""
+        return {
+            meeting_id: {"interval_seconds": cadence.interval, "participants": cadence.participants}
+            for meeting_id, cadence in sorted(self._meetings.items())
+        }
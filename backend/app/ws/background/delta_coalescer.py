@@ -0,0 +1,222 @@
+"""Per-meeting coalescing of engagement delta broadcasts."""
+
+import asyncio
+import contextlib
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Protocol
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.repos import AsyncEngagementRepo, AsyncParticipantRepo
+from app.schema.engagement.messages import RollupData
+from app.services.engagement.state import LiveStateRegistry, MeetingEngagementState
+from app.ws.repos.broadcast import BroadcastRepo
+
+logger = logging.getLogger(__name__)
+
+
+class RollupPool(Protocol):
+    """Computes rollups off the event loop (the periodic broadcaster's pool)."""
+
+    async def compute_rollups(
+        self, requests: list[tuple[str, datetime]], deadline: float | None
+    ) -> dict[str, RollupData | None]:
+        """Return the rollups of (meeting_id, bucket) pairs ready by the deadline."""
+        ...
+
+
+@dataclass
+class _DirtyMeeting:
+    bucket: datetime
+    deadline: float
+
+
+class DeltaCoalescer:
+    """Emits at most one delta per meeting per coalescing window.
+
+    Joins, leaves, status updates and periodic ticks only mark a meeting as
+    dirty. When the meeting's window elapses, a single rollup is computed from
+    the live state (reflecting everything applied so far) and broadcast.
+
+    With a pool attached (see ``attach_pool``), rollups are computed on it
+    and must be ready by its deadline; those that miss it are skipped and
+    their meetings marked dirty again. Without one, they are computed inline.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        broadcast_repo: BroadcastRepo,
+        live_state: LiveStateRegistry,
+        window_seconds: float = 0.25,
+    ) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            session_factory: Factory for async sessions used to rebuild live state
+            broadcast_repo: Repository used to publish the coalesced deltas
+            live_state: Registry of live meeting states shared with WS handlers
+            window_seconds: Maximum delay between the first change and its delta
+        """
+        self.session_factory = session_factory
+        self.broadcast_repo = broadcast_repo
+        self.live_state = live_state
+        self.window_seconds = window_seconds
+        self._pool: RollupPool | None = None
+        self._pool_deadline_seconds: float | None = None
+        self._dirty: dict[str, _DirtyMeeting] = {}
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def pending_count(self) -> int:
+        """Number of meetings with a delta waiting to be emitted."""
+        return len(self._dirty)
+
+    def attach_pool(self, pool: RollupPool | None, deadline_seconds: float | None = None) -> None:
+        """Compute rollups on a bounded pool, or inline again when None.
+
+        Args:
+            pool: Pool computing the rollups
+            deadline_seconds: Time after a flush starts by which its rollups
+                must be ready; None waits for all of them
+        """
+        self._pool = pool
+        self._pool_deadline_seconds = deadline_seconds
+
+    def mark_dirty(self, meeting_id: str, bucket: datetime) -> None:
+        """Schedule a delta for a meeting, merging with any pending one.
+
+        Args:
+            meeting_id: ID of the meeting whose state changed
+            bucket: Bucket the change belongs to (the latest one is emitted)
+        """
+        entry = self._dirty.get(meeting_id)
+        if entry is None:
+            self._dirty[meeting_id] = _DirtyMeeting(
+                bucket=bucket, deadline=time.monotonic() + self.window_seconds
+            )
+            self._wakeup.set()
+        elif bucket > entry.bucket:
+            entry.bucket = bucket
+
+    async def start(self) -> None:
+        """Start the flush task."""
+        self._task = asyncio.create_task(self._flush_loop())
+        logger.info("Delta coalescer started (window=%.3fs)", self.window_seconds)
+
+    async def stop(self) -> None:
+        """Stop the flush task and emit all pending deltas."""
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush(force=True)
+        logger.info("Delta coalescer stopped")
+
+    async def flush(self, force: bool = False) -> int:
+        """Emit deltas for meetings whose window has elapsed.
+
+        Args:
+            force: Emit all pending deltas regardless of their deadline
+
+        Returns:
+            Number of deltas published
+        """
+        now = time.monotonic()
+        due = {
+            meeting_id: entry
+            for meeting_id, entry in self._dirty.items()
+            if force or entry.deadline <= now
+        }
+        for meeting_id in due:
+            del self._dirty[meeting_id]
+
+        for meeting_id, entry in due.items():
+            try:
+                await self._get_state(meeting_id, entry.bucket)
+            except Exception:
+                logger.exception("Failed to load live state for meeting %s", meeting_id)
+
+        rollups = await self._compute_rollups(
+            [(meeting_id, entry.bucket) for meeting_id, entry in due.items()], force
+        )
+        published = 0
+        for meeting_id, entry in due.items():
+            if meeting_id not in rollups:
+                # Missed the pool's deadline; try again after another window
+                self.mark_dirty(meeting_id, entry.bucket)
+                continue
+            try:
+                rollup = rollups[meeting_id]
+                if rollup is not None:
+                    self.broadcast_repo.publish(meeting_id, rollup)
+                    published += 1
+            except Exception:
+                logger.exception("Failed to publish coalesced delta for meeting %s", meeting_id)
+        return published
+
+    async def _compute_rollups(
+        self, requests: list[tuple[str, datetime]], force: bool
+    ) -> dict[str, RollupData | None]:
+        """Compute rollups on the attached pool, or inline without one.
+
+        A forced flush waits for all rollups instead of applying the deadline.
+        """
+        if self._pool is not None:
+            deadline = None
+            if not force and self._pool_deadline_seconds is not None:
+                deadline = asyncio.get_running_loop().time() + self._pool_deadline_seconds
+            return await self._pool.compute_rollups(requests, deadline)
+
+        rollups: dict[str, RollupData | None] = {}
+        for meeting_id, bucket in requests:
+            try:
+                rollup = self.live_state.rollup(meeting_id, bucket)
+            except Exception:
+                logger.exception("Failed to compute rollup for meeting %s", meeting_id)
+                rollup = None
+            rollups[meeting_id] = (
+                None
+                if rollup is None
+                else RollupData(
+                    meeting_id=meeting_id,
+                    bucket=bucket,
+                    overall=rollup.overall,
+                    participants=rollup.participants,
+                )
+            )
+        return rollups
+
+    async def _get_state(self, meeting_id: str, bucket: datetime) -> MeetingEngagementState:
+        """Return the live state for a meeting, rebuilding it on cache miss."""
+        state = self.live_state.get(meeting_id)
+        if state is not None:
+            return state
+        async with self.session_factory() as session:
+            participants = await AsyncParticipantRepo(session).get_for_meeting(meeting_id)
+            latest = await AsyncEngagementRepo(session).get_latest_statuses(
+                [meeting_id], end=bucket
+            )
+        return self.live_state.load_statuses(meeting_id, participants, latest.get(meeting_id, {}))
+
+    async def _flush_loop(self) -> None:
+        """Sleep until the earliest pending deadline, then flush due meetings."""
+        while True:
+            try:
+                if not self._dirty:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+                delay = min(entry.deadline for entry in self._dirty.values()) - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                await self.flush()
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                logger.exception("Error in delta coalescer")
@@ -1,14 +1,19 @@
 """Factory for creating the periodic broadcaster."""
 
-from collections.abc import Callable
-
 from litestar.channels import ChannelsPlugin
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.config import settings
 from app.services.engagement.bucketing import BucketManager
 from app.services.engagement.smoothing import SmoothingAlgorithm, SmoothingFactory
+from app.services.engagement.state import live_state_registry
+from app.services.engagement.summary import snapshot_cache
+from app.ws.background.cadence import AdaptiveCadence
+from app.ws.background.delta_coalescer import DeltaCoalescer
+from app.ws.background.ownership import MeetingOwnership, default_worker_id
 from app.ws.background.periodic_broadcaster import PeriodicBroadcaster
 from app.ws.repos.broadcast import BroadcastRepo
+from app.ws.repos.snapshot_payload import snapshot_payload_cache
 
 
 class BroadcasterFactory:
@@ -21,25 +26,48 @@ class BroadcasterFactory:
     @staticmethod
     def create(
         channels: ChannelsPlugin,
-        session_factory: Callable[[], Session],
+        session_factory: async_sessionmaker[AsyncSession],
         interval_seconds: int = 10,
+        coalescer: DeltaCoalescer | None = None,
     ) -> PeriodicBroadcaster:
         """Create a PeriodicBroadcaster with all dependencies.
 
         Args:
             channels: Litestar channels plugin for broadcasting
-            session_factory: Factory function to create database sessions
+            session_factory: Factory for async database sessions
             interval_seconds: Broadcast interval in seconds
+            coalescer: Optional delta coalescer periodic ticks fold into
 
         Returns:
             Configured PeriodicBroadcaster instance
         """
         # Create broadcast repo from channels
-        broadcast_repo = BroadcastRepo(channels)
+        broadcast_repo = BroadcastRepo(channels, coalescer)
 
         # Create engagement service using DI pattern (session-independent components)
         bucket_manager = BucketManager()
-        smoothing_strategy = SmoothingFactory.create(SmoothingAlgorithm.KALMAN)
+        smoothing_strategy = SmoothingFactory.create(
+            SmoothingAlgorithm(settings.smoothing_algorithm)
+        )
+
+        # Workers sharing a channels backend reach every client, so they split
+        # the meetings; with in-memory channels each must serve its own clients
+        ownership = None
+        if settings.broadcaster_sharding_enabled and settings.channels_backend != "memory":
+            ownership = MeetingOwnership(
+                worker_id=default_worker_id(),
+                lease_seconds=settings.broadcaster_lease_seconds,
+            )
+
+        cadence = None
+        if settings.broadcaster_adaptive_interval:
+            cadence = AdaptiveCadence(
+                base_interval=interval_seconds,
+                min_interval=settings.broadcaster_min_interval_seconds,
+                max_interval=settings.broadcaster_max_interval_seconds,
+                busy_participants=settings.broadcaster_busy_participants,
+                activity_window=settings.broadcaster_activity_window_seconds,
+            )
 
         # Note: repos and engagement_service will be recreated per-broadcast
         # using session_factory. We only need them here to pass to broadcaster.
@@ -50,5 +78,14 @@ class BroadcasterFactory:
             broadcast_repo=broadcast_repo,
             bucket_manager=bucket_manager,
             smoothing_strategy=smoothing_strategy,
+            live_state=live_state_registry,
             interval_seconds=interval_seconds,
+            snapshot_cache=snapshot_cache if settings.snapshot_cache_enabled else None,
+            ownership=ownership,
+            max_workers=settings.broadcaster_max_workers,
+            tick_deadline_seconds=settings.broadcaster_tick_deadline_ms / 1000,
+            skip_unchanged=settings.broadcaster_skip_unchanged,
+            heartbeat_seconds=settings.broadcaster_heartbeat_seconds,
+            cadence=cadence,
+            payload_cache=snapshot_payload_cache,
         )
@@ -4,25 +4,48 @@ import logging
 
 from litestar import Litestar
 from litestar.channels import ChannelsPlugin
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 
+from app.services.engagement.state import live_state_registry
+from app.ws.background.delta_coalescer import DeltaCoalescer
 from app.ws.background.factory import BroadcasterFactory
+from app.ws.background.meeting_end_scheduler import MeetingEndScheduler
 from app.ws.background.periodic_broadcaster import PeriodicBroadcaster
+from app.ws.background.sample_retention import SampleRetention
+from app.ws.background.sqlite_writer import SQLiteWriter
+from app.ws.background.write_behind import StatusWriteBehind
+from app.ws.repos.broadcast import BroadcastRepo
 
 logger = logging.getLogger(__name__)
 
 # Global periodic broadcaster instance
 _periodic_broadcaster: PeriodicBroadcaster | None = None
 
+# Global status write-behind queue (None unless enabled)
+_status_writer: StatusWriteBehind | None = None
+
+# Global SQLite writer thread (None unless running on a SQLite file)
+_sqlite_writer: SQLiteWriter | None = None
+
+# Global delta coalescer (None when coalescing is disabled)
+_delta_coalescer: DeltaCoalescer | None = None
+
+# Global meeting end scheduler (None when connections watch their meeting themselves)
+_meeting_end_scheduler: MeetingEndScheduler | None = None
+
+# Global sample retention job (None unless retention or partitioning is configured)
+_sample_retention: SampleRetention | None = None
+
 
 async def start_broadcaster(
-    app: Litestar, session_factory: sessionmaker, interval_seconds: int = 10
+    app: Litestar, session_factory: async_sessionmaker, interval_seconds: int = 10
 ) -> None:
     """Start background task for periodic engagement broadcasts.
 
     Args:
         app: Litestar application instance
-        session_factory: SQLAlchemy session factory
+        session_factory: SQLAlchemy async session factory
         interval_seconds: Broadcast interval in seconds
     """
     global _periodic_broadcaster
@@ -37,6 +60,7 @@ async def start_broadcaster(
         channels=channels,
         session_factory=session_factory,
         interval_seconds=interval_seconds,
+        coalescer=_delta_coalescer,
     )
 
     await _periodic_broadcaster.start()
@@ -53,3 +77,172 @@ async def stop_broadcaster(app: Litestar) -> None:
     if _periodic_broadcaster:
         await _periodic_broadcaster.stop()
         logger.info("Periodic broadcaster stopped")
+
+
+def get_status_writer() -> StatusWriteBehind | None:
+    """Return the running status write-behind queue, or None if disabled."""
+    return _status_writer
+
+
+async def start_status_writer(
+    session_factory: async_sessionmaker,
+    flush_interval_ms: int = 500,
+    max_batch: int = 500,
+    writer: SQLiteWriter | None = None,
+    max_pending: int = 10_000,
+) -> None:
+    """Start the write-behind queue for WS status updates.
+
+    Args:
+        session_factory: SQLAlchemy async session factory
+        flush_interval_ms: Maximum time an update stays buffered
+        max_batch: Pending entries that trigger an early flush
+        writer: Optional single-writer thread persisting the batches
+        max_pending: Maximum number of buffered updates
+    """
+    global _status_writer
+    _status_writer = StatusWriteBehind(
+        session_factory=session_factory,
+        flush_interval_seconds=flush_interval_ms / 1000,
+        max_batch=max_batch,
+        writer=writer,
+        max_pending=max_pending,
+    )
+    # Live state rebuilt while updates are buffered must still include them
+    live_state_registry.pending_source = _status_writer
+    await _status_writer.start()
+
+
+async def stop_status_writer() -> None:
+    """Stop the write-behind queue, flushing all buffered updates."""
+    global _status_writer
+    if _status_writer:
+        await _status_writer.stop()
+        live_state_registry.pending_source = None
+        _status_writer = None
+
+
+def get_sqlite_writer() -> SQLiteWriter | None:
+    """Return the running SQLite writer thread, or None if disabled."""
+    return _sqlite_writer
+
+
+async def start_sqlite_writer(session_factory: sessionmaker) -> None:
+    """Start the dedicated SQLite writer thread.
+
+    Args:
+        session_factory: SQLAlchemy sync session factory
+    """
+    global _sqlite_writer
+    _sqlite_writer = SQLiteWriter(session_factory)
+    _sqlite_writer.start()
+
+
+async def stop_sqlite_writer() -> None:
+    """Stop the SQLite writer thread after its queued jobs."""
+    global _sqlite_writer
+    if _sqlite_writer:
+        await _sqlite_writer.stop()
+        _sqlite_writer = None
+
+
+def get_delta_coalescer() -> DeltaCoalescer | None:
+    """Return the running delta coalescer, or None if disabled."""
+    return _delta_coalescer
+
+
+async def start_delta_coalescer(
+    app: Litestar, session_factory: async_sessionmaker, window_ms: int = 250
+) -> None:
+    """Start the per-meeting delta coalescer.
+
+    Args:
+        app: Litestar application instance
+        session_factory: SQLAlchemy async session factory
+        window_ms: Coalescing window in milliseconds
+    """
+    global _delta_coalescer
+
+    channels = app.plugins.get(ChannelsPlugin)
+    if not channels:
+        raise RuntimeError("ChannelsPlugin not found in application")
+
+    _delta_coalescer = DeltaCoalescer(
+        session_factory=session_factory,
+        broadcast_repo=BroadcastRepo(channels),
+        live_state=live_state_registry,
+        window_seconds=window_ms / 1000,
+    )
+    await _delta_coalescer.start()
+
+
+async def stop_delta_coalescer() -> None:
+    """Stop the delta coalescer, emitting all pending deltas."""
+    global _delta_coalescer
+    if _delta_coalescer:
+        await _delta_coalescer.stop()
+        _delta_coalescer = None
+
+
+def get_meeting_end_scheduler() -> MeetingEndScheduler | None:
+    """Return the running meeting end scheduler, or None if disabled."""
+    return _meeting_end_scheduler
+
+
+async def start_meeting_end_scheduler(close_batch_size: int = 100) -> None:
+    """Start the central scheduler closing connections when meetings end.
+
+    Args:
+        close_batch_size: Number of sockets closed concurrently per batch
+    """
+    global _meeting_end_scheduler
+    _meeting_end_scheduler = MeetingEndScheduler(close_batch_size=close_batch_size)
+    await _meeting_end_scheduler.start()
+
+
+async def stop_meeting_end_scheduler() -> None:
+    """Stop the meeting end scheduler."""
+    global _meeting_end_scheduler
+    if _meeting_end_scheduler:
+        await _meeting_end_scheduler.stop()
+        _meeting_end_scheduler = None
+
+
+def get_sample_retention() -> SampleRetention | None:
+    """Return the running sample retention job, or None if disabled."""
+    return _sample_retention
+
+
+async def start_sample_retention(
+    session_factory: async_sessionmaker,
+    retention_days: int,
+    months_ahead: int = 2,
+    interval_seconds: float = 3600.0,
+    writer: SQLiteWriter | None = None,
+) -> None:
+    """Start the job archiving old engagement samples.
+
+    Args:
+        session_factory: SQLAlchemy async session factory
+        retention_days: Age after which samples are archived; 0 keeps them
+        months_ahead: Monthly partitions kept ready after the current month
+        interval_seconds: Time between runs
+        writer: Optional single-writer thread running the deletes
+    """
+    global _sample_retention
+    _sample_retention = SampleRetention(
+        session_factory=session_factory,
+        retention_days=retention_days,
+        months_ahead=months_ahead,
+        interval_seconds=interval_seconds,
+        writer=writer,
+    )
+    await _sample_retention.start()
+
+
+async def stop_sample_retention() -> None:
+    """Stop the sample retention job."""
+    global _sample_retention
+    if _sample_retention:
+        await _sample_retention.stop()
+        _sample_retention = None
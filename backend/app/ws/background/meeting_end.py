@@ -0,0 +1,69 @@
+"""Single-flight registry for end-of-meeting jobs."""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class MeetingEndJobs:
+    """Runs the end-of-meeting job of each meeting at most once per process.
+
+    Every connection of a meeting watches for its end and they all wake up at
+    the same time. The first watcher starts the job as a task of its own; all
+    others (and any late watcher) await that task's result. Waiters are
+    shielded from each other, so a disconnecting watcher neither cancels the
+    job nor the result for the remaining ones.
+
+    A job that fails is forgotten so the next watcher can retry it. Results of
+    completed jobs are kept for the ``max_completed`` most recent meetings.
+    """
+
+    def __init__(self, max_completed: int = 1024) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            max_completed: Number of completed jobs remembered
+        """
+        self.max_completed = max_completed
+        self._jobs: OrderedDict[str, asyncio.Task] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    async def run(self, meeting_id: str, job: Callable[[], Coroutine[Any, Any, Any]]) -> Any:
+        """Run the meeting's job unless it already ran, and return its result.
+
+        Args:
+            meeting_id: ID of the meeting
+            job: Coroutine function performing the end-of-meeting work
+
+        Returns:
+            Result of the (single) job run for the meeting
+        """
+        task = self._jobs.get(meeting_id)
+        if task is None:
+            task = asyncio.create_task(job(), name=f"meeting-end-{meeting_id}")
+            task.add_done_callback(lambda done: self._on_done(meeting_id, done))
+            self._jobs[meeting_id] = task
+        return await asyncio.shield(task)
+
+    def _on_done(self, meeting_id: str, task: asyncio.Task) -> None:
+        """Forget failed jobs and bound the number of remembered results."""
+        if task.cancelled() or task.exception() is not None:
+            if self._jobs.get(meeting_id) is task:
+                del self._jobs[meeting_id]
+            if not task.cancelled():
+                logger.warning("End-of-meeting job for %s failed: %s", meeting_id, task.exception())
+            return
+
+        completed = [mid for mid, job in self._jobs.items() if job.done()]
+        for mid in completed[: max(len(completed) - self.max_completed, 0)]:
+            del self._jobs[mid]
+
+
+# Shared registry used by all meeting end watchers
+meeting_end_jobs = MeetingEndJobs()
@@ -0,0 +1,232 @@
+"""Central scheduler closing the connections of meetings that ended."""
+
+import asyncio
+import contextlib
+import heapq
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import anyio
+from litestar import WebSocket
+
+from app.models import Meeting
+from app.utils.metrics import Gauge, metrics
+
+logger = logging.getLogger(__name__)
+
+# Produces the end-of-meeting summary and broadcast for a meeting; returns the
+# ``meeting_ended`` message when it must be sent to the sockets directly
+EndMeetingCallback = Callable[[Meeting], Awaitable[dict[str, Any] | None]]
+
+
+@dataclass
+class _Registration:
+    """A connection waiting for its meeting to end."""
+
+    socket: WebSocket
+    is_closed: anyio.Event
+    on_end: EndMeetingCallback
+
+
+@dataclass
+class _MeetingTimer:
+    """Timer of one meeting and all connections registered for it."""
+
+    meeting: Meeting
+    deadline: float
+    registrations: dict[int, _Registration] = field(default_factory=dict)
+
+
+class MeetingEndScheduler:
+    """Fires one timer per meeting instead of one sleeping task per connection.
+
+    Connections register with their meeting's end time. Timers live in a heap
+    keyed by deadline and are served by a single task that sleeps until the
+    earliest one is due. When a meeting's timer fires, its end-of-meeting
+    callback runs once and the registered sockets are then closed in batches
+    of ``close_batch_size``, yielding to the event loop between batches. When
+    the callback returns a message (another worker broadcast
+    ``meeting_ended`` before these sockets subscribed to it), the message is
+    sent to every socket still open before it is closed.
+
+    The number of pending timers is published as the
+    ``meeting_end_pending_timers`` gauge.
+    """
+
+    def __init__(
+        self,
+        close_batch_size: int = 100,
+        gauge: Gauge | None = None,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            close_batch_size: Number of sockets closed concurrently per batch
+            gauge: Gauge receiving the number of pending timers
+            clock: Monotonic time in seconds; defaults to the event loop's clock
+        """
+        self.close_batch_size = max(close_batch_size, 1)
+        self.clock = clock
+        self.gauge = gauge or metrics.gauge(
+            "meeting_end_pending_timers", "Meetings with connections waiting for their end"
+        )
+        self._timers: dict[str, _MeetingTimer] = {}
+        self._heap: list[tuple[float, str]] = []
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._firing: set[asyncio.Task] = set()
+
+    @property
+    def pending_timers(self) -> int:
+        """Number of meetings waiting for their end."""
+        return len(self._timers)
+
+    async def start(self) -> None:
+        """Start the timer task."""
+        self._task = asyncio.create_task(self._run())
+        logger.info("Meeting end scheduler started (close_batch_size=%d)", self.close_batch_size)
+
+    async def stop(self) -> None:
+        """Stop the timer task and any meeting currently being closed."""
+        tasks = [task for task in (self._task, *self._firing) if task is not None]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._task = None
+        self._firing.clear()
+        logger.info("Meeting end scheduler stopped")
+
+    def register(
+        self,
+        meeting: Meeting,
+        socket: WebSocket,
+        is_closed: anyio.Event,
+        seconds_remaining: float,
+        on_end: EndMeetingCallback,
+    ) -> None:
+        """Register a connection to be closed when its meeting ends.
+
+        Args:
+            meeting: Meeting the connection belongs to
+            socket: WebSocket connection to close
+            is_closed: Event signalling that the connection is closed
+            seconds_remaining: Seconds until the meeting ends
+            on_end: Callback producing the end-of-meeting summary and broadcast
+        """
+        deadline = self._now() + seconds_remaining
+        timer = self._timers.get(meeting.id)
+        if timer is None:
+            timer = self._timers[meeting.id] = _MeetingTimer(meeting=meeting, deadline=deadline)
+            self._schedule(timer)
+        elif abs(timer.deadline - deadline) > 1.0:
+            # The meeting was rescheduled; older heap entries become stale
+            timer.meeting = meeting
+            timer.deadline = deadline
+            self._schedule(timer)
+        timer.registrations[id(socket)] = _Registration(socket, is_closed, on_end)
+        self.gauge.set(self.pending_timers)
+
+    def unregister(self, meeting_id: str, socket: WebSocket) -> None:
+        """Forget a connection, dropping its meeting's timer when it was the last one.
+
+        Args:
+            meeting_id: ID of the meeting
+            socket: WebSocket connection that closed
+        """
+        timer = self._timers.get(meeting_id)
+        if timer is None:
+            return
+        timer.registrations.pop(id(socket), None)
+        if not timer.registrations:
+            # Its heap entry is skipped once it comes up
+            del self._timers[meeting_id]
+            self.gauge.set(self.pending_timers)
+
+    def _now(self) -> float:
+        """Return the current time of the scheduler's clock."""
+        if self.clock is not None:
+            return self.clock()
+        return asyncio.get_running_loop().time()
+
+    def _schedule(self, timer: _MeetingTimer) -> None:
+        """Push a timer onto the heap, waking the timer task if it is now the earliest."""
+        heapq.heappush(self._heap, (timer.deadline, timer.meeting.id))
+        if self._heap[0][1] == timer.meeting.id:
+            self._wakeup.set()
+
+    def _pop_due(self, now: float) -> list[_MeetingTimer]:
+        """Remove and return all timers that are due, skipping stale heap entries."""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            deadline, meeting_id = heapq.heappop(self._heap)
+            timer = self._timers.get(meeting_id)
+            if timer is not None and timer.deadline == deadline:
+                del self._timers[meeting_id]
+                due.append(timer)
+        if due:
+            self.gauge.set(self.pending_timers)
+        return due
+
+    def _fire_due(self) -> list[asyncio.Task]:
+        """Start firing all due timers, each in a task of its own.
+
+        Returns:
+            The tasks ending the due meetings
+        """
+        tasks = []
+        for timer in self._pop_due(self._now()):
+            task = asyncio.create_task(self._fire(timer))
+            self._firing.add(task)
+            task.add_done_callback(self._firing.discard)
+            tasks.append(task)
+        return tasks
+
+    async def _run(self) -> None:
+        """Sleep until the earliest timer is due and fire all due timers."""
+        while True:
+            self._wakeup.clear()
+            self._fire_due()
+
+            timeout = self._heap[0][0] - self._now() if self._heap else None
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+
+    async def _fire(self, timer: _MeetingTimer) -> None:
+        """End a meeting: run its end-of-meeting callback, then close its sockets."""
+        registrations = [r for r in timer.registrations.values() if not r.is_closed.is_set()]
+        if not registrations:
+            return
+
+        logger.info(
+            "Meeting %s ended, closing %d connections", timer.meeting.id, len(registrations)
+        )
+        message = None
+        try:
+            message = await registrations[0].on_end(timer.meeting)
+        except Exception:
+            logger.exception("End-of-meeting callback failed for meeting %s", timer.meeting.id)
+
+        # Connections may have closed while the summary was produced
+        registrations = [r for r in registrations if not r.is_closed.is_set()]
+        for start in range(0, len(registrations), self.close_batch_size):
+            batch = registrations[start : start + self.close_batch_size]
+            for registration in batch:
+                registration.is_closed.set()
+            await asyncio.gather(
+                *(self._close(r.socket, message) for r in batch), return_exceptions=True
+            )
+            # Let the closed connections' handlers run before the next batch
+            await asyncio.sleep(0)
+
+    @staticmethod
+    async def _close(socket: WebSocket, message: dict[str, Any] | None) -> None:
+        """Send the ``meeting_ended`` message if given, then close the socket."""
+        if message is not None:
+            with contextlib.suppress(Exception):
+                await socket.send_json(message)
+        await socket.close(code=1000, reason="Meeting ended")
@@ -0,0 +1,121 @@
+"""Sharded ownership of meetings across periodic broadcaster workers."""
+
+import bisect
+import hashlib
+import logging
+import os
+import socket
+import uuid
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repos import AsyncBroadcastLeaseRepo
+
+logger = logging.getLogger(__name__)
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+def default_worker_id() -> str:
+    """Return an ID unique to this process (host, pid and a random suffix)."""
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+
+class ConsistentHashRing:
+    """Consistent hash ring mapping keys to nodes.
+
+    Each node is placed on the ring ``replicas`` times, so keys spread evenly
+    and adding or removing a node only moves the keys of that node.
+    """
+
+    def __init__(self, nodes: Iterable[str], replicas: int = 64) -> None:
+        """Build the ring.
+
+        Args:
+            nodes: Node IDs
+            replicas: Virtual points per node
+        """
+        points = sorted((_hash(f"{node}#{idx}"), node) for node in nodes for idx in range(replicas))
+        self._hashes = [point for point, _ in points]
+        self._nodes = [node for _, node in points]
+
+    def owner(self, key: str) -> str | None:
+        """Return the node owning a key, or None if the ring is empty."""
+        if not self._nodes:
+            return None
+        idx = bisect.bisect(self._hashes, _hash(key)) % len(self._hashes)
+        return self._nodes[idx]
+
+
+class MeetingOwnership:
+    """Decides which active meetings this worker broadcasts.
+
+    Every tick the worker heartbeats its membership, hashes the active meetings
+    onto a ring of the live workers and claims leases on the meetings that map
+    to itself. Leases on meetings that moved to another worker are released so
+    it can take them over. A lease is only granted when it is free, expired or
+    already held, so a meeting has at most one broadcaster at any time, even
+    while workers disagree about the membership.
+
+    When a worker dies its membership and leases expire after
+    ``lease_seconds`` and the remaining workers take over its meetings.
+
+    Heartbeats, claims and purges are timed by the database clock rather
+    than the worker's, so workers with skewed clocks agree on when a lease
+    expires.
+    """
+
+    def __init__(self, worker_id: str, lease_seconds: float = 30.0) -> None:
+        """Initialize ownership for a worker.
+
+        Args:
+            worker_id: ID of this worker, unique across the cluster
+            lease_seconds: Lifetime of the membership and of meeting leases
+        """
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+
+    async def acquire(
+        self, session: AsyncSession, meeting_ids: Sequence[str], now: datetime | None = None
+    ) -> set[str]:
+        """Heartbeat and return the meetings this worker owns for the current tick.
+
+        Args:
+            session: Async session (committed before returning)
+            meeting_ids: IDs of all active meetings
+            now: Current timestamp; defaults to the database clock
+
+        Returns:
+            IDs of the meetings this worker holds a lease on
+        """
+        repo = AsyncBroadcastLeaseRepo(session)
+        if now is None:
+            now = await repo.current_time()
+        expires_at = now + timedelta(seconds=self.lease_seconds)
+        await repo.heartbeat(self.worker_id, now, expires_at)
+        await repo.purge_expired(now - timedelta(seconds=self.lease_seconds))
+
+        ring = ConsistentHashRing(await repo.get_live_workers(now))
+        mine: list[str] = []
+        others: list[str] = []
+        for meeting_id in meeting_ids:
+            (mine if ring.owner(meeting_id) == self.worker_id else others).append(meeting_id)
+
+        await repo.release(others, self.worker_id)
+        owned = await repo.claim(mine, self.worker_id, now, expires_at)
+        await session.commit()
+
+        if len(owned) < len(mine):
+            logger.debug(
+                "Worker %s waits for %d leases to expire", self.worker_id, len(mine) - len(owned)
+            )
+        return owned
+
+    async def leave(self, session: AsyncSession) -> None:
+        """Deregister this worker so its meetings fail over immediately."""
+        await AsyncBroadcastLeaseRepo(session).remove_worker(self.worker_id)
+        await session.commit()
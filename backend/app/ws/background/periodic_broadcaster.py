@@ -3,52 +3,161 @@
 import asyncio
 import contextlib
 import logging
-from collections.abc import Callable
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, datetime
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.models import Meeting
-from app.repos import EngagementRepo, MeetingRepo, ParticipantRepo
+from app.repos import AsyncEngagementRepo, AsyncMeetingRepo, EngagementRepo, ParticipantRepo
+from app.schema.engagement.messages import RollupData
 from app.schema.websocket import MeetingStartedResponse
 from app.services import EngagementService
 from app.services.engagement.bucketing import BucketManager
 from app.services.engagement.smoothing.base import SmoothingStrategy
-from app.services.engagement.summary import SnapshotBuilder
+from app.services.engagement.state import LiveStateRegistry, MeetingEngagementState
+from app.services.engagement.summary import SnapshotBuilder, SnapshotCache
+from app.utils.datetime import ensure_utc
+from app.utils.metrics import metrics
+from app.ws.background.cadence import AdaptiveCadence
+from app.ws.background.ownership import MeetingOwnership
 from app.ws.repos.broadcast import BroadcastRepo
+from app.ws.repos.snapshot_payload import SnapshotPayloadCache
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _BroadcastMark:
+    """What the last periodic broadcast of a meeting was computed from."""
+
+    state: MeetingEngagementState
+    version: int
+    digest: int
+    bucket: datetime
+    sent_at: float
+
+    def matches(self, other: "_BroadcastMark") -> bool:
+        """Whether both marks describe the same rollup."""
+        if self.bucket != other.bucket:
+            return False
+        if self.state is other.state:
+            return self.version == other.version
+        return self.digest == other.digest
+
+
 class PeriodicBroadcaster:
     """Background service for periodic engagement broadcasts.
 
     Broadcasts engagement rollups for active meetings at regular intervals,
-    providing continuous state updates to all connected clients.
+    providing continuous state updates to all connected clients. With
+    ``ownership`` set, workers sharing a channels backend split the meetings
+    between them so each meeting is broadcast by exactly one worker.
+
+    Ticks run at a fixed rate and never overlap: a tick that overruns the
+    interval makes the broadcaster skip the ticks it missed. Rollups are
+    computed from the live state on a bounded thread pool so the event loop
+    keeps serving sockets; rollups not ready by the per-tick deadline are
+    skipped until the next tick. A delta coalescer on ``broadcast_repo``
+    computes its rollups on the same pool, with the same deadline. Tick
+    durations, skipped rollups and missed ticks are published as metrics.
+
+    With ``skip_unchanged``, a meeting is only broadcast when its live state
+    changed or a new bucket started since its last periodic broadcast, or
+    when ``heartbeat_seconds`` passed without one (so clients see the
+    meeting is alive). Quiet meetings thus cost one rollup per bucket instead
+    of one per tick.
+
+    With ``cadence``, meetings get individual intervals: the broadcaster
+    ticks at the cadence's minimum interval and only handles meetings that
+    are due, so busy meetings are updated faster and idle ones back off. The
+    current intervals are published as the ``broadcaster_meeting_intervals``
+    metric.
+
+    Active meetings are only reloaded (and leases renewed) every
+    ``refresh_seconds``; the ticks in between pick the due meetings from
+    that list and query nothing while their live states are warm.
     """
 
     def __init__(
         self,
-        session_factory: Callable[[], Session],
+        session_factory: async_sessionmaker[AsyncSession],
         broadcast_repo: BroadcastRepo,
         bucket_manager: BucketManager,
         smoothing_strategy: SmoothingStrategy,
-        interval_seconds: int = 10,
+        live_state: LiveStateRegistry,
+        interval_seconds: float = 10,
+        snapshot_cache: SnapshotCache | None = None,
+        ownership: MeetingOwnership | None = None,
+        max_workers: int = 4,
+        tick_deadline_seconds: float | None = None,
+        skip_unchanged: bool = True,
+        heartbeat_seconds: float = 60.0,
+        cadence: AdaptiveCadence | None = None,
+        payload_cache: SnapshotPayloadCache | None = None,
     ) -> None:
         """Initialize periodic broadcaster.
 
         Args:
-            session_factory: Factory function to create database sessions
+            session_factory: Factory for async database sessions
             broadcast_repo: Repository for broadcasting messages
             bucket_manager: Manager for time bucketing
             smoothing_strategy: Strategy for smoothing engagement data
+            live_state: Registry of live meeting states shared with WS handlers
             interval_seconds: Broadcast interval in seconds
+            snapshot_cache: Optional snapshot cache to evict ended meetings from
+            ownership: Optional sharding of meetings across workers; without it
+                this worker broadcasts every active meeting
+            max_workers: Threads computing rollups concurrently
+            tick_deadline_seconds: Time after a tick's start by which rollups
+                must be ready; defaults to half the interval
+            skip_unchanged: Suppress rollups of meetings that did not change
+            heartbeat_seconds: Broadcast unchanged meetings at least this often
+            cadence: Optional adaptive per-meeting intervals; without it every
+                meeting is handled every ``interval_seconds``
+            payload_cache: Optional cache of serialized snapshots to evict
+                ended meetings from
         """
         self.session_factory = session_factory
         self.broadcast_repo = broadcast_repo
         self.bucket_manager = bucket_manager
         self.smoothing_strategy = smoothing_strategy
+        self.live_state = live_state
         self.interval_seconds = interval_seconds
+        self.snapshot_cache = snapshot_cache
+        self.payload_cache = payload_cache
+        self.ownership = ownership
+        self.max_workers = max_workers
+        self.tick_deadline_seconds = (
+            tick_deadline_seconds if tick_deadline_seconds is not None else interval_seconds / 2
+        )
+        self.tick_duration = metrics.histogram(
+            "broadcaster_tick_seconds", "Duration of periodic broadcast ticks"
+        )
+        self.skipped_rollups = metrics.counter(
+            "broadcaster_rollups_skipped", "Rollups dropped for missing the tick deadline"
+        )
+        self.missed_ticks = metrics.counter(
+            "broadcaster_ticks_missed", "Ticks skipped because the previous tick overran"
+        )
+        self.skip_unchanged = skip_unchanged
+        self.heartbeat_seconds = heartbeat_seconds
+        self.suppressed_rollups = metrics.counter(
+            "broadcaster_rollups_suppressed", "Rollups not sent because the meeting was unchanged"
+        )
+        self.cadence = cadence
+        if cadence is not None:
+            metrics.collector(
+                "broadcaster_meeting_intervals",
+                cadence.stats,
+                "Current broadcast interval and participant count per meeting",
+            )
+        self._last_broadcast: dict[str, _BroadcastMark] = {}
+        self._active_meetings: list[Meeting] = []
+        self._refreshed_at: float | None = None
+        self._executor: ThreadPoolExecutor | None = None
         self._task: asyncio.Task | None = None
         self._notified_started_meetings: set[str] = (
             set()
@@ -56,8 +165,16 @@ class PeriodicBroadcaster:
 
     async def start(self) -> None:
         """Start periodic broadcasting task."""
+        self._refreshed_at = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="rollup"
+        )
+        if self.broadcast_repo.coalescer is not None:
+            self.broadcast_repo.coalescer.attach_pool(
+                self, min(self.tick_deadline_seconds, self.tick_seconds)
+            )
         self._task = asyncio.create_task(self._broadcast_loop())
-        logger.info("Periodic broadcaster started (interval=%ds)", self.interval_seconds)
+        logger.info("Periodic broadcaster started (tick=%.1fs)", self.tick_seconds)
 
     async def stop(self) -> None:
         """Stop periodic broadcasting task."""
@@ -65,36 +182,90 @@ class PeriodicBroadcaster:
             self._task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await self._task
+            if self.ownership is not None:
+                try:
+                    async with self.session_factory() as session:
+                        await self.ownership.leave(session)
+                except Exception:
+                    logger.exception("Failed to release broadcast leases")
             logger.info("Periodic broadcaster stopped")
+        if self.broadcast_repo.coalescer is not None:
+            self.broadcast_repo.coalescer.attach_pool(None)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @property
+    def tick_seconds(self) -> float:
+        """Time between two ticks of the broadcast loop."""
+        if self.cadence is not None:
+            return self.cadence.min_interval
+        return self.interval_seconds
+
+    @property
+    def refresh_seconds(self) -> float:
+        """Time between two reloads of the active meetings and lease renewals.
+
+        Follows the base interval, and stays well within the lease lifetime
+        so leases never expire while this worker is alive.
+        """
+        if self.ownership is not None:
+            return min(self.interval_seconds, self.ownership.lease_seconds / 2)
+        return self.interval_seconds
 
     async def _broadcast_loop(self) -> None:
         """Main loop: broadcast rollups for active meetings every N seconds."""
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time() + self.tick_seconds
         while True:
             try:
-                await asyncio.sleep(self.interval_seconds)
-                await self._broadcast_active_meetings()
+                await asyncio.sleep(max(next_tick - loop.time(), 0))
+                started = loop.time()
+                try:
+                    deadline = min(self.tick_deadline_seconds, self.tick_seconds)
+                    await self._broadcast_active_meetings(started + deadline)
+                finally:
+                    finished = loop.time()
+                    self.tick_duration.observe(finished - started)
+                    next_tick = self._next_tick(next_tick, finished)
             except asyncio.CancelledError:
                 break
             except Exception:
                 logger.exception("Error in periodic broadcaster")
 
-    async def _broadcast_active_meetings(self) -> None:
+    def _next_tick(self, previous: float, now: float) -> float:
+        """Return the next tick time, skipping (and counting) ticks already missed."""
+        tick = self.tick_seconds
+        next_tick = previous + tick
+        if next_tick <= now:
+            missed = int((now - next_tick) // tick) + 1
+            self.missed_ticks.inc(missed)
+            logger.warning("Periodic broadcast tick overran, skipping %d tick(s)", missed)
+            next_tick += missed * tick
+        return next_tick
+
+    async def _broadcast_active_meetings(self, deadline: float | None = None) -> None:
         """Query active meetings and broadcast rollups.
 
         Also notifies clients waiting in countdown mode when meetings start.
+
+        Args:
+            deadline: Event loop time by which rollups must be computed;
+                None waits for all of them
         """
-        session = self.session_factory()
-        try:
-            # Create repos and services for this broadcast cycle
-            meeting_repo = MeetingRepo(session)
-            participant_repo = ParticipantRepo(session)
-            engagement_repo = EngagementRepo(session)
+        async with self.session_factory() as session:
+            # Create repos and services for this broadcast cycle. Sync repos are
+            # bound to the async session's sync facade; rollups are served from
+            # the live state so they do not issue queries once it is warmed up.
+            participant_repo = ParticipantRepo(session.sync_session)
+            engagement_repo = EngagementRepo(session.sync_session)
 
             snapshot_builder = SnapshotBuilder(
                 engagement_repo=engagement_repo,
                 participant_repo=participant_repo,
                 bucket_manager=self.bucket_manager,
                 smoothing_strategy=self.smoothing_strategy,
+                live_state=self.live_state,
             )
 
             engagement_service = EngagementService(
@@ -104,23 +275,257 @@ class PeriodicBroadcaster:
                 snapshot_builder=snapshot_builder,
             )
 
-            # Get active meetings (has_started and not has_ended)
             now = datetime.now(tz=UTC)
-            active_meetings = meeting_repo.get_active_meetings(now)
+            ticked_at = time.monotonic()
+            # Live states are rebuilt from the meetings' participants, which must
+            # be current; refresh early when a state has to be rebuilt
+            if (
+                self._refreshed_at is None
+                or ticked_at - self._refreshed_at >= self.refresh_seconds
+                or any(self.live_state.get(meeting.id) is None for meeting in self._active_meetings)
+            ):
+                await self._refresh_active_meetings(session, now)
+                self._refreshed_at = ticked_at
+            # Meetings ending between two refreshes are dropped right away
+            active_meetings = [
+                meeting for meeting in self._active_meetings if ensure_utc(meeting.end_ts) > now
+            ]
 
+            bucket = self.bucket_manager.bucketize(now)
+            due_meetings = []
             for meeting in active_meetings:
-                try:
-                    # Check if meeting just started (wasn't in our set yet)
-                    if meeting.id not in self._notified_started_meetings:
+                # Check if meeting just started (wasn't in our set yet)
+                if meeting.id not in self._notified_started_meetings:
+                    try:
                         self._notify_meeting_started(meeting)
                         self._notified_started_meetings.add(meeting.id)
+                    except Exception:
+                        logger.exception("Failed to notify start of meeting %s", meeting.id)
+                if self.cadence is None or self.cadence.is_due(meeting.id, ticked_at):
+                    due_meetings.append(meeting)
+
+            states = await self._warm_live_states(session, due_meetings, bucket)
 
-                    # Broadcast regular rollup
-                    self._broadcast_meeting_rollup(meeting, now, engagement_service)
+            pending_rollups, marks = [], {}
+            for meeting in due_meetings:
+                try:
+                    state = states[meeting.id]
+                    if self.cadence is not None:
+                        present = self.cadence.present_participants(
+                            (participant.last_seen_at for participant in meeting.participants),
+                            now,
+                        )
+                        self.cadence.update(meeting.id, ticked_at, present, state.version)
+
+                    mark = self._mark(meeting.id, state, bucket)
+                    if self._is_unchanged(meeting.id, mark):
+                        self.suppressed_rollups.inc()
+                        continue
+
+                    if self.broadcast_repo.coalescer is not None or self._executor is None:
+                        # Broadcast regular rollup (or fold it into the coalescer)
+                        self._broadcast_meeting_rollup(meeting, now, engagement_service)
+                        self._last_broadcast[meeting.id] = mark
+                    else:
+                        pending_rollups.append(meeting)
+                        marks[meeting.id] = mark
                 except Exception:
                     logger.exception("Failed to broadcast rollup for meeting %s", meeting.id)
-        finally:
-            session.close()
+
+            if pending_rollups:
+                await self._publish_rollups(pending_rollups, bucket, deadline, marks)
+
+    async def _refresh_active_meetings(self, session: AsyncSession, now: datetime) -> None:
+        """Reload the active meetings, prune state of ended ones and renew leases.
+
+        Args:
+            session: Async session for this broadcast cycle
+            now: Current timestamp
+        """
+        # Get active meetings (has_started and not has_ended)
+        active_meetings = await AsyncMeetingRepo(session).get_active_meetings(now)
+
+        # Drop live state, delta sequences and snapshots of meetings that are no longer active
+        self.live_state.retain(meeting.id for meeting in active_meetings)
+        self.broadcast_repo.sequencer.retain(meeting.id for meeting in active_meetings)
+        if self.snapshot_cache is not None:
+            self.snapshot_cache.retain(meeting.id for meeting in active_meetings)
+        if self.payload_cache is not None:
+            self.payload_cache.retain(meeting.id for meeting in active_meetings)
+        active_ids = {meeting.id for meeting in active_meetings}
+        for meeting_id in [mid for mid in self._last_broadcast if mid not in active_ids]:
+            del self._last_broadcast[meeting_id]
+        if self.cadence is not None:
+            self.cadence.retain(active_ids)
+
+        if self.ownership is not None:
+            owned = await self.ownership.acquire(
+                session, [meeting.id for meeting in active_meetings]
+            )
+            active_meetings = [meeting for meeting in active_meetings if meeting.id in owned]
+        self._active_meetings = list(active_meetings)
+
+    def _mark(
+        self, meeting_id: str, state: MeetingEngagementState, bucket: datetime
+    ) -> _BroadcastMark:
+        """Describe the rollup a meeting's current state would produce.
+
+        The content digest is only recomputed when the state changed or was
+        replaced (e.g. rebuilt from the database).
+        """
+        last = self._last_broadcast.get(meeting_id)
+        if last is not None and last.state is state and last.version == state.version:
+            digest = last.digest
+        else:
+            digest = hash(frozenset(state.statuses.items()))
+        return _BroadcastMark(
+            state=state,
+            version=state.version,
+            digest=digest,
+            bucket=bucket,
+            sent_at=time.monotonic(),
+        )
+
+    def _is_unchanged(self, meeting_id: str, mark: _BroadcastMark) -> bool:
+        """Whether the meeting's last broadcast is current and no heartbeat is due."""
+        if not self.skip_unchanged:
+            return False
+        last = self._last_broadcast.get(meeting_id)
+        if last is None or not last.matches(mark):
+            return False
+        return mark.sent_at - last.sent_at < self.heartbeat_seconds
+
+    async def _publish_rollups(
+        self,
+        meetings: list[Meeting],
+        bucket: datetime,
+        deadline: float | None,
+        marks: dict[str, _BroadcastMark] | None = None,
+    ) -> None:
+        """Compute rollups on the thread pool and publish those ready by the deadline.
+
+        Args:
+            meetings: Meetings whose live state is warmed up
+            bucket: Current bucket (already normalized)
+            deadline: Event loop time by which rollups must be computed
+            marks: Marks taken before computing, recorded for published rollups
+        """
+        rollups = await self.compute_rollups(
+            [(meeting.id, bucket) for meeting in meetings], deadline
+        )
+        for meeting in meetings:
+            if meeting.id not in rollups:
+                continue
+            try:
+                rollup = rollups[meeting.id]
+                if rollup is not None:
+                    self.broadcast_repo.publish(meeting.id, rollup)
+                    if marks and meeting.id in marks:
+                        self._last_broadcast[meeting.id] = marks[meeting.id]
+            except Exception:
+                logger.exception("Failed to broadcast rollup for meeting %s", meeting.id)
+
+    async def compute_rollups(
+        self, requests: list[tuple[str, datetime]], deadline: float | None
+    ) -> dict[str, RollupData | None]:
+        """Compute rollups on the thread pool, dropping those that miss the deadline.
+
+        Rollups not ready by the deadline are cancelled and counted in the
+        ``broadcaster_rollups_skipped`` metric. Also used by the delta
+        coalescer, so both share the pool's bound.
+
+        Args:
+            requests: (meeting_id, bucket) pairs of warmed-up meetings
+            deadline: Event loop time by which rollups must be computed;
+                None waits for all of them
+
+        Returns:
+            Map of meeting_id -> rollup (None without live state) for the
+            rollups computed in time
+        """
+        if self._executor is None:
+            return {
+                meeting_id: self._compute_rollup(meeting_id, bucket)
+                for meeting_id, bucket in requests
+            }
+        loop = asyncio.get_running_loop()
+        futures = {
+            meeting_id: loop.run_in_executor(
+                self._executor, self._compute_rollup, meeting_id, bucket
+            )
+            for meeting_id, bucket in requests
+        }
+        timeout = None if deadline is None else max(deadline - loop.time(), 0)
+        _, not_done = await asyncio.wait(futures.values(), timeout=timeout)
+
+        if not_done:
+            for future in not_done:
+                future.cancel()
+            self.skipped_rollups.inc(len(not_done))
+            logger.warning(
+                "Skipped %d of %d rollups that missed the tick deadline",
+                len(not_done),
+                len(futures),
+            )
+
+        rollups: dict[str, RollupData | None] = {}
+        for meeting_id, future in futures.items():
+            if future in not_done:
+                continue
+            try:
+                rollups[meeting_id] = future.result()
+            except Exception:
+                logger.exception("Failed to compute rollup for meeting %s", meeting_id)
+        return rollups
+
+    def _compute_rollup(self, meeting_id: str, bucket: datetime) -> RollupData | None:
+        """Build a meeting's rollup from its live state (runs on the thread pool)."""
+        rollup = self.live_state.rollup(meeting_id, bucket)
+        if rollup is None:
+            return None
+        return RollupData(
+            meeting_id=meeting_id,
+            bucket=bucket,
+            overall=rollup.overall,
+            participants=rollup.participants,
+        )
+
+    async def _warm_live_states(
+        self, session: AsyncSession, meetings: list[Meeting], bucket: datetime
+    ) -> dict[str, MeetingEngagementState]:
+        """Return the live states of meetings, loading all missing ones at once.
+
+        Participants come with the active meetings; the latest sample of every
+        participant of all missing meetings is fetched with a single query, so
+        the number of queries per tick does not grow with the meetings.
+
+        Args:
+            session: Async session for this broadcast cycle
+            meetings: Meetings (with participants loaded) to warm up
+            bucket: Current bucket; later samples are ignored
+
+        Returns:
+            Map of meeting_id -> live state
+        """
+        states: dict[str, MeetingEngagementState] = {}
+        missing = []
+        for meeting in meetings:
+            state = self.live_state.get(meeting.id)
+            if state is None:
+                missing.append(meeting)
+            else:
+                states[meeting.id] = state
+        if not missing:
+            return states
+
+        latest = await AsyncEngagementRepo(session).get_latest_statuses(
+            [meeting.id for meeting in missing], end=bucket
+        )
+        for meeting in missing:
+            states[meeting.id] = self.live_state.load_statuses(
+                meeting.id, meeting.participants, latest.get(meeting.id, {})
+            )
+        return states
 
     def _notify_meeting_started(self, meeting: Meeting) -> None:
         """Notify clients waiting in countdown mode that the meeting has started.
@@ -0,0 +1,182 @@
+"""Retention of raw engagement samples."""
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.db_partitions import (
+    SAMPLES_TABLE,
+    add_months,
+    archive_name,
+    attached_partitions,
+    ensure_partitions,
+    is_partitioned,
+    month_start,
+)
+from app.repos import EngagementRepo
+from app.utils.metrics import metrics
+from app.ws.background.sqlite_writer import SQLiteWriter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RetentionReport:
+    """Outcome of one retention run."""
+
+    partitions_created: list[str] = field(default_factory=list)
+    partitions_archived: list[str] = field(default_factory=list)
+    samples_deleted: int = 0
+
+
+class SampleRetention:
+    """Keeps engagement_samples bounded by archiving old raw samples.
+
+    Raw samples only matter until a meeting is summarized; afterwards the
+    ``MeetingSummary`` row holds its aggregate data. Every run archives the
+    samples of summarized meetings older than ``retention_days``:
+
+    - On a partitioned PostgreSQL table, monthly partitions entirely older
+      than the cutoff are detached and renamed to
+      ``engagement_samples_archive_YYYYMM``, leaving the raw samples
+      available for export while hot queries no longer see them. Partitions
+      still holding samples of unsummarized meetings stay attached. Upcoming
+      monthly partitions are created ``months_ahead`` in advance.
+    - Otherwise the table is compacted: samples older than the cutoff are
+      deleted for meetings that have a summary.
+
+    Archived partitions and deleted samples are counted in the
+    ``sample_partitions_archived`` and ``samples_compacted`` metrics.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        retention_days: int,
+        months_ahead: int = 2,
+        interval_seconds: float = 3600.0,
+        writer: SQLiteWriter | None = None,
+    ) -> None:
+        """Initialize the retention job.
+
+        Args:
+            session_factory: Factory for async database sessions
+            retention_days: Age after which samples are archived; 0 keeps them
+            months_ahead: Monthly partitions kept ready after the current month
+            interval_seconds: Time between runs
+            writer: Optional single-writer thread running the deletes
+        """
+        self.session_factory = session_factory
+        self.retention_days = retention_days
+        self.months_ahead = months_ahead
+        self.interval_seconds = interval_seconds
+        self.writer = writer
+        self.partitions_archived = metrics.counter(
+            "sample_partitions_archived", "Sample partitions detached into archive tables"
+        )
+        self.samples_compacted = metrics.counter(
+            "samples_compacted", "Raw samples deleted after their meeting was summarized"
+        )
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Start the periodic retention task."""
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info(
+            "Sample retention started (retention_days=%d, interval=%.0fs)",
+            self.retention_days,
+            self.interval_seconds,
+        )
+
+    async def stop(self) -> None:
+        """Stop the retention task."""
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        logger.info("Sample retention stopped")
+
+    async def run_once(self, now: datetime | None = None) -> RetentionReport:
+        """Run one retention pass in its own transaction.
+
+        Args:
+            now: Current time (defaults to the wall clock)
+
+        Returns:
+            What was created, archived or deleted
+        """
+        now = now or datetime.now(tz=UTC)
+        if self.writer is not None:
+            report = await self.writer.run(lambda session: self._apply(session, now))
+        else:
+            async with self.session_factory() as session:
+                report = await session.run_sync(self._apply, now)
+                await session.commit()
+
+        self.partitions_archived.inc(len(report.partitions_archived))
+        self.samples_compacted.inc(report.samples_deleted)
+        if report.partitions_created or report.partitions_archived or report.samples_deleted:
+            logger.info(
+                "Sample retention: created %s, archived %s, deleted %d samples",
+                report.partitions_created,
+                report.partitions_archived,
+                report.samples_deleted,
+            )
+        return report
+
+    def _apply(self, session: Session, now: datetime) -> RetentionReport:
+        """Maintain partitions, then archive or compact expired samples."""
+        report = RetentionReport()
+        conn = session.connection()
+        partitioned = is_partitioned(conn)
+        if partitioned:
+            report.partitions_created = ensure_partitions(
+                conn, now, add_months(month_start(now), self.months_ahead)
+            )
+        if self.retention_days <= 0:
+            return report
+
+        cutoff = now - timedelta(days=self.retention_days)
+        if partitioned:
+            report.partitions_archived = self._archive_partitions(session, cutoff)
+        else:
+            report.samples_deleted = EngagementRepo(session).delete_summarized_before(cutoff)
+        return report
+
+    @staticmethod
+    def _archive_partitions(session: Session, cutoff: datetime) -> list[str]:
+        """Detach the monthly partitions that ended before the cutoff."""
+        conn = session.connection()
+        archived = []
+        for name, month in sorted(attached_partitions(conn).items(), key=lambda item: item[1]):
+            if add_months(month, 1) > cutoff:
+                continue
+            unsummarized = conn.execute(
+                text(
+                    f"SELECT EXISTS (SELECT 1 FROM {name} s WHERE NOT EXISTS "
+                    "(SELECT 1 FROM meeting_summaries ms WHERE ms.meeting_id = s.meeting_id))"
+                )
+            ).scalar()
+            if unsummarized:
+                logger.warning("Keeping partition %s: it holds unsummarized meetings", name)
+                continue
+            conn.execute(text(f"ALTER TABLE {SAMPLES_TABLE} DETACH PARTITION {name}"))
+            conn.execute(text(f"ALTER TABLE {name} RENAME TO {archive_name(month)}"))
+            archived.append(name)
+        return archived
+
+    async def _run_loop(self) -> None:
+        """Run a retention pass at the configured interval."""
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("Error in sample retention")
+            await asyncio.sleep(self.interval_seconds)
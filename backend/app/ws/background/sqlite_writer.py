@@ -0,0 +1,111 @@
+"""Dedicated writer thread serializing SQLite write transactions."""
+
+import asyncio
+import logging
+import queue
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Job executed on the writer thread with its session
+WriteJob = Callable[[Session], Any]
+
+_STOP = object()
+
+
+class SQLiteWriter:
+    """Runs write jobs one at a time on a dedicated thread.
+
+    SQLite allows a single writer at a time. Funnelling writes through one
+    thread and session means they queue in memory instead of competing for
+    the database lock. Each job runs in its own transaction that is
+    committed when the job returns and rolled back when it raises.
+
+    The hot-path writes are routed through the writer: status updates (or
+    their write-behind batches), pings and the sample retention deletes.
+    Joins, leaves and summaries still commit from their own sessions and rely
+    on the busy timeout when they contend with it.
+
+    The number of queued jobs is published as the ``sqlite_writer_queue_depth``
+    gauge.
+    """
+
+    def __init__(self, session_factory: sessionmaker[Session]) -> None:
+        """Initialize the writer.
+
+        Args:
+            session_factory: Factory for sync database sessions
+        """
+        self.session_factory = session_factory
+        self._queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        metrics.collector(
+            "sqlite_writer_queue_depth", self._queue.qsize, "Write jobs waiting for the writer"
+        )
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        self._thread = threading.Thread(target=self._run, name="sqlite-writer", daemon=True)
+        self._thread.start()
+        logger.info("SQLite writer started")
+
+    async def stop(self) -> None:
+        """Run the jobs queued so far, then stop the writer thread."""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        await asyncio.to_thread(self._thread.join)
+        self._thread = None
+        logger.info("SQLite writer stopped")
+
+    def submit(self, job: Callable[[Session], T]) -> "Future[T]":
+        """Queue a write job.
+
+        Args:
+            job: Callable receiving the writer's session
+
+        Returns:
+            Future resolved with the job's result once it is committed
+        """
+        if self._thread is None:
+            raise RuntimeError("SQLite writer is not running")
+        future: Future[T] = Future()
+        self._queue.put((job, future))
+        return future
+
+    async def run(self, job: Callable[[Session], T]) -> T:
+        """Queue a write job and wait until it is committed.
+
+        Args:
+            job: Callable receiving the writer's session
+
+        Returns:
+            The job's result
+        """
+        return await asyncio.wrap_future(self.submit(job))
+
+    def _run(self) -> None:
+        """Execute queued jobs until the stop marker is reached."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            job, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                with self.session_factory() as session, session.begin():
+                    result = job(session)
+            except Exception as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
@@ -0,0 +1,321 @@
+"""Write-behind batching of participant status updates."""
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.repos import AsyncEngagementRepo, AsyncParticipantRepo, EngagementRepo, ParticipantRepo
+from app.utils.metrics import metrics
+from app.ws.background.sqlite_writer import SQLiteWriter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PendingStatus:
+    """A buffered status update waiting to be persisted."""
+
+    meeting_id: str
+    participant_id: str
+    bucket: datetime
+    status: str
+    # Failed flushes this entry was part of
+    attempts: int = 0
+
+
+class StatusWriteBehind:
+    """Buffers status updates in memory and persists them in batches.
+
+    Only the last status of a participant within a bucket matters, so updates
+    are coalesced per (participant, bucket). Each flush writes all pending
+    samples with one multi-row upsert plus one executemany UPDATE each of the
+    participants' last status and last seen time, in a single transaction.
+
+    Flushes happen every ``flush_interval_seconds``, as soon as ``max_batch``
+    distinct entries are pending, on demand via ``flush()`` and on ``stop()``.
+    With a ``writer`` the batches are written by its dedicated thread instead
+    of an async session.
+
+    When a batch fails, its entries are retried one by one so a bad row (e.g.
+    the sample of a deleted participant) cannot block the others. Entries that
+    keep failing are dropped after ``max_attempts`` flushes, and at most
+    ``max_pending`` entries are buffered (the oldest are dropped first); both
+    are logged and counted in the ``write_behind_dropped`` metric.
+
+    Buffered entries are not in the database yet: ``pending_samples`` exposes
+    them so live state rebuilt in the meantime can include them.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        flush_interval_seconds: float = 0.5,
+        max_batch: int = 500,
+        writer: SQLiteWriter | None = None,
+        max_attempts: int = 5,
+        max_pending: int = 10_000,
+    ) -> None:
+        """Initialize the write-behind queue.
+
+        Args:
+            session_factory: Factory for async database sessions
+            flush_interval_seconds: Upper bound on how long an update stays buffered
+            max_batch: Number of pending entries that triggers an early flush
+            writer: Optional single-writer thread persisting the batches
+            max_attempts: Failed flushes after which an entry is dropped
+            max_pending: Maximum number of buffered entries
+        """
+        self.session_factory = session_factory
+        self.writer = writer
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_batch = max_batch
+        self.max_attempts = max(max_attempts, 1)
+        self.max_pending = max(max_pending, 1)
+        self.dropped = metrics.counter(
+            "write_behind_dropped", "Buffered status updates dropped without being persisted"
+        )
+        self._pending: dict[tuple[str, datetime], PendingStatus] = {}
+        # Entries of the flush in progress, until they are committed
+        self._in_flight: dict[tuple[str, datetime], PendingStatus] = {}
+        self._last_status: dict[str, str] = {}
+        self._last_seen: dict[str, datetime] = {}
+        self._batch_full = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def pending_count(self) -> int:
+        """Number of distinct (participant, bucket) entries awaiting a flush."""
+        return len(self._pending)
+
+    def enqueue(
+        self,
+        meeting_id: str,
+        participant_id: str,
+        bucket: datetime,
+        status: str,
+        seen_at: datetime | None = None,
+    ) -> None:
+        """Buffer a status update, replacing any pending one for the same bucket.
+
+        Args:
+            meeting_id: ID of the meeting
+            participant_id: ID of the participant
+            bucket: Bucketed timestamp of the update
+            status: New engagement status
+            seen_at: When the update was received, persisted as last_seen_at
+        """
+        key = (participant_id, bucket)
+        self._pending.pop(key, None)
+        self._pending[key] = PendingStatus(
+            meeting_id=meeting_id, participant_id=participant_id, bucket=bucket, status=status
+        )
+        self._last_status[participant_id] = status
+        if seen_at is not None:
+            self._remember_seen(participant_id, seen_at)
+        self._enforce_limit()
+        if len(self._pending) >= self.max_batch:
+            self._batch_full.set()
+
+    def pending_samples(self, meeting_id: str) -> list[tuple[str, datetime, str]]:
+        """Return the buffered samples of a meeting that are not committed yet.
+
+        Safe to call from worker threads.
+
+        Args:
+            meeting_id: ID of the meeting
+
+        Returns:
+            (participant_id, bucket, status) tuples ordered by bucket
+        """
+        entries = list(self._in_flight.values()) + list(self._pending.values())
+        return sorted(
+            (
+                (entry.participant_id, entry.bucket, entry.status)
+                for entry in entries
+                if entry.meeting_id == meeting_id
+            ),
+            key=lambda sample: sample[1],
+        )
+
+    async def start(self) -> None:
+        """Start the periodic flush task."""
+        self._task = asyncio.create_task(self._flush_loop())
+        logger.info(
+            "Status write-behind started (interval=%.3fs, max_batch=%d)",
+            self.flush_interval_seconds,
+            self.max_batch,
+        )
+
+    async def stop(self) -> None:
+        """Stop the flush task and persist everything still buffered."""
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+        logger.info("Status write-behind stopped")
+
+    async def flush(self) -> int:
+        """Persist all buffered updates in one transaction.
+
+        If the batch fails, its entries are written one by one; entries that
+        still fail are put back (without overwriting newer updates) and
+        retried on the next flush, up to ``max_attempts`` times.
+
+        Returns:
+            Number of samples written
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            pending, self._pending = self._pending, {}
+            last_status, self._last_status = self._last_status, {}
+            last_seen, self._last_seen = self._last_seen, {}
+            self._in_flight = pending
+            self._batch_full.clear()
+            try:
+                try:
+                    await self._persist(list(pending.values()), last_status, last_seen)
+                    written = len(pending)
+                except Exception:
+                    logger.warning(
+                        "Flushing %d buffered status samples failed; retrying one by one",
+                        len(pending),
+                        exc_info=True,
+                    )
+                    written = await self._persist_individually(pending, last_status, last_seen)
+            finally:
+                self._in_flight = {}
+
+            logger.debug("Flushed %d buffered status samples", written)
+            return written
+
+    async def _persist(
+        self,
+        entries: list[PendingStatus],
+        last_status: dict[str, str],
+        last_seen: dict[str, datetime],
+    ) -> None:
+        """Write samples, last statuses and last seen times in one transaction."""
+        rows = [
+            {
+                "meeting_id": entry.meeting_id,
+                "participant_id": entry.participant_id,
+                "bucket": entry.bucket,
+                "status": entry.status,
+            }
+            for entry in entries
+        ]
+        if self.writer is not None:
+            await self.writer.run(
+                lambda session: self._write_batch(session, rows, last_status, last_seen)
+            )
+            return
+        async with self.session_factory() as session:
+            await AsyncEngagementRepo(session).bulk_upsert_samples(rows)
+            participant_repo = AsyncParticipantRepo(session)
+            await participant_repo.bulk_update_last_status(last_status)
+            await participant_repo.bulk_update_last_seen(last_seen)
+            await session.commit()
+
+    async def _persist_individually(
+        self,
+        pending: dict[tuple[str, datetime], PendingStatus],
+        last_status: dict[str, str],
+        last_seen: dict[str, datetime],
+    ) -> int:
+        """Write each entry in its own transaction, re-buffering the ones that fail.
+
+        Returns:
+            Number of samples written
+        """
+        written = 0
+        retry: dict[tuple[str, datetime], PendingStatus] = {}
+        for key, entry in pending.items():
+            pid = entry.participant_id
+            status = last_status.get(pid)
+            seen_at = last_seen.get(pid)
+            try:
+                await self._persist(
+                    [entry],
+                    {pid: status} if status is not None else {},
+                    {pid: seen_at} if seen_at is not None else {},
+                )
+                written += 1
+            except Exception as exc:
+                entry.attempts += 1
+                if entry.attempts >= self.max_attempts:
+                    self.dropped.inc()
+                    logger.error(
+                        "Dropping status sample of participant %s at %s after %d attempts: %s",
+                        entry.participant_id,
+                        entry.bucket,
+                        entry.attempts,
+                        exc,
+                    )
+                    continue
+                retry[key] = entry
+                if status is not None:
+                    self._last_status.setdefault(pid, status)
+                if seen_at is not None:
+                    self._remember_seen(pid, seen_at)
+        # Retries go first (oldest); newer updates for the same bucket win over them
+        retry.update(self._pending)
+        self._pending = retry
+        self._enforce_limit()
+        return written
+
+    def _remember_seen(self, participant_id: str, seen_at: datetime) -> None:
+        """Keep the latest time a participant was seen."""
+        previous = self._last_seen.get(participant_id)
+        if previous is None or seen_at > previous:
+            self._last_seen[participant_id] = seen_at
+
+    def _enforce_limit(self) -> None:
+        """Drop the oldest buffered entries beyond ``max_pending``."""
+        overflow = len(self._pending) - self.max_pending
+        if overflow <= 0:
+            return
+        for key in list(self._pending)[:overflow]:
+            del self._pending[key]
+        self.dropped.inc(overflow)
+        logger.error(
+            "Write-behind buffer full (%d entries); dropped the %d oldest status samples",
+            self.max_pending,
+            overflow,
+        )
+
+    @staticmethod
+    def _write_batch(
+        session: Session,
+        rows: list[dict[str, Any]],
+        last_status: dict[str, str],
+        last_seen: dict[str, datetime],
+    ) -> None:
+        """Write a batch with sync repos (on the writer thread)."""
+        EngagementRepo(session).bulk_upsert_samples(rows)
+        participant_repo = ParticipantRepo(session)
+        participant_repo.bulk_update_last_status(last_status)
+        participant_repo.bulk_update_last_seen(last_seen)
+
+    async def _flush_loop(self) -> None:
+        """Flush at the configured interval, or earlier when a batch fills up."""
+        while True:
+            try:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._batch_full.wait(), timeout=self.flush_interval_seconds
+                    )
+                await self.flush()
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                logger.exception("Error flushing buffered status updates")
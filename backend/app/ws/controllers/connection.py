@@ -15,11 +15,11 @@ from litestar import WebSocket, websocket_listener
 from litestar.channels import ChannelsPlugin
 from litestar.exceptions import WebSocketDisconnect
 from litestar.handlers import send_websocket_stream
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.repos import MeetingRepo
+from app.repos import AsyncMeetingRepo
 from app.schema.websocket import ErrorResponse
-from app.services import MeetingService
+from app.ws.background import get_meeting_end_scheduler
 from app.ws.controllers.routing import MessageRouter
 from app.ws.transport.lifecycle import (
     ConnectionValidator,
@@ -33,25 +33,28 @@ logger = logging.getLogger(__name__)
 async def _setup_connection(
     socket: WebSocket,
     channels: ChannelsPlugin,
-    session: Session,
+    session_factory: async_sessionmaker[AsyncSession],
 ):
     """Setup and validate WebSocket connection.
 
+    The meeting is loaded in a short-lived session; the connection keeps no
+    session of its own.
+
     Returns:
         LifecycleResult if successful, None if connection rejected
     """
-    coordinator = LifecycleCoordinator(
-        connection_validator=ConnectionValidator(MeetingTimingValidator()),
-        meeting_service=MeetingService(MeetingRepo(session)),
-    )
-
-    result = await coordinator.setup(socket, channels, session)
+    async with session_factory() as session:
+        coordinator = LifecycleCoordinator(
+            connection_validator=ConnectionValidator(MeetingTimingValidator()),
+            meeting_repo=AsyncMeetingRepo(session),
+        )
+        result = await coordinator.setup(socket, channels, session_factory)
     if not result:
         return None  # Connection rejected, response already sent
 
-    # Store context and factory on socket state for handler access
+    # Store context and lifecycle on socket state for handler access
     socket.state.ws_context = result.context
-    socket.state.service_factory = result.factory
+    socket.state.ws_lifecycle = result
 
     return result
 
@@ -74,7 +77,17 @@ def _start_background_tasks(task_group: anyio.abc.TaskGroup, result, socket: Web
         ),
     )
 
-    # Start meeting end watcher task
+    # Register with the central meeting end scheduler, or watch the meeting end directly
+    scheduler = get_meeting_end_scheduler()
+    if scheduler is not None:
+        scheduler.register(
+            result.context.meeting,
+            socket,
+            result.is_closed,
+            result.seconds_remaining,
+            result.watcher.end_meeting,
+        )
+        return
     task_group.start_soon(
         result.watcher.watch,
         result.context.meeting,
@@ -84,41 +97,88 @@ def _start_background_tasks(task_group: anyio.abc.TaskGroup, result, socket: Web
     )
 
 
-def _handle_disconnect(result, session: Session) -> None:
+async def _handle_disconnect(result) -> None:
     """Handle connection cleanup on disconnect.
 
     Args:
-        result: LifecycleResult with context and factory
-        session: Database session for committing changes
+        result: LifecycleResult with context and service factory
     """
     result.is_closed.set()
+    scheduler = get_meeting_end_scheduler()
+    if scheduler is not None:
+        scheduler.unregister(result.context.meeting.id, result.context.socket)
 
-    # Handle participant leave via service
-    leave_service = result.factory.create_leave_service()
-    leave_service.handle_leave(result.context)
-
-    # Commit any pending changes (e.g., last_seen_at updates)
+    # Handle participant leave via service; the unit of work commits pending
+    # changes (e.g., last_seen_at updates)
     try:
-        session.commit()
+        async with result.context.unit_of_work() as session:
+            leave_service = result.create_factory(session).create_leave_service()
+            await leave_service.handle_leave(result.context)
     except Exception:
-        session.rollback()
+        logger.exception("Failed to persist leave for meeting %s", result.context.meeting.id)
+
+
+async def _handle_message(message: dict[str, Any], context, lifecycle):
+    """Route one message in its own unit of work.
+
+    Args:
+        message: Decoded message from the client
+        context: Connection context
+        lifecycle: LifecycleResult creating the unit of work's service factory
+
+    Returns:
+        The router's response, or None if no direct response is needed
+    """
+    router = MessageRouter()
+    async with context.unit_of_work(
+        load_participant=_loads_participant(message.get("type"), lifecycle)
+    ) as session:
+        response = await router.route_message(message, context, lifecycle.create_factory(session))
+        if isinstance(response, ErrorResponse):
+            # The router turns failures into errors; don't commit their partial work
+            await context.rollback()
+    return response
+
+
+def _loads_participant(message_type: Any, lifecycle) -> bool:
+    """Whether a message needs the participant loaded into its unit of work.
+
+    Status updates and pings persisted by a background writer only need the
+    participant's ID; skipping the load keeps them off the unit of work's
+    session entirely.
+
+    Args:
+        message_type: Type of the decoded message
+        lifecycle: LifecycleResult holding the connection's writers
+
+    Returns:
+        False if the message's writes bypass the unit of work
+    """
+    if message_type == "status":
+        return lifecycle.status_writer is None and lifecycle.sqlite_writer is None
+    if message_type == "ping":
+        return lifecycle.sqlite_writer is None
+    return True
 
 
 @asynccontextmanager
 async def meeting_stream_lifespan(
     socket: WebSocket,
     channels: ChannelsPlugin,
-    session: Session,
+    async_session_factory: async_sessionmaker[AsyncSession],
 ) -> AsyncGenerator[None, Any]:
     """WebSocket connection lifespan manager.
 
     Handles connection setup, message streaming, and cleanup.
 
+    Database work happens in short units of work (one per message), so an
+    open socket does not hold a pooled database connection.
+
     Note: Initial snapshot is returned in JoinedResponse to the joining client.
     Deltas are broadcast to other participants on join/leave/status changes.
     """
     # Setup and validate connection
-    result = await _setup_connection(socket, channels, session)
+    result = await _setup_connection(socket, channels, async_session_factory)
     if not result:
         return
 
@@ -132,7 +192,7 @@ async def meeting_stream_lifespan(
             except WebSocketDisconnect:
                 logger.info("WS disconnect meeting_id=%s", result.context.meeting.id)
             finally:
-                _handle_disconnect(result, session)
+                await _handle_disconnect(result)
 
     except Exception as e:
         logger.exception("WS task group error: %s", e)
@@ -146,7 +206,8 @@ async def meeting_stream_lifespan(
 async def meeting_stream_controller(data: str, socket: WebSocket) -> str:
     """Handle incoming WebSocket messages using router.
 
-    Routes messages to appropriate services via the message router.
+    Routes messages to appropriate services via the message router, each in
+    its own unit of work.
     Broadcast events are streamed to the client via the lifespan's subscription.
 
     Args:
@@ -167,11 +228,9 @@ async def meeting_stream_controller(data: str, socket: WebSocket) -> str:
         return str(error.model_dump_json())
 
     try:
-        context = socket.state.ws_context
-        factory = socket.state.service_factory
-
-        router = MessageRouter()
-        response = await router.route_message(message, context, factory)
+        response = await _handle_message(
+            message, socket.state.ws_context, socket.state.ws_lifecycle
+        )
         if response:
             return str(response.model_dump_json())
     except Exception as exc:  # pragma: no cover - defensive
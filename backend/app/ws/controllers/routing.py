@@ -5,20 +5,32 @@ messages to appropriate service handlers using discriminated unions.
 """
 
 import logging
-from typing import Any
+from typing import Annotated, Any, TypeAlias, cast
 
-from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
-from app.schema.websocket import ErrorResponse, JoinRequest, PingRequest, StatusUpdateRequest
+from app.schema.websocket import (
+    ErrorResponse,
+    JoinRequest,
+    PingRequest,
+    ResyncRequest,
+    StatusUpdateRequest,
+)
+from app.ws.repos.encoding import PreEncodedResponse
 from app.ws.shared.factory import WSServiceFactory
 from app.ws.transport.context import WSContext
 
 logger = logging.getLogger(__name__)
 
-# Create TypeAdapter for the discriminated union
-ws_request_adapter: TypeAdapter[JoinRequest | StatusUpdateRequest | PingRequest] = TypeAdapter(
-    JoinRequest | StatusUpdateRequest | PingRequest
-)
+# Incoming requests, discriminated by their ``type`` field
+WSRequest: TypeAlias = Annotated[
+    JoinRequest | StatusUpdateRequest | PingRequest | ResyncRequest,
+    Field(discriminator="type"),
+]
+
+# Create TypeAdapter for the discriminated union. Without TypeForm support,
+# mypy only accepts classes here, so the union is passed as its type.
+ws_request_adapter: TypeAdapter[WSRequest] = TypeAdapter(cast("type[WSRequest]", WSRequest))
 
 
 class MessageRouter:
@@ -36,7 +48,7 @@ class MessageRouter:
         message: dict[str, Any],
         context: WSContext,
         factory: WSServiceFactory,
-    ) -> BaseModel | None:
+    ) -> BaseModel | PreEncodedResponse | None:
         """Route WebSocket message to appropriate service.
 
         Args:
@@ -45,7 +57,8 @@ class MessageRouter:
             factory: Service factory for getting appropriate service
 
         Returns:
-            Pydantic response model, or None if no direct response needed
+            Pydantic response model (or pre-encoded response), or None if no
+            direct response needed
         """
         try:
             # 1. Parse & validate structure (discriminated union auto-routes)
@@ -1,6 +1,7 @@
 """WebSocket repositories for low-level channel operations."""
 
 from app.ws.repos.broadcast import BroadcastRepo
+from app.ws.repos.snapshot_payload import SnapshotPayloadCache
 from app.ws.repos.subscription import SubscriptionRepo
 
-__all__ = ["BroadcastRepo", "SubscriptionRepo"]
+__all__ = ["BroadcastRepo", "SnapshotPayloadCache", "SubscriptionRepo"]
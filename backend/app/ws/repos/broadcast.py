@@ -12,12 +12,21 @@ from typing import TYPE_CHECKING
 from litestar.channels import ChannelsPlugin
 
 from app.models import Meeting
-from app.schema.engagement.messages import DeltaMessage, RollupData
+from app.schema.engagement.messages import (
+    DeltaMessage,
+    RollupData,
+    SparseDeltaMessage,
+    SparseRollupData,
+)
 from app.schema.engagement.models import EngagementSummary
 from app.schema.websocket import SnapshotMessage
+from app.ws.repos.channel_names import delta_channel, meeting_channel
+from app.ws.repos.encoding import encode_message
+from app.ws.repos.sequencer import DeltaSequencer, PublishedRollup, delta_sequencer
 
 if TYPE_CHECKING:
     from app.services import EngagementService
+    from app.ws.background.delta_coalescer import DeltaCoalescer
 
 logger = logging.getLogger(__name__)
 
@@ -30,39 +39,100 @@ class BroadcastRepo:
     naming conventions and message serialization.
     """
 
-    def __init__(self, channels: ChannelsPlugin) -> None:
+    def __init__(
+        self,
+        channels: ChannelsPlugin,
+        coalescer: "DeltaCoalescer | None" = None,
+        sequencer: DeltaSequencer = delta_sequencer,
+    ) -> None:
         """Initialize broadcast repo with channels plugin.
 
         Args:
             channels: Litestar ChannelsPlugin instance for pub/sub operations
+            coalescer: Optional delta coalescer; when set, rollups are batched
+                per meeting instead of being published immediately
+            sequencer: Sequencer for sparse (protocol v2) deltas
         """
         self.channels = channels
+        self.coalescer = coalescer
+        self.sequencer = sequencer
 
     def publish(self, meeting_id: str, data: EngagementSummary | RollupData) -> None:
         """Publish engagement data to meeting subscribers.
 
         Automatically wraps the data in the appropriate message type based on
         the data structure:
-        - EngagementSummary -> SnapshotMessage (complete historical data)
-        - RollupData -> DeltaMessage (incremental update)
+        - EngagementSummary -> SnapshotMessage (complete historical data) on
+          the meeting channel
+        - RollupData -> DeltaMessage (incremental update) on the full delta
+          channel, and a SparseDeltaMessage with only the changed participants
+          on the sparse delta channel
 
         Args:
             meeting_id: ID of the meeting to broadcast to
             data: Engagement data to broadcast (summary or rollup)
         """
-        # Wrap data in appropriate message type
-        message: SnapshotMessage | DeltaMessage
+        # Serialized once; every subscriber receives the same bytes
         if isinstance(data, EngagementSummary):
-            message = SnapshotMessage(data=data)
-        else:  # RollupData
-            message = DeltaMessage(data=data)
+            self.channels.publish(
+                data=encode_message(SnapshotMessage(data=data)),
+                channels=[meeting_channel(meeting_id)],
+            )
+            logger.debug("Published snapshot to meeting %s", meeting_id)
+            return
 
         self.channels.publish(
-            data=message.model_dump_json(),
-            channels=[f"meeting:{meeting_id}"],
+            data=encode_message(DeltaMessage(data=data)),
+            channels=[delta_channel(meeting_id, 1)],
+        )
+        seq, changed = self.sequencer.advance(meeting_id, data.participants, data.overall)
+        sparse = SparseDeltaMessage(
+            data=SparseRollupData(
+                meeting_id=meeting_id,
+                bucket=data.bucket,
+                overall=data.overall,
+                participants=changed,
+                seq=seq,
+                stream=self.sequencer.stream,
+            )
+        )
+        self.channels.publish(
+            data=encode_message(sparse),
+            channels=[delta_channel(meeting_id, 2)],
         )
+        logger.debug("Published deltas to meeting %s", meeting_id)
+
+    def sync_data(
+        self, meeting: Meeting, bucket: datetime, engagement_service: "EngagementService"
+    ) -> SparseRollupData:
+        """Build a full sparse-protocol baseline for a client joining or resyncing.
+
+        Uses the rollup last published by this process so subsequent deltas
+        apply on top of it; falls back to the current rollup (``seq`` 0) if
+        nothing was published for the meeting yet. Overall and participant
+        values always come from the same rollup.
+
+        Args:
+            meeting: The meeting to build the baseline for
+            bucket: The current time bucket (already normalized)
+            engagement_service: Service for computing engagement rollups
 
-        logger.debug("Published to channel meeting:%s", meeting_id)
+        Returns:
+            SparseRollupData with ``full`` set and all participant values
+        """
+        published = self.sequencer.snapshot(meeting.id)
+        if published is None:
+            rollup = engagement_service.bucket_rollup(meeting, bucket)
+            published = PublishedRollup(0, rollup["overall"], rollup["participants"])
+        return SparseRollupData(
+            meeting_id=meeting.id,
+            bucket=bucket,
+            overall=published.overall,
+            participants=published.participants,
+            seq=published.seq,
+            stream=self.sequencer.stream,
+            full=True,
+        )
 
     def publish_rollup(
         self, meeting: Meeting, bucket: datetime, engagement_service: "EngagementService"
@@ -77,6 +147,11 @@ class BroadcastRepo:
             bucket: The time bucket for the rollup (already normalized)
             engagement_service: Service for computing engagement rollups
         """
+        if self.coalescer is not None:
+            # Rollup is computed from the live state when the window elapses
+            self.coalescer.mark_dirty(meeting.id, bucket)
+            return
+
         rollup = engagement_service.bucket_rollup(meeting, bucket)
 
         rollup_data = RollupData(
@@ -98,10 +173,8 @@ class BroadcastRepo:
             meeting_id: ID of the meeting to send to
             data: JSON-serializable dictionary to send
         """
-        import json
-
         self.channels.publish(
-            data=json.dumps(data),
-            channels=[f"meeting:{meeting_id}"],
+            data=encode_message(data),
+            channels=[meeting_channel(meeting_id)],
         )
-        logger.debug("Sent message to channel meeting:%s", meeting_id)
+        logger.debug("Sent message to meeting %s", meeting_id)
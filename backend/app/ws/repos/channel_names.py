@@ -0,0 +1,24 @@
+"""Naming of the channels meeting broadcasts are published on."""
+
+
+def meeting_channel(meeting_id: str) -> str:
+    """Return the channel carrying a meeting's snapshots and control messages."""
+    return f"meeting:{meeting_id}"
+
+
+def delta_channel(meeting_id: str, protocol: int) -> str:
+    """Return the channel carrying a meeting's deltas for a delta protocol.
+
+    Full deltas (protocol 1) and sparse deltas (protocol 2) are published on
+    separate channels, so subscribers only receive the flavour their client
+    negotiated.
+
+    Args:
+        meeting_id: ID of the meeting
+        protocol: Delta protocol (1 = full, 2 = sparse)
+
+    Returns:
+        Channel name
+    """
+    flavour = "sparse_delta" if protocol >= 2 else "delta"
+    return f"meeting:{meeting_id}:{flavour}"
@@ -0,0 +1,140 @@
+"""Serialization of broadcast payloads.
+
+Broadcasts are encoded to bytes exactly once, when they are published. On the
+subscriber side every socket of a process receives the same bytes object from
+the channels backend, so the UTF-8 decode needed for text frames is memoized
+per payload instead of being repeated for every subscriber. Join responses
+splice in snapshot bytes that were serialized ahead of time.
+"""
+
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+import pydantic_core
+from pydantic import BaseModel
+
+from app.config import settings
+from app.schema.engagement.messages import SparseRollupData
+
+JSON_ENCODERS = ("pydantic", "orjson", "msgspec")
+
+Encoder = Callable[[BaseModel | dict[str, Any]], bytes]
+
+
+def _encode_pydantic(payload: BaseModel | dict[str, Any]) -> bytes:
+    if isinstance(payload, BaseModel):
+        return payload.__pydantic_serializer__.to_json(payload)
+    return pydantic_core.to_json(payload)
+
+
+def _jsonable(payload: BaseModel | dict[str, Any]) -> Any:
+    # Apply field serializers (e.g. UTC bucket formatting) before handing off
+    return payload.model_dump(mode="json") if isinstance(payload, BaseModel) else payload
+
+
+def create_encoder(name: str) -> Encoder:
+    """Return a function that serializes broadcast payloads to JSON bytes.
+
+    Args:
+        name: One of ``pydantic`` (default), ``orjson`` or ``msgspec``; the
+            latter two require the matching optional dependency
+
+    Returns:
+        Encoder accepting a pydantic model or a plain dict
+
+    Raises:
+        ValueError: If the encoder name is unknown
+        RuntimeError: If the optional dependency is not installed
+    """
+    if name == "pydantic":
+        return _encode_pydantic
+
+    if name == "orjson":
+        try:
+            import orjson
+        except ImportError as exc:
+            raise RuntimeError("WS_JSON_ENCODER=orjson requires the orjson extra") from exc
+
+        def _encode_orjson(payload: BaseModel | dict[str, Any]) -> bytes:
+            return orjson.dumps(_jsonable(payload))
+
+        return _encode_orjson
+
+    if name == "msgspec":
+        try:
+            import msgspec
+        except ImportError as exc:
+            raise RuntimeError("WS_JSON_ENCODER=msgspec requires the msgspec extra") from exc
+
+        msgspec_encoder = msgspec.json.Encoder()
+
+        def _encode_msgspec(payload: BaseModel | dict[str, Any]) -> bytes:
+            return msgspec_encoder.encode(_jsonable(payload))
+
+        return _encode_msgspec
+
+    raise ValueError(f"Unknown JSON encoder {name!r}; expected one of {', '.join(JSON_ENCODERS)}")
+
+
+# Encoder used for all channel broadcasts
+encode_message = create_encoder(settings.ws_json_encoder)
+
+
+@lru_cache(maxsize=256)
+def decode_event(event: bytes) -> str:
+    """Decode a broadcast event for a text frame, once per payload.
+
+    Subscribers of the same process share the event object, so after the first
+    call the lookup is an identity hit on the cached hash.
+
+    Args:
+        event: Raw event bytes from the channels backend
+
+    Returns:
+        Decoded JSON text
+    """
+    return event.decode("utf-8")
+
+
+class PreEncodedResponse:
+    """A direct WS response that is already serialized to JSON."""
+
+    def __init__(self, payload: bytes) -> None:
+        """Wrap serialized JSON.
+
+        Args:
+            payload: JSON bytes of the complete response message
+        """
+        self.payload = payload
+
+    def model_dump_json(self) -> str:
+        """Return the JSON text, mirroring the pydantic response models."""
+        return self.payload.decode("utf-8")
+
+
+def encode_joined_response(
+    participant_id: str,
+    meeting_id: str,
+    snapshot: bytes,
+    sync: SparseRollupData | None = None,
+) -> bytes:
+    """Serialize a ``JoinedResponse`` around pre-serialized snapshot bytes.
+
+    Produces the same JSON as ``JoinedResponse.model_dump_json()`` without
+    rebuilding or re-serializing the snapshot.
+
+    Args:
+        participant_id: ID of the joined participant
+        meeting_id: ID of the meeting
+        snapshot: JSON bytes of the engagement summary
+        sync: Optional sparse delta baseline (protocol 2)
+
+    Returns:
+        JSON bytes of the joined response
+    """
+    head = encode_message(
+        {"type": "joined", "participant_id": participant_id, "meeting_id": meeting_id}
+    )
+    tail = encode_message(sync) if sync is not None else b"null"
+    return b"".join((head[:-1], b',"snapshot":', snapshot, b',"sync":', tail, b"}"))
@@ -0,0 +1,84 @@
+"""Sequencing of sparse engagement deltas (protocol v2)."""
+
+import threading
+from collections.abc import Iterable
+from typing import NamedTuple
+from uuid import uuid4
+
+
+class PublishedRollup(NamedTuple):
+    """Sequence number and values of the last rollup published for a meeting."""
+
+    seq: int
+    overall: float
+    participants: dict[str, float]
+
+
+class _MeetingSequence:
+    def __init__(self) -> None:
+        self.seq = 0
+        self.overall = 0.0
+        self.values: dict[str, float] = {}
+
+
+class DeltaSequencer:
+    """Tracks the last published participant values and sequence per meeting.
+
+    Sequence numbers are only meaningful within one publishing process, which
+    is identified by ``stream``; clients track the last ``seq`` per stream.
+    """
+
+    def __init__(self) -> None:
+        self.stream = uuid4().hex[:12]
+        self._meetings: dict[str, _MeetingSequence] = {}
+        self._lock = threading.Lock()
+
+    def advance(
+        self, meeting_id: str, participants: dict[str, float], overall: float = 0.0
+    ) -> tuple[int, dict[str, float]]:
+        """Record a published rollup and return its sequence number and changes.
+
+        Args:
+            meeting_id: ID of the meeting
+            participants: Full participant values of the rollup
+            overall: Overall engagement of the rollup
+
+        Returns:
+            Tuple of (sequence number, participants whose value changed)
+        """
+        with self._lock:
+            state = self._meetings.setdefault(meeting_id, _MeetingSequence())
+            changed = {
+                pid: value for pid, value in participants.items() if state.values.get(pid) != value
+            }
+            state.values = dict(participants)
+            state.overall = overall
+            state.seq += 1
+            return state.seq, changed
+
+    def snapshot(self, meeting_id: str) -> PublishedRollup | None:
+        """Return the last sequence number and values published for a meeting.
+
+        Args:
+            meeting_id: ID of the meeting
+
+        Returns:
+            The last published rollup, or None if nothing was published for
+            the meeting by this process yet
+        """
+        with self._lock:
+            state = self._meetings.get(meeting_id)
+            if state is None:
+                return None
+            return PublishedRollup(state.seq, state.overall, dict(state.values))
+
+    def retain(self, meeting_ids: Iterable[str]) -> None:
+        """Drop sequences of all meetings not in ``meeting_ids``."""
+        keep = set(meeting_ids)
+        with self._lock:
+            for meeting_id in [mid for mid in self._meetings if mid not in keep]:
+                del self._meetings[meeting_id]
+
+
+# Shared sequencer used by the application wiring
+delta_sequencer = DeltaSequencer()
@@ -0,0 +1,98 @@
+"""Cache of serialized engagement snapshots for joining clients."""
+
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from app.config import settings
+from app.schema.engagement.models import EngagementSummary
+from app.ws.repos.encoding import encode_message
+
+
+@dataclass
+class _CachedPayload:
+    summary: weakref.ref[EngagementSummary]
+    payload: bytes
+
+
+class SnapshotPayloadCache:
+    """LRU cache of snapshot JSON bytes, bounded by their total size.
+
+    Entries are keyed by (meeting_id, bucket_minutes) and remember the summary
+    they were encoded from. The snapshot cache hands out the same summary
+    object until the meeting's data changes, so the object identity is the
+    meeting version: joiners get the stored bytes while it is unchanged and
+    the first joiner after a change re-encodes it.
+
+    Entries only hold a weak reference to their summary, so the byte budget
+    covers everything the cache keeps alive. Payloads of meetings that ended
+    are dropped through ``discard`` or ``retain``.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_bytes: Upper bound on the total size of cached payloads
+        """
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries: OrderedDict[tuple[str, int], _CachedPayload] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def encode(self, summary: EngagementSummary) -> bytes:
+        """Return the JSON bytes of a summary, serializing it only on cache miss.
+
+        Args:
+            summary: Engagement summary to serialize
+
+        Returns:
+            Serialized summary
+        """
+        key = (summary.meeting_id, summary.bucket_minutes)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.summary() is summary:
+                self._entries.move_to_end(key)
+                return entry.payload
+
+        payload = encode_message(summary)
+        self._store(key, _CachedPayload(summary=weakref.ref(summary), payload=payload))
+        return payload
+
+    def discard(self, meeting_id: str) -> None:
+        """Drop all cached payloads of a meeting."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == meeting_id]:
+                self.total_bytes -= len(self._entries.pop(key).payload)
+
+    def retain(self, meeting_ids: Iterable[str]) -> None:
+        """Drop cached payloads of all meetings not in ``meeting_ids``."""
+        keep = set(meeting_ids)
+        with self._lock:
+            for key in [key for key in self._entries if key[0] not in keep]:
+                self.total_bytes -= len(self._entries.pop(key).payload)
+
+    def _store(self, key: tuple[str, int], entry: _CachedPayload) -> None:
+        """Insert an entry and evict least recently used ones over the byte budget."""
+        size = len(entry.payload)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= len(previous.payload)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.total_bytes -= len(evicted.payload)
+
+
+# Shared cache used by the application wiring
+snapshot_payload_cache = SnapshotPayloadCache(max_bytes=settings.snapshot_payload_cache_max_bytes)
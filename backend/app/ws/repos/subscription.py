@@ -7,9 +7,13 @@ low-level subscription operations.
 
 import logging
 from collections.abc import AsyncGenerator
+from contextlib import AsyncExitStack
 
 import anyio
-from litestar.channels import ChannelsPlugin
+from litestar.channels import ChannelsPlugin, Subscriber
+
+from app.ws.repos.channel_names import delta_channel, meeting_channel
+from app.ws.repos.encoding import decode_event
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +24,12 @@ class SubscriptionRepo:
     Handles all subscription operations to receive real-time updates from
     broadcast channels via Litestar's ChannelsPlugin. This repo manages the
     subscription lifecycle and event streaming.
+
+    One repo serves one connection. Besides the meeting channel, it follows
+    the delta channel of the connection's negotiated protocol: deltas are
+    received by a second subscriber and fed into the meeting subscriber's
+    stream, so switching protocols on join never interrupts the meeting
+    channel.
     """
 
     def __init__(self, channels: ChannelsPlugin) -> None:
@@ -29,6 +39,11 @@ class SubscriptionRepo:
             channels: Litestar ChannelsPlugin instance for pub/sub operations
         """
         self.channels = channels
+        # Delta protocol negotiated by the connection (1 = full, 2 = sparse)
+        self.protocol_version = 1
+        self._meeting_id: str | None = None
+        self._subscriber: Subscriber | None = None
+        self._deltas: AsyncExitStack | None = None
 
     async def subscribe_to_meeting(
         self,
@@ -38,22 +53,64 @@ class SubscriptionRepo:
         """Subscribe to all broadcasts for a meeting.
 
         Creates an async generator that yields broadcast events from the meeting
-        channel. The subscription is automatically closed when the connection ends.
+        channel and the delta channel of the negotiated protocol. The
+        subscription is automatically closed when the connection ends.
 
         Args:
             meeting_id: ID of the meeting to subscribe to
             is_closed: Event that signals when the connection is closed
 
         Yields:
-            Decoded broadcast events as JSON strings
+            Broadcast events as JSON strings, decoded once per event and
+            shared by all subscribers of this process
         """
-        channel_name = f"meeting:{meeting_id}"
+        channel_name = meeting_channel(meeting_id)
         logger.debug("Starting subscription for channel %s", channel_name)
 
         async with self.channels.start_subscription([channel_name]) as subscriber:
-            async for event in subscriber.iter_events():
-                decoded = event.decode("utf-8")
-                yield decoded
-                if is_closed.is_set():
-                    logger.debug("Connection closed, stopping subscription for %s", channel_name)
-                    break
+            self._meeting_id, self._subscriber = meeting_id, subscriber
+            try:
+                await self._follow_deltas(meeting_id, subscriber)
+                async for event in subscriber.iter_events():
+                    yield decode_event(event)
+                    if is_closed.is_set():
+                        logger.debug(
+                            "Connection closed, stopping subscription for %s", channel_name
+                        )
+                        break
+            finally:
+                self._subscriber = None
+                await self._stop_deltas()
+
+    async def set_protocol(self, protocol_version: int) -> None:
+        """Switch the delta channel to the one of a negotiated protocol.
+
+        Args:
+            protocol_version: Delta protocol (1 = full, 2 = sparse)
+        """
+        if protocol_version == self.protocol_version:
+            return
+        self.protocol_version = protocol_version
+        if self._meeting_id is not None and self._subscriber is not None:
+            await self._follow_deltas(self._meeting_id, self._subscriber)
+
+    async def _follow_deltas(self, meeting_id: str, target: Subscriber) -> None:
+        """(Re)subscribe to the delta channel of the current protocol.
+
+        Args:
+            meeting_id: ID of the meeting
+            target: Meeting subscriber the deltas are fed into
+        """
+        await self._stop_deltas()
+        deltas = AsyncExitStack()
+        subscriber = await deltas.enter_async_context(
+            self.channels.start_subscription([delta_channel(meeting_id, self.protocol_version)])
+        )
+        await deltas.enter_async_context(subscriber.run_in_background(target.put, join=False))
+        self._deltas = deltas
+
+    async def _stop_deltas(self) -> None:
+        """Stop following the current delta channel, if any."""
+        if self._deltas is not None:
+            deltas, self._deltas = self._deltas, None
+            await deltas.aclose()
@@ -3,6 +3,7 @@
 from app.ws.services.join import JoinService
 from app.ws.services.leave import LeaveService
 from app.ws.services.ping import PingService
+from app.ws.services.resync import ResyncService
 from app.ws.services.status import StatusService
 
-__all__ = ["JoinService", "LeaveService", "StatusService", "PingService"]
+__all__ = ["JoinService", "LeaveService", "StatusService", "PingService", "ResyncService"]
@@ -8,6 +8,8 @@ from pydantic import BaseModel
 from app.schema.websocket import ErrorResponse, JoinedResponse, JoinRequest
 from app.services import EngagementService, ParticipantService
 from app.ws.repos.broadcast import BroadcastRepo
+from app.ws.repos.encoding import PreEncodedResponse, encode_joined_response
+from app.ws.repos.snapshot_payload import SnapshotPayloadCache
 from app.ws.transport.context import WSContext
 
 logger = logging.getLogger(__name__)
@@ -26,6 +28,7 @@ class JoinService:
         participant_service: ParticipantService,
         engagement_service: EngagementService,
         broadcast_repo: BroadcastRepo,
+        payload_cache: SnapshotPayloadCache | None = None,
     ) -> None:
         """Initialize join service with dependencies.
 
@@ -33,12 +36,17 @@ class JoinService:
             participant_service: Service for participant operations
             engagement_service: Service for engagement calculations
             broadcast_repo: Repository for broadcasting to channels
+            payload_cache: Optional cache of serialized snapshots; when set the
+                response is pre-encoded around the cached snapshot bytes
         """
         self.participant_service = participant_service
         self.engagement_service = engagement_service
         self.broadcast_repo = broadcast_repo
+        self.payload_cache = payload_cache
 
-    async def execute(self, request: JoinRequest, context: WSContext) -> BaseModel:
+    async def execute(
+        self, request: JoinRequest, context: WSContext
+    ) -> BaseModel | PreEncodedResponse:
         """Execute join request - create participant and return snapshot.
 
         Returns a JoinedResponse with embedded engagement snapshot to the joining
@@ -49,17 +57,21 @@ class JoinService:
             context: WebSocket connection context
 
         Returns:
-            JoinedResponse with participant ID, meeting ID, and snapshot, or ErrorResponse on failure
+            JoinedResponse with participant ID, meeting ID, and snapshot (pre-encoded
+            when a payload cache is set), or ErrorResponse on failure
         """
         try:
             # Create or reuse participant for this connection
-            participant = self.participant_service.create_or_reuse_for_connection(
-                context.meeting, request
+            participant = await context.run_sync(
+                self.participant_service.create_or_reuse_for_connection, context.meeting, request
             )
 
             # Commit immediately to release the database lock for other connections
-            context.session.commit()
+            await context.commit()
             context.set_participant(participant)
+            # Follow the negotiated deltas before this join's own delta is published
+            await context.set_protocol(request.protocol)
+            self.engagement_service.register_participant(participant)
 
             logger.info(
                 "Joined participant %s for meeting %s (fingerprint=%s)",
@@ -69,12 +81,16 @@ class JoinService:
             )
 
             # Build engagement summary for the joining client
-            summary = self.engagement_service.build_engagement_summary(context.meeting)
+            summary = await context.run_sync(
+                self.engagement_service.build_engagement_summary, context.meeting
+            )
 
             # Broadcast delta to notify other participants of the join
             now = datetime.now(tz=UTC)
             bucket = self.engagement_service.bucket_manager.bucketize(now)
-            self.broadcast_repo.publish_rollup(context.meeting, bucket, self.engagement_service)
+            await context.run_sync(
+                self.broadcast_repo.publish_rollup, context.meeting, bucket, self.engagement_service
+            )
 
             logger.info(
                 "Participant %s joined meeting %s, delta broadcast to others",
@@ -82,11 +98,31 @@ class JoinService:
                 context.meeting.id,
             )
 
+            # Sparse-delta clients also need the baseline their deltas apply to
+            sync = None
+            if request.protocol >= 2:
+                sync = await context.run_sync(
+                    self.broadcast_repo.sync_data,
+                    context.meeting,
+                    bucket,
+                    self.engagement_service,
+                )
+
             # Return snapshot directly to joining client
+            if self.payload_cache is not None:
+                return PreEncodedResponse(
+                    encode_joined_response(
+                        participant.id,
+                        context.meeting.id,
+                        self.payload_cache.encode(summary),
+                        sync,
+                    )
+                )
             return JoinedResponse(
                 participant_id=participant.id,
                 meeting_id=context.meeting.id,
                 snapshot=summary,
+                sync=sync,
             )
         except Exception as e:
             logger.exception("Error in JoinService: %s", e)
@@ -31,7 +31,7 @@ class LeaveService:
         self.engagement_service = engagement_service
         self.broadcast_repo = broadcast_repo
 
-    def handle_leave(self, context: WSContext) -> None:
+    async def handle_leave(self, context: WSContext) -> None:
         """Handle participant leave - update state and broadcast delta.
 
         Args:
@@ -47,7 +47,9 @@ class LeaveService:
 
             # Broadcast delta to notify others of the leave
             bucket = self.engagement_service.bucket_manager.bucketize(now)
-            self.broadcast_repo.publish_rollup(context.meeting, bucket, self.engagement_service)
+            await context.run_sync(
+                self.broadcast_repo.publish_rollup, context.meeting, bucket, self.engagement_service
+            )
 
             logger.info(
                 "Participant %s left meeting %s, delta broadcast to others",
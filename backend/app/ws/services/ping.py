@@ -5,8 +5,10 @@ from datetime import UTC, datetime
 
 from pydantic import BaseModel
 
+from app.repos import ParticipantRepo
 from app.schema.websocket import PingRequest, PongResponse
 from app.utils.datetime import isoformat_utc
+from app.ws.background.sqlite_writer import SQLiteWriter
 from app.ws.transport.context import WSContext
 
 logger = logging.getLogger(__name__)
@@ -19,6 +21,15 @@ class PingService:
     client-server time synchronization.
     """
 
+    def __init__(self, sqlite_writer: SQLiteWriter | None = None) -> None:
+        """Initialize ping service.
+
+        Args:
+            sqlite_writer: Optional SQLite writer thread; when set, activity
+                timestamps are written by it instead of the unit of work
+        """
+        self.sqlite_writer = sqlite_writer
+
     async def execute(self, request: PingRequest, context: WSContext) -> BaseModel:
         """Execute ping request - update activity and return pong.
 
@@ -32,7 +43,14 @@ class PingService:
         now = datetime.now(tz=UTC)
 
         # Update activity timestamp if participant exists
-        if context.participant:
+        participant_id = context.participant_id
+        if self.sqlite_writer is not None and participant_id is not None:
+            await self.sqlite_writer.run(
+                lambda session: ParticipantRepo(session).bulk_update_last_seen(
+                    {participant_id: now}
+                )
+            )
+        elif context.participant:
             context.participant.last_seen_at = now
 
         return PongResponse(server_time=isoformat_utc(now))
@@ -5,6 +5,7 @@ from typing import Protocol
 from pydantic import BaseModel
 
 from app.schema.websocket import WSRequestBase
+from app.ws.repos.encoding import PreEncodedResponse
 from app.ws.transport.context import WSContext
 
 
@@ -15,7 +16,9 @@ class WSService(Protocol):
     validated requests and returns a response.
     """
 
-    async def execute(self, request: WSRequestBase, context: WSContext) -> BaseModel | None:
+    async def execute(
+        self, request: WSRequestBase, context: WSContext
+    ) -> BaseModel | PreEncodedResponse | None:
         """Execute validated request and return a Pydantic response model.
 
         Args:
@@ -23,6 +26,7 @@ class WSService(Protocol):
             context: WebSocket connection context with session, meeting, etc.
 
         Returns:
-            Pydantic response model to send back, or None for no direct response
+            Pydantic response model (or pre-encoded response) to send back, or
+            None for no direct response
         """
         ...
@@ -0,0 +1,57 @@
+"""Resync service for clients that detected a sparse delta gap."""
+
+import logging
+from datetime import UTC, datetime
+
+from pydantic import BaseModel
+
+from app.schema.engagement.messages import SparseDeltaMessage
+from app.schema.websocket import ResyncRequest
+from app.services import EngagementService
+from app.ws.repos.broadcast import BroadcastRepo
+from app.ws.transport.context import WSContext
+
+logger = logging.getLogger(__name__)
+
+
+class ResyncService:
+    """Service for sending a full sparse-protocol baseline to one client.
+
+    Clients using sparse deltas (protocol 2) request a resync when they see a
+    gap in the sequence numbers; the reply replaces their participant values.
+    """
+
+    def __init__(
+        self,
+        engagement_service: EngagementService,
+        broadcast_repo: BroadcastRepo,
+    ) -> None:
+        """Initialize resync service with dependencies.
+
+        Args:
+            engagement_service: Service for engagement calculations
+            broadcast_repo: Repository owning the sparse delta sequence
+        """
+        self.engagement_service = engagement_service
+        self.broadcast_repo = broadcast_repo
+
+    async def execute(self, request: ResyncRequest, context: WSContext) -> BaseModel:
+        """Execute resync request - return a full baseline to the requester.
+
+        Args:
+            request: Validated resync request
+            context: WebSocket connection context
+
+        Returns:
+            SparseDeltaMessage with ``full`` set
+        """
+        logger.info(
+            "WS resync meeting_id=%s participant_id=%s",
+            context.meeting.id,
+            context.participant.id if context.participant else None,
+        )
+        bucket = self.engagement_service.bucket_manager.bucketize(datetime.now(tz=UTC))
+        data = await context.run_sync(
+            self.broadcast_repo.sync_data, context.meeting, bucket, self.engagement_service
+        )
+        return SparseDeltaMessage(data=data)
@@ -4,9 +4,13 @@ import logging
 from datetime import UTC, datetime
 
 from pydantic import BaseModel
+from sqlalchemy.orm import Session
 
+from app.repos import EngagementRepo, ParticipantRepo
 from app.schema.websocket import ErrorResponse, StatusUpdateRequest
 from app.services import EngagementService
+from app.ws.background.sqlite_writer import SQLiteWriter
+from app.ws.background.write_behind import StatusWriteBehind
 from app.ws.repos.broadcast import BroadcastRepo
 from app.ws.transport.context import WSContext
 
@@ -24,15 +28,23 @@ class StatusService:
         self,
         engagement_service: EngagementService,
         broadcast_repo: BroadcastRepo,
+        status_writer: StatusWriteBehind | None = None,
+        sqlite_writer: SQLiteWriter | None = None,
     ) -> None:
         """Initialize status service with dependencies.
 
         Args:
             engagement_service: Service for engagement calculations
             broadcast_repo: Repository for broadcasting to channels
+            status_writer: Optional write-behind queue; when set, status writes
+                are batched instead of committed per message
+            sqlite_writer: Optional SQLite writer thread; without write-behind,
+                each status write is committed by it instead of the unit of work
         """
         self.engagement_service = engagement_service
         self.broadcast_repo = broadcast_repo
+        self.status_writer = status_writer
+        self.sqlite_writer = sqlite_writer
 
     async def execute(self, request: StatusUpdateRequest, context: WSContext) -> BaseModel | None:
         """Execute status update request - record and broadcast delta.
@@ -44,37 +56,92 @@ class StatusService:
         Returns:
             None (delta is broadcast via channel), or ErrorResponse on failure
         """
-        # Participant must exist (validated before calling execute)
-        if not context.participant:
+        # Participant must have joined (validated before calling execute)
+        participant_id = context.participant_id
+        if participant_id is None:
             return ErrorResponse(message="Not joined")
 
         logger.info(
             "WS status update meeting_id=%s participant_id=%s status=%s",
             context.meeting.id,
-            context.participant.id,
+            participant_id,
             request.status,
         )
 
         now = datetime.now(tz=UTC)
+        # Whether the write is persisted outside of the unit of work
+        deferred = self.status_writer is not None or self.sqlite_writer is not None
         try:
-            bucket = self.engagement_service.record_status(
-                participant=context.participant,
-                request=request,
-                current_time=now,
-            )
+            if not deferred:
+                if context.participant is None:
+                    return ErrorResponse(message="Not joined")
+                # Update activity timestamp with the status, in one commit
+                context.participant.last_seen_at = now
+                bucket = await context.run_sync(
+                    self.engagement_service.record_status,
+                    participant=context.participant,
+                    request=request,
+                    current_time=now,
+                )
+            else:
+                bucket = await context.run_sync(
+                    self.engagement_service.apply_status,
+                    meeting=context.meeting,
+                    participant_id=participant_id,
+                    request=request,
+                    current_time=now,
+                )
         except ValueError as e:
             # Bucket validation failed (outside meeting bounds)
             logger.warning("Status record failed for meeting %s: %s", context.meeting.id, e)
             return ErrorResponse(message=str(e))
 
-        # Commit immediately to release database lock
-        context.session.commit()
+        if self.status_writer is not None:
+            # Last status and activity timestamp are persisted with the batch
+            self.status_writer.enqueue(
+                context.meeting.id, participant_id, bucket, request.status, seen_at=now
+            )
+        elif self.sqlite_writer is not None:
+            # End the unit of work's read transaction so it cannot hold up the writer
+            await context.commit()
+            meeting_id = context.meeting.id
+            await self.sqlite_writer.run(
+                lambda session: self._write_status(
+                    session, meeting_id, participant_id, bucket, request.status, now
+                )
+            )
+        else:
+            # Commit immediately to release database lock
+            await context.commit()
 
         # Always broadcast delta on status update
-        self.broadcast_repo.publish_rollup(context.meeting, bucket, self.engagement_service)
-
-        # Update activity timestamp
-        context.participant.last_seen_at = now
+        await context.run_sync(
+            self.broadcast_repo.publish_rollup, context.meeting, bucket, self.engagement_service
+        )
 
         # No direct response - delta is broadcast via channel
         return None
+
+    @staticmethod
+    def _write_status(
+        session: Session,
+        meeting_id: str,
+        participant_id: str,
+        bucket: datetime,
+        status: str,
+        seen_at: datetime,
+    ) -> None:
+        """Write a status sample and the participant's activity (on the writer thread)."""
+        EngagementRepo(session).bulk_upsert_samples(
+            [
+                {
+                    "meeting_id": meeting_id,
+                    "participant_id": participant_id,
+                    "bucket": bucket,
+                    "status": status,
+                }
+            ]
+        )
+        participant_repo = ParticipantRepo(session)
+        participant_repo.bulk_update_last_status({participant_id: status})
+        participant_repo.bulk_update_last_seen({participant_id: seen_at})
@@ -1,5 +1,6 @@
 """WebSocket shared utilities - factories and common components."""
 
+from app.ws.shared.channels import create_channels_backend, create_channels_plugin
 from app.ws.shared.factory import WSServiceFactory
 
-__all__ = ["WSServiceFactory"]
+__all__ = ["WSServiceFactory", "create_channels_backend", "create_channels_plugin"]
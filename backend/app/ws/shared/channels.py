@@ -0,0 +1,131 @@
+"""Channels backend selection for WebSocket broadcasts.
+
+The memory backend only reaches sockets of the current process. The Postgres
+(LISTEN/NOTIFY) and Redis (streams) backends fan broadcasts out to every
+worker, so WebSocket connections can be spread across processes and nodes.
+"""
+
+import logging
+from collections.abc import Iterable
+
+from litestar.channels import ChannelsPlugin
+from litestar.channels.backends.asyncpg import AsyncPgChannelsBackend
+from litestar.channels.backends.base import ChannelsBackend
+from litestar.channels.backends.memory import MemoryChannelsBackend
+
+from app.config import Settings, settings
+from app.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+CHANNELS_BACKENDS = ("memory", "postgres", "redis")
+
+# Entries kept per Redis stream. Workers read the streams with XREAD, so a
+# worker lagging behind a burst of broadcasts still finds the entries it has
+# not read yet; a stream capped at zero entries could be trimmed before that.
+REDIS_STREAM_LENGTH = 100
+
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more (default build)
+NOTIFY_PAYLOAD_LIMIT = 8000
+
+
+class NotifyChannelsBackend(AsyncPgChannelsBackend):
+    """LISTEN/NOTIFY backend that drops payloads PostgreSQL would reject.
+
+    A full delta carries one value per participant and outgrows the NOTIFY
+    limit at roughly 170 participants. Publishing such a payload would fail
+    inside the channels plugin's publish worker and stop all further
+    broadcasts, so oversized payloads are dropped instead, logged, and
+    counted in the ``channels_payloads_dropped`` metric. Meetings of that
+    size need the Redis backend.
+    """
+
+    def __init__(self, dsn: str) -> None:
+        """Initialize the backend.
+
+        Args:
+            dsn: asyncpg connection string
+        """
+        super().__init__(dsn=dsn)
+        self.dropped = metrics.counter(
+            "channels_payloads_dropped", "Broadcasts too large for Postgres NOTIFY"
+        )
+
+    async def publish(self, data: bytes, channels: Iterable[str]) -> None:
+        """Publish a payload, dropping it if it exceeds the NOTIFY limit."""
+        if len(data) >= NOTIFY_PAYLOAD_LIMIT:
+            channels = list(channels)
+            self.dropped.inc(len(channels))
+            logger.error(
+                "Dropped %d-byte broadcast to %s: exceeds the Postgres NOTIFY limit; "
+                "use CHANNELS_BACKEND=redis for meetings this large",
+                len(data),
+                ", ".join(channels),
+            )
+            return
+        await super().publish(data, channels)
+
+
+def _postgres_dsn(database_url: str) -> str:
+    """Strip any SQLAlchemy driver suffix so asyncpg accepts the URL."""
+    scheme, sep, rest = database_url.partition("://")
+    return f"{scheme.split('+', 1)[0]}{sep}{rest}"
+
+
+def create_channels_backend(config: Settings = settings) -> ChannelsBackend:
+    """Create the channels backend selected by ``config.channels_backend``.
+
+    Postgres NOTIFY payloads are limited to 8000 bytes. Lifecycle messages
+    and sparse deltas fit easily, but full deltas of meetings with more than
+    about 170 participants do not and are dropped (see
+    ``NotifyChannelsBackend``); use Redis for meetings that large. Snapshots
+    are sent to the joining socket directly, not through channels.
+
+    Args:
+        config: Application settings
+
+    Returns:
+        Configured channels backend
+
+    Raises:
+        ValueError: If the backend name is unknown
+        RuntimeError: If the Redis backend is selected without the redis extra
+    """
+    backend = config.channels_backend
+    if backend == "memory":
+        return MemoryChannelsBackend()
+
+    if backend == "postgres":
+        return NotifyChannelsBackend(dsn=_postgres_dsn(config.database_url))
+
+    if backend == "redis":
+        try:
+            from litestar.channels.backends.redis import RedisChannelsStreamBackend
+            from redis.asyncio import Redis
+        except ImportError as exc:
+            raise RuntimeError(
+                "CHANNELS_BACKEND=redis requires the redis extra (pip install 'bsbox[redis]')"
+            ) from exc
+
+        return RedisChannelsStreamBackend(
+            history=REDIS_STREAM_LENGTH, redis=Redis.from_url(config.redis_url)
+        )
+
+    raise ValueError(
+        f"Unknown channels backend {backend!r}; expected one of {', '.join(CHANNELS_BACKENDS)}"
+    )
+
+
+def create_channels_plugin(config: Settings = settings) -> ChannelsPlugin:
+    """Create the ChannelsPlugin used for meeting broadcasts.
+
+    Args:
+        config: Application settings
+
+    Returns:
+        ChannelsPlugin wired to the configured backend
+    """
+    return ChannelsPlugin(
+        backend=create_channels_backend(config),
+        arbitrary_channels_allowed=True,
+    )
@@ -2,18 +2,24 @@
 
 from typing import cast
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.repos import EngagementRepo, ParticipantRepo
-from app.services import EngagementService, ParticipantService
+from app.config import settings
+from app.repos import EngagementRepo, MeetingSummaryRepo, ParticipantRepo
+from app.services import EngagementService, MeetingSummaryService, ParticipantService
 from app.services.engagement.bucketing import BucketManager
 from app.services.engagement.smoothing import SmoothingAlgorithm, SmoothingFactory
-from app.services.engagement.summary import SnapshotBuilder
+from app.services.engagement.state import live_state_registry
+from app.services.engagement.summary import SnapshotBuilderFactory, snapshot_cache
+from app.ws.background.sqlite_writer import SQLiteWriter
+from app.ws.background.write_behind import StatusWriteBehind
 from app.ws.repos.broadcast import BroadcastRepo
+from app.ws.repos.snapshot_payload import snapshot_payload_cache
 from app.ws.services.join import JoinService
 from app.ws.services.leave import LeaveService
 from app.ws.services.ping import PingService
 from app.ws.services.protocol import WSService
+from app.ws.services.resync import ResyncService
 from app.ws.services.status import StatusService
 
 
@@ -21,34 +27,53 @@ class WSServiceFactory:
     """Factory for creating WebSocket message services.
 
     Responsible for constructing service instances with their dependencies,
-    including domain services and the broadcast repository.
+    including domain services and the broadcast repository. A factory is
+    created per unit of work and binds its repos to that unit's session.
     """
 
-    def __init__(self, session: Session, broadcast_repo: BroadcastRepo) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        broadcast_repo: BroadcastRepo,
+        status_writer: StatusWriteBehind | None = None,
+        sqlite_writer: SQLiteWriter | None = None,
+    ) -> None:
         """Initialize service factory with dependencies.
 
+        Domain repos are bound to the sync facade of the async session; services
+        invoke them through ``WSContext.run_sync`` so IO stays off the event loop.
+
         Args:
-            session: Database session for domain repos/services
+            session: Async database session for domain repos/services
             broadcast_repo: Repository for broadcasting operations
+            status_writer: Optional write-behind queue for batching status writes
+            sqlite_writer: Optional SQLite writer thread for status and ping writes
         """
         # Store for creating non-message services
         self.broadcast_repo = broadcast_repo
 
         # Initialize domain repos
-        participant_repo = ParticipantRepo(session)
-        engagement_repo = EngagementRepo(session)
+        self.session = session
+        participant_repo = ParticipantRepo(session.sync_session)
+        engagement_repo = EngagementRepo(session.sync_session)
+        self.participant_repo = participant_repo
 
         # Initialize domain services
         participant_service = ParticipantService(participant_repo)
 
         # Create engagement service components
         bucket_manager = BucketManager()
-        smoothing_strategy = SmoothingFactory.create(SmoothingAlgorithm.KALMAN)
-        snapshot_builder = SnapshotBuilder(
+        smoothing_strategy = SmoothingFactory.create(
+            SmoothingAlgorithm(settings.smoothing_algorithm)
+        )
+        snapshot_builder = SnapshotBuilderFactory.create(
             engagement_repo=engagement_repo,
             participant_repo=participant_repo,
             bucket_manager=bucket_manager,
             smoothing_strategy=smoothing_strategy,
+            live_state=live_state_registry,
+            snapshot_cache=snapshot_cache if settings.snapshot_cache_enabled else None,
+            engine=settings.snapshot_engine,
         )
 
         self.engagement_service = EngagementService(
@@ -58,17 +83,34 @@ class WSServiceFactory:
             snapshot_builder=snapshot_builder,
         )
 
+        # Serialized snapshots are keyed by summary object, which is only shared
+        # across joins when the snapshot cache is enabled
+        reuse_snapshot_payloads = (
+            settings.snapshot_cache_enabled and settings.snapshot_payload_cache_max_bytes > 0
+        )
+
         # Register message handler services (cast to protocol type for mypy)
         self._services: dict[str, WSService] = {
             "join": cast(
                 WSService,
-                JoinService(participant_service, self.engagement_service, broadcast_repo),
+                JoinService(
+                    participant_service,
+                    self.engagement_service,
+                    broadcast_repo,
+                    snapshot_payload_cache if reuse_snapshot_payloads else None,
+                ),
             ),
             "status": cast(
                 WSService,
-                StatusService(self.engagement_service, broadcast_repo),
+                StatusService(
+                    self.engagement_service, broadcast_repo, status_writer, sqlite_writer
+                ),
+            ),
+            "ping": cast(WSService, PingService(sqlite_writer)),
+            "resync": cast(
+                WSService,
+                ResyncService(self.engagement_service, broadcast_repo),
             ),
-            "ping": cast(WSService, PingService()),
         }
 
     def get_service(self, message_type: str) -> WSService | None:
@@ -92,6 +134,20 @@ class WSServiceFactory:
         """
         return LeaveService(self.engagement_service, self.broadcast_repo)
 
+    def create_summary_service(self) -> MeetingSummaryService:
+        """Create a MeetingSummaryService instance.
+
+        Used by the meeting end watcher to summarize a meeting that ended.
+
+        Returns:
+            MeetingSummaryService bound to this factory's session
+        """
+        return MeetingSummaryService(
+            engagement_service=self.engagement_service,
+            participant_repo=self.participant_repo,
+            meeting_summary_repo=MeetingSummaryRepo(self.session.sync_session),
+        )
+
     @property
     def supported_types(self) -> list[str]:
         """List of supported message types.
@@ -1,12 +1,19 @@
 """WebSocket connection context - shared state for message services."""
 
-from typing import TYPE_CHECKING
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from app.models import Participant
 
 if TYPE_CHECKING:
     from litestar import WebSocket
-    from sqlalchemy.orm import Session
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from app.models import Meeting
+    from app.ws.repos.subscription import SubscriptionRepo
 
-    from app.models import Meeting, Participant
+T = TypeVar("T")
 
 
 class WSContext:
@@ -15,27 +22,54 @@ class WSContext:
     Pure data container holding connection state and dependencies.
     Business logic should be in services, not here. Broadcast operations
     are handled by BroadcastRepo injected into services.
+
+    The connection does not own a database session. Each message is handled
+    in a short unit of work (see ``unit_of_work``) that checks a session out
+    of ``session_factory`` and closes it afterwards, so pooled connections
+    are only held while a message is processed, not for the socket lifetime.
+    Only the participant's ID outlives a unit of work; the participant itself
+    is loaded into each unit of work's session, so a failed message cannot
+    leave an expired or detached instance behind for the next one.
     """
 
     def __init__(
         self,
         socket: "WebSocket",
         meeting: "Meeting",
-        session: "Session",
+        session_factory: "async_sessionmaker[AsyncSession]",
         participant: "Participant | None" = None,
+        subscription: "SubscriptionRepo | None" = None,
     ) -> None:
         """Initialize WebSocket context.
 
         Args:
             socket: WebSocket connection instance
             meeting: Meeting model for this connection
-            session: Database session for queries
+            session_factory: Factory for the per-message async sessions
             participant: Optional participant (set after join)
+            subscription: Subscription feeding the socket its broadcasts
         """
         self.socket = socket
         self.meeting = meeting
-        self.session = session
+        self.session_factory = session_factory
+        # Session of the unit of work in progress, if any
+        self.session: AsyncSession | None = None
+        self.participant_id = participant.id if participant is not None else None
+        # Participant as loaded by the current (or last) unit of work
         self.participant = participant
+        # Delta protocol negotiated in the join message (1 = full, 2 = sparse)
+        self.protocol_version = 1
+        self.subscription = subscription
+
+    async def set_protocol(self, protocol_version: int) -> None:
+        """Set the negotiated delta protocol and subscribe to its deltas.
+
+        Args:
+            protocol_version: Delta protocol (1 = full, 2 = sparse)
+        """
+        self.protocol_version = protocol_version
+        if self.subscription is not None:
+            await self.subscription.set_protocol(protocol_version)
 
     def set_participant(self, participant: "Participant") -> None:
         """Set the participant for this connection.
@@ -43,4 +77,81 @@ class WSContext:
         Args:
             participant: Participant model to associate with this connection
         """
+        self.participant_id = participant.id
         self.participant = participant
+
+    @asynccontextmanager
+    async def unit_of_work(self, load_participant: bool = True) -> AsyncIterator["AsyncSession"]:
+        """Open a session for one message, committing it on success.
+
+        The connection's participant is loaded into the session, so changes
+        made to it (e.g. ``last_seen_at``) are flushed with the unit of work.
+        Messages that only need the participant's ID (e.g. buffered status
+        updates) can skip that query with ``load_participant=False``; only
+        ``participant_id`` is set then. On error the session is rolled back. The session is closed afterwards,
+        returning its connection to the pool. Messages of a connection are
+        handled one at a time, so units of work of the same context never
+        overlap.
+
+        Args:
+            load_participant: Whether to load the participant into the session
+
+        Yields:
+            The unit of work's async session
+        """
+        async with self.session_factory() as session:
+            self.session = session
+            try:
+                if not load_participant:
+                    self.participant = None
+                elif self.participant_id is not None:
+                    self.participant = await session.get(Participant, self.participant_id)
+                yield session
+                await session.commit()
+            except BaseException:
+                await session.rollback()
+                raise
+            finally:
+                self.session = None
+
+    async def commit(self) -> None:
+        """Commit the unit of work so far, releasing database locks early.
+
+        Raises:
+            RuntimeError: If called outside of a unit of work
+        """
+        if self.session is None:
+            raise RuntimeError("No unit of work in progress")
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        """Discard the changes of the unit of work so far.
+
+        Raises:
+            RuntimeError: If called outside of a unit of work
+        """
+        if self.session is None:
+            raise RuntimeError("No unit of work in progress")
+        await self.session.rollback()
+
+    async def run_sync(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run synchronous domain code against the unit of work's async session.
+
+        Domain services and repos are bound to ``session.sync_session``; running
+        them through ``AsyncSession.run_sync`` performs their IO on the async
+        driver instead of blocking the event loop.
+
+        Args:
+            fn: Synchronous callable (typically a domain service method)
+            *args: Positional arguments for ``fn``
+            **kwargs: Keyword arguments for ``fn``
+
+        Returns:
+            The return value of ``fn``
+
+        Raises:
+            RuntimeError: If called outside of a unit of work
+        """
+        if self.session is None:
+            raise RuntimeError("No unit of work in progress")
+        return await self.session.run_sync(lambda _session: fn(*args, **kwargs))
@@ -7,11 +7,16 @@ from typing import TYPE_CHECKING
 import anyio
 from litestar import WebSocket
 from litestar.channels import ChannelsPlugin
-from sqlalchemy.orm import Session
-
-from app.repos import MeetingSummaryRepo, ParticipantRepo
-from app.services import MeetingService, MeetingSummaryService
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.repos import AsyncMeetingRepo
+from app.services import MeetingSummaryService
+from app.services.engagement.state import live_state_registry
+from app.ws.background import get_delta_coalescer, get_sqlite_writer, get_status_writer
+from app.ws.background.sqlite_writer import SQLiteWriter
+from app.ws.background.write_behind import StatusWriteBehind
 from app.ws.repos.broadcast import BroadcastRepo
+from app.ws.repos.snapshot_payload import snapshot_payload_cache
 from app.ws.repos.subscription import SubscriptionRepo
 from app.ws.transport.context import WSContext
 from app.ws.transport.lifecycle.validators import ConnectionValidator
@@ -28,12 +33,29 @@ class LifecycleResult:
     """Result of lifecycle setup containing all necessary components."""
 
     context: WSContext
-    factory: "WSServiceFactory"
+    broadcast_repo: BroadcastRepo
+    status_writer: StatusWriteBehind | None
+    sqlite_writer: SQLiteWriter | None
     subscription_repo: SubscriptionRepo
     watcher: MeetingEndWatcher
     is_closed: anyio.Event
     seconds_remaining: float
 
+    def create_factory(self, session: AsyncSession) -> "WSServiceFactory":
+        """Create the message services for one unit of work.
+
+        Args:
+            session: Async session of the unit of work
+
+        Returns:
+            Service factory whose repos are bound to ``session``
+        """
+        from app.ws.shared.factory import WSServiceFactory
+
+        return WSServiceFactory(
+            session, self.broadcast_repo, self.status_writer, self.sqlite_writer
+        )
+
 
 class LifecycleCoordinator:
     """Orchestrates WebSocket connection lifecycle setup and validation."""
@@ -41,34 +63,39 @@ class LifecycleCoordinator:
     def __init__(
         self,
         connection_validator: ConnectionValidator,
-        meeting_service: MeetingService,
+        meeting_repo: AsyncMeetingRepo,
     ) -> None:
-        """Initialize coordinator with validators and services.
+        """Initialize coordinator with validators and repos.
 
         Args:
             connection_validator: Validator for connection checks
-            meeting_service: Service for meeting operations
+            meeting_repo: Async repository for loading the meeting
         """
         self.connection_validator = connection_validator
-        self.meeting_service = meeting_service
+        self.meeting_repo = meeting_repo
 
     async def setup(
         self,
         socket: WebSocket,
         channels: ChannelsPlugin,
-        session: Session,
+        session_factory: async_sessionmaker[AsyncSession],
     ) -> LifecycleResult | None:
         """Setup connection lifecycle.
 
         Returns None if connection rejected, otherwise returns LifecycleResult
         with all necessary components for managing the connection.
+
+        Args:
+            socket: WebSocket connection
+            channels: Channels plugin for broadcasts and subscriptions
+            session_factory: Factory for the connection's per-message sessions
         """
         # 1. Get meeting_id from socket path
         meeting_id: str = socket.path_params.get("meeting_id", "")
         logger.info("Setting up WS lifecycle for meeting_id=%s", meeting_id)
 
         # 2. Load meeting from database
-        meeting = self.meeting_service.get_meeting(meeting_id)
+        meeting = await self.meeting_repo.get_with_participants(meeting_id)
 
         # 3. Validate connection and send responses if needed
         meeting, check = await self.connection_validator.validate_and_send_response(meeting, socket)
@@ -77,45 +104,44 @@ class LifecycleCoordinator:
             return None
 
         # 4. Create repos
-        broadcast_repo = BroadcastRepo(channels)
+        broadcast_repo = BroadcastRepo(channels, get_delta_coalescer())
         subscription_repo = SubscriptionRepo(channels)
 
-        # 5. Create context for services (no channels field)
+        # 5. Create context for services; messages open their own sessions
         context = WSContext(
             socket=socket,
             meeting=meeting,
-            session=session,
+            session_factory=session_factory,
+            subscription=subscription_repo,
         )
 
-        # 6. Create service factory with broadcast repo
-        from app.ws.shared.factory import WSServiceFactory
+        # 6. Create watcher; the end-of-meeting job also opens its own session
+        status_writer = get_status_writer()
 
-        factory = WSServiceFactory(session, broadcast_repo)
+        def create_summary_service(session: AsyncSession) -> MeetingSummaryService:
+            from app.ws.shared.factory import WSServiceFactory
 
-        # 7. Create meeting summary service for watcher
-        participant_repo = ParticipantRepo(session)
-        meeting_summary_repo = MeetingSummaryRepo(session)
+            factory = WSServiceFactory(session, broadcast_repo, status_writer)
+            return factory.create_summary_service()
 
-        meeting_summary_service = MeetingSummaryService(
-            engagement_service=factory.engagement_service,
-            participant_repo=participant_repo,
-            meeting_summary_repo=meeting_summary_repo,
-        )
-
-        # 8. Create watcher with dependencies
         watcher = MeetingEndWatcher(
-            meeting_summary_service=meeting_summary_service,
+            create_summary_service=create_summary_service,
             broadcast_repo=broadcast_repo,
+            session_factory=session_factory,
+            status_writer=status_writer,
+            payload_cache=snapshot_payload_cache,
+            live_state=live_state_registry,
         )
-        is_closed = anyio.Event()
 
         logger.info("WS lifecycle setup complete for meeting_id=%s", meeting_id)
 
         return LifecycleResult(
             context=context,
-            factory=factory,
+            broadcast_repo=broadcast_repo,
+            status_writer=status_writer,
+            sqlite_writer=get_sqlite_writer(),
             subscription_repo=subscription_repo,
             watcher=watcher,
-            is_closed=is_closed,
+            is_closed=anyio.Event(),
             seconds_remaining=check.seconds_remaining,
         )
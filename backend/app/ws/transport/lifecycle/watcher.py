@@ -2,36 +2,73 @@
 
 import contextlib
 import logging
-from typing import Literal, cast
+from collections.abc import Callable
+from typing import Any, Literal, cast
 
 import anyio
 from litestar import WebSocket
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.config import settings
 from app.models import Meeting
 from app.schema.websocket import MeetingEndedResponse, MeetingSummaryData
 from app.services import MeetingSummaryService
+from app.services.engagement.state import LiveStateRegistry
 from app.utils.datetime import ensure_utc, isoformat_utc
+from app.ws.background.meeting_end import MeetingEndJobs, meeting_end_jobs
+from app.ws.background.write_behind import StatusWriteBehind
 from app.ws.repos.broadcast import BroadcastRepo
+from app.ws.repos.snapshot_payload import SnapshotPayloadCache
 
 logger = logging.getLogger(__name__)
 
+# Builds a summary service whose repos are bound to the given session
+SummaryServiceFactory = Callable[[AsyncSession], MeetingSummaryService]
+
 
 class MeetingEndWatcher:
-    """Watches for meeting end and closes WebSocket connection."""
+    """Watches for meeting end and closes WebSocket connection.
+
+    The summary and the ``meeting_ended`` broadcast are produced by a single
+    end-of-meeting job per meeting; the watchers of all connections await it
+    and then close their own socket. The job runs in its own short-lived
+    session, so a waiting watcher holds no database connection.
+
+    When another worker broadcast ``meeting_ended`` over a shared channels
+    backend, that message may arrive after this worker closed its sockets;
+    the watchers then send the persisted summary to their own socket first.
+    """
 
     def __init__(
         self,
-        meeting_summary_service: MeetingSummaryService,
+        create_summary_service: SummaryServiceFactory,
         broadcast_repo: BroadcastRepo,
+        session_factory: async_sessionmaker[AsyncSession],
+        status_writer: StatusWriteBehind | None = None,
+        jobs: MeetingEndJobs = meeting_end_jobs,
+        payload_cache: SnapshotPayloadCache | None = None,
+        live_state: LiveStateRegistry | None = None,
     ) -> None:
         """Initialize watcher with required services.
 
         Args:
-            meeting_summary_service: Service for computing and persisting meeting summaries
+            create_summary_service: Builds the summary service for the job's session
             broadcast_repo: Repository for broadcasting messages
+            session_factory: Factory for the end-of-meeting job's async session
+            status_writer: Optional write-behind queue flushed before summarizing
+            jobs: Registry running the end-of-meeting job once per meeting
+            payload_cache: Optional cache of serialized snapshots, cleared of
+                the meeting once it ended
+            live_state: Optional registry of live meeting states, cleared of
+                the meeting once it ended
         """
-        self.meeting_summary_service = meeting_summary_service
+        self.create_summary_service = create_summary_service
         self.broadcast_repo = broadcast_repo
+        self.session_factory = session_factory
+        self.status_writer = status_writer
+        self.jobs = jobs
+        self.payload_cache = payload_cache
+        self.live_state = live_state
 
     async def watch(
         self,
@@ -63,23 +100,64 @@ class MeetingEndWatcher:
 
         # Generate and broadcast meeting_ended with summary (only first connection will compute it)
         with contextlib.suppress(Exception):
-            await self._generate_and_broadcast_meeting_ended(meeting)
+            message = await self.end_meeting(meeting)
+            if message is not None:
+                await socket.send_json(message)
 
         # Signal that connection is closed and close socket gracefully
         is_closed.set()
         with contextlib.suppress(Exception):
             await socket.close(code=1000, reason="Meeting ended")
 
-    async def _generate_and_broadcast_meeting_ended(self, meeting: Meeting) -> None:
+    async def end_meeting(self, meeting: Meeting) -> dict[str, Any] | None:
+        """Produce the meeting's summary and ``meeting_ended`` broadcast once.
+
+        Args:
+            meeting: The meeting that ended
+
+        Returns:
+            The ``meeting_ended`` message if another worker broadcast it, for
+            the caller to send to its own connection; None once broadcast here
+        """
+        message: dict[str, Any] | None = await self.jobs.run(
+            meeting.id, lambda: self._generate_and_broadcast_meeting_ended(meeting)
+        )
+        return message
+
+    async def _generate_and_broadcast_meeting_ended(
+        self, meeting: Meeting
+    ) -> dict[str, Any] | None:
         """Generate meeting ended response with summary and broadcast to all connections.
 
+        Runs once per meeting and process. Across processes the summary row
+        is the guard: only the process that inserted it broadcasts, unless
+        each process has its own in-memory channels and must reach its own
+        connections.
+
         Args:
             meeting: The meeting that ended
+
+        Returns:
+            The ``meeting_ended`` message if another worker broadcasts it,
+            None if it was broadcast here
         """
-        # Compute and persist summary (or get cached if already exists)
+        # Compute and persist summary (or get it if another writer already did)
         logger.info("Computing summary for meeting %s", meeting.id)
-        summary = self.meeting_summary_service.persist_summary(meeting)
-
+        if self.status_writer is not None:
+            # Summary is computed from persisted samples
+            await self.status_writer.flush()
+        async with self.session_factory() as session:
+            summary_service = self.create_summary_service(session)
+            summary, created = await session.run_sync(
+                lambda _session: summary_service.persist_summary_once(meeting)
+            )
+            # Make the summary visible to (and unblock) writers in other processes
+            await session.commit()
+        if self.payload_cache is not None:
+            # No client joins an ended meeting
+            self.payload_cache.discard(meeting.id)
+        if self.live_state is not None:
+            self.live_state.discard(meeting.id)
         # Get meeting read schema (includes all meeting metadata)
         meeting_read = meeting.to_read_schema()
         end_ts = isoformat_utc(ensure_utc(meeting.end_ts))
@@ -102,6 +180,13 @@ class MeetingEndWatcher:
             summary=summary_data,
         )
 
+        message = response.model_dump(mode="json")
+        if not created and settings.channels_backend != "memory":
+            # The creator's broadcast may reach our sockets only after they closed
+            logger.info("Summary for meeting %s was produced by another worker", meeting.id)
+            return message
+
         # Broadcast to ALL connections for this meeting
         logger.info("Broadcasting meeting_ended with summary for meeting %s", meeting.id)
-        self.broadcast_repo.send_to_meeting(meeting.id, response.model_dump(mode="json"))
+        self.broadcast_repo.send_to_meeting(meeting.id, message)
+        return None
@@ -0,0 +1,78 @@
+"""
+Convert engagement_samples to or from monthly range partitions (PostgreSQL).
+
+Partitioning lets the sample retention job archive whole months by detaching
+their partitions instead of deleting rows. The table is rewritten in a single
+transaction, so run this with the application stopped.
+
+Usage:
+    python -m scripts.partition_samples                  # partition the table
+    python -m scripts.partition_samples --months-ahead 3
+    python -m scripts.partition_samples --undo           # back to a plain table
+
+Uses the database configured by DATABASE_URL.
+"""
+
+import argparse
+import sys
+
+from sqlalchemy import Engine
+
+from app.config import settings
+from app.db_partitions import is_partitioned, partition_samples_table, unpartition_samples_table
+
+
+def convert(engine: Engine, months_ahead: int, undo: bool = False) -> str:
+    """Partition (or unpartition) engagement_samples if not done yet.
+
+    Args:
+        engine: Engine of a PostgreSQL database
+        months_ahead: Monthly partitions to create after the current month
+        undo: Convert a partitioned table back into a plain one
+
+    Returns:
+        Description of what was done
+
+    Raises:
+        RuntimeError: If the database is not PostgreSQL
+    """
+    if engine.dialect.name != "postgresql":
+        raise RuntimeError("Sample partitioning requires PostgreSQL")
+    with engine.begin() as conn:
+        partitioned = is_partitioned(conn)
+        if undo:
+            if not partitioned:
+                return "engagement_samples is not partitioned"
+            unpartition_samples_table(conn)
+            return "engagement_samples converted back into a plain table"
+        if partitioned:
+            return "engagement_samples is already partitioned"
+        partition_samples_table(conn, months_ahead=months_ahead)
+        return "engagement_samples partitioned by month"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--months-ahead",
+        type=int,
+        default=settings.sample_partition_months_ahead,
+        help="monthly partitions to create after the current month",
+    )
+    parser.add_argument(
+        "--undo", action="store_true", help="convert the table back into a plain table"
+    )
+    args = parser.parse_args(argv)
+
+    from app.db import engine
+
+    try:
+        print(convert(engine, args.months_ahead, undo=args.undo))
+    except RuntimeError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
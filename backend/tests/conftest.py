@@ -5,6 +5,7 @@ import pytest
 from litestar import Litestar
 from litestar.di import Provide
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -15,6 +16,7 @@ if str(ROOT) not in sys.path:
 from app.controllers import MeetingsController, VisitsController  # noqa: E402
 from app.dependencies import dependencies as app_dependencies  # noqa: E402
 from app.migrations import run_migrations  # noqa: E402
+from app.models import Base  # noqa: E402
 
 
 @pytest.fixture()
@@ -34,6 +36,15 @@ def session_factory(test_engine):
     return sessionmaker(bind=test_engine, autoflush=False, autocommit=False, future=True)
 
 
+@pytest.fixture()
+async def async_session_factory():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(bind=engine, expire_on_commit=False)
+    await engine.dispose()
+
+
 @pytest.fixture()
 def provide_test_session(session_factory):
     def _provider():
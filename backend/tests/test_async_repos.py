@@ -0,0 +1,83 @@
+"""Tests for the async repositories used by WebSocket handlers and background tasks."""
+
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import inspect
+
+from app.models import EngagementSample, Meeting, Participant
+from app.repos import AsyncEngagementRepo, AsyncMeetingRepo, AsyncParticipantRepo
+
+
+async def test_async_repos_read_active_meeting(async_session_factory):
+    now = datetime.now(tz=UTC)
+    bucket = now.replace(second=0, microsecond=0)
+
+    async with async_session_factory() as session:
+        active = Meeting(
+            id="active", start_ts=now - timedelta(minutes=5), end_ts=now + timedelta(hours=1)
+        )
+        ended = Meeting(
+            id="ended", start_ts=now - timedelta(hours=2), end_ts=now - timedelta(hours=1)
+        )
+        participant = Participant(id="p1", meeting_id="active", device_fingerprint="fp-1")
+        session.add_all([active, ended, participant])
+        await session.flush()
+        session.add_all(
+            [
+                EngagementSample(
+                    participant_id="p1", meeting_id="active", bucket=bucket, status="engaged"
+                ),
+                EngagementSample(
+                    participant_id="p1",
+                    meeting_id="active",
+                    bucket=bucket - timedelta(minutes=1),
+                    status="speaking",
+                ),
+            ]
+        )
+        await session.commit()
+
+    async with async_session_factory() as session:
+        meetings = await AsyncMeetingRepo(session).get_active_meetings(now)
+        assert [meeting.id for meeting in meetings] == ["active"]
+        assert [p.id for p in meetings[0].participants] == ["p1"]
+
+        loaded = await AsyncMeetingRepo(session).get_with_participants("active")
+        assert loaded is not None
+        assert [p.id for p in loaded.participants] == ["p1"]
+        assert "engagement_samples" in inspect(loaded.participants[0]).unloaded
+
+        participants = await AsyncParticipantRepo(session).get_for_meeting("active")
+        assert [p.id for p in participants] == ["p1"]
+
+
+async def test_latest_statuses_are_loaded_for_many_meetings_at_once(async_session_factory):
+    bucket = datetime(2025, 6, 1, 9, 30, tzinfo=UTC)
+
+    async with async_session_factory() as session:
+        for meeting_id in ("m1", "m2", "m3"):
+            session.add(Meeting(id=meeting_id, start_ts=bucket, end_ts=bucket))
+            session.add(
+                Participant(
+                    id=f"{meeting_id}-p", meeting_id=meeting_id, device_fingerprint=meeting_id
+                )
+            )
+        await session.flush()
+        for minutes, status in ((2, "speaking"), (1, "engaged"), (-1, "disengaged")):
+            for meeting_id in ("m1", "m2"):
+                session.add(
+                    EngagementSample(
+                        participant_id=f"{meeting_id}-p",
+                        meeting_id=meeting_id,
+                        bucket=bucket - timedelta(minutes=minutes),
+                        status=status,
+                    )
+                )
+        await session.commit()
+
+    async with async_session_factory() as session:
+        repo = AsyncEngagementRepo(session)
+        latest = await repo.get_latest_statuses(["m1", "m2", "m3"], end=bucket)
+        assert latest == {"m1": {"m1-p": "engaged"}, "m2": {"m2-p": "engaged"}}
+        assert await repo.get_latest_statuses(["m2"]) == {"m2": {"m2-p": "disengaged"}}
+        assert await repo.get_latest_statuses([]) == {}
@@ -0,0 +1,172 @@
+"""Tests for adaptive per-meeting broadcast intervals."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+from sqlalchemy import event
+
+from app.models import Meeting, Participant
+from app.services.engagement.bucketing import BucketManager
+from app.services.engagement.smoothing import SmoothingAlgorithm, SmoothingFactory
+from app.services.engagement.state import LiveStateRegistry
+from app.utils.metrics import metrics
+from app.ws.background import PeriodicBroadcaster, periodic_broadcaster
+from app.ws.background.cadence import AdaptiveCadence
+
+
+def _cadence() -> AdaptiveCadence:
+    return AdaptiveCadence(base_interval=10, min_interval=2, max_interval=60, busy_participants=10)
+
+
+def test_busy_meetings_speed_up_and_idle_meetings_back_off():
+    cadence = _cadence()
+    assert cadence.is_due("busy", 0)
+
+    # New meetings start at the base interval
+    assert cadence.update("busy", 0, participants=25, version=1) == 10
+    assert cadence.update("idle", 0, participants=5, version=1) == 10
+    assert not cadence.is_due("busy", 5)
+    assert cadence.is_due("busy", 10)
+
+    # Changed state with many participants: minimum interval
+    assert cadence.update("busy", 10, participants=25, version=7) == 2
+    # Changed state with few participants: base interval
+    assert cadence.update("idle", 10, participants=5, version=2) == 10
+
+    # Unchanged state backs off exponentially up to the cap
+    intervals = [cadence.update("idle", 20 + idx, participants=5, version=2) for idx in range(5)]
+    assert intervals == [20, 40, 60, 60, 60]
+
+    # Single-participant meetings back off even while active
+    cadence.update("solo", 0, participants=1, version=1)
+    assert cadence.update("solo", 10, participants=1, version=2) == 20
+
+
+def test_only_recently_seen_participants_are_present():
+    cadence = _cadence()
+    now = datetime.now(tz=UTC)
+    last_seen = [
+        None,
+        now - timedelta(hours=2),
+        now - timedelta(seconds=30),
+        # SQLite hands back naive UTC timestamps
+        (now - timedelta(seconds=5)).replace(tzinfo=None),
+    ]
+    assert cadence.present_participants(last_seen, now) == 2
+
+
+async def test_participants_who_left_do_not_keep_a_meeting_busy(async_session_factory, monkeypatch):
+    now = datetime.now(tz=UTC)
+    async with async_session_factory() as session:
+        session.add(
+            Meeting(id="m1", start_ts=now - timedelta(hours=3), end_ts=now + timedelta(hours=1))
+        )
+        for idx in range(12):
+            # Most participants left hours ago; two are still around
+            seen = now - (timedelta(seconds=10) if idx < 2 else timedelta(hours=2))
+            session.add(
+                Participant(
+                    id=f"p{idx}", meeting_id="m1", device_fingerprint=f"fp{idx}", last_seen_at=seen
+                )
+            )
+        await session.commit()
+
+    clock = [1000.0]
+    monkeypatch.setattr(periodic_broadcaster.time, "monotonic", lambda: clock[0])
+    live_state = LiveStateRegistry()
+    cadence = _cadence()
+    broadcaster = PeriodicBroadcaster(
+        session_factory=async_session_factory,
+        broadcast_repo=MagicMock(coalescer=None),
+        bucket_manager=BucketManager(),
+        smoothing_strategy=SmoothingFactory.create(SmoothingAlgorithm.NONE),
+        live_state=live_state,
+        interval_seconds=10,
+        cadence=cadence,
+    )
+    await broadcaster.start()
+    try:
+        await broadcaster._broadcast_active_meetings()
+        live_state.record_status("m1", "p0", "speaking")
+        clock[0] += 10
+        await broadcaster._broadcast_active_meetings()
+    finally:
+        await broadcaster.stop()
+
+    # A changed meeting with two present participants stays at the base interval
+    assert cadence.stats()["m1"] == {"interval_seconds": 10, "participants": 2}
+
+
+def test_ticks_at_the_minimum_interval_are_not_skipped():
+    cadence = _cadence()
+    cadence.update("busy", 0, participants=25, version=1)
+    cadence.update("busy", 10, participants=25, version=2)
+    # Ticks arrive a little late or early; the meeting stays due every tick
+    assert cadence.is_due("busy", 11.9)
+
+
+def test_intervals_are_exposed_as_metric_and_pruned():
+    cadence = _cadence()
+    PeriodicBroadcaster(
+        session_factory=MagicMock(),
+        broadcast_repo=MagicMock(coalescer=None),
+        bucket_manager=BucketManager(),
+        smoothing_strategy=SmoothingFactory.create(SmoothingAlgorithm.NONE),
+        live_state=LiveStateRegistry(),
+        cadence=cadence,
+    )
+    cadence.update("a", 0, participants=3, version=1)
+    cadence.update("b", 0, participants=12, version=1)
+
+    stats = metrics.collect()["broadcaster_meeting_intervals"]
+    assert stats == {
+        "a": {"interval_seconds": 10, "participants": 3},
+        "b": {"interval_seconds": 10, "participants": 12},
+    }
+
+    cadence.retain(["b"])
+    assert list(metrics.collect()["broadcaster_meeting_intervals"]) == ["b"]
+
+
+async def test_ticks_between_refreshes_do_not_query(async_session_factory, monkeypatch):
+    now = datetime.now(tz=UTC)
+    async with async_session_factory() as session:
+        session.add(
+            Meeting(id="m1", start_ts=now - timedelta(minutes=5), end_ts=now + timedelta(hours=1))
+        )
+        session.add(Participant(id="p1", meeting_id="m1", device_fingerprint="fp1"))
+        await session.commit()
+
+    clock = [1000.0]
+    monkeypatch.setattr(periodic_broadcaster.time, "monotonic", lambda: clock[0])
+    broadcaster = PeriodicBroadcaster(
+        session_factory=async_session_factory,
+        broadcast_repo=MagicMock(coalescer=None),
+        bucket_manager=BucketManager(),
+        smoothing_strategy=SmoothingFactory.create(SmoothingAlgorithm.NONE),
+        live_state=LiveStateRegistry(),
+        interval_seconds=10,
+        cadence=_cadence(),
+    )
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = async_session_factory.kw["bind"].sync_engine
+    await broadcaster.start()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        queries = []
+        for _ in range(6):
+            await broadcaster._broadcast_active_meetings()
+            queries.append(len(statements))
+            clock[0] += 2
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+        await broadcaster.stop()
+
+    # The first tick loads the meetings; the next refresh is due a base interval later
+    assert queries[0] > 0
+    assert queries[1:5] == [queries[0]] * 4
+    assert queries[5] > queries[4]
@@ -0,0 +1,52 @@
+"""Tests for broadcast payload serialization."""
+
+import json
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.schema.engagement.messages import DeltaMessage, RollupData
+from app.ws.repos.broadcast import BroadcastRepo
+from app.ws.repos.encoding import create_encoder, decode_event
+
+
+def _delta() -> DeltaMessage:
+    return DeltaMessage(
+        data=RollupData(
+            meeting_id="m1",
+            bucket=datetime(2025, 1, 1, 10, 0, tzinfo=UTC),
+            overall=50.0,
+            participants={"a": 100.0, "b": 0.0},
+        )
+    )
+
+
+@pytest.mark.parametrize("name", ["pydantic", "orjson", "msgspec"])
+def test_encoders_match_model_dump_json(name):
+    if name != "pydantic":
+        pytest.importorskip(name)
+    message = _delta()
+
+    encoded = create_encoder(name)(message)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == json.loads(message.model_dump_json())
+    assert json.loads(create_encoder(name)({"type": "meeting_started"})) == {
+        "type": "meeting_started"
+    }
+
+
+def test_unknown_encoder_is_rejected():
+    with pytest.raises(ValueError, match="Unknown JSON encoder"):
+        create_encoder("pickle")
+
+
+def test_publish_sends_bytes_and_decode_is_shared():
+    channels = MagicMock()
+    BroadcastRepo(channels).publish("m1", _delta().data)
+
+    payload = channels.publish.call_args_list[0].kwargs["data"]
+    assert isinstance(payload, bytes)
+    assert decode_event(payload) is decode_event(payload)
+    assert json.loads(decode_event(payload))["type"] == "delta"
@@ -0,0 +1,81 @@
+"""Tests for sharding periodic broadcasts across workers."""
+
+from datetime import UTC, datetime, timedelta
+
+from app.ws.background.ownership import ConsistentHashRing, MeetingOwnership
+
+NOW = datetime(2025, 5, 5, 12, 0, tzinfo=UTC)
+MEETINGS = [f"meeting-{idx}" for idx in range(40)]
+
+
+def test_ring_spreads_keys_and_only_moves_keys_of_removed_node():
+    ring = ConsistentHashRing(["a", "b", "c"])
+    owners = {key: ring.owner(key) for key in MEETINGS}
+    assert set(owners.values()) == {"a", "b", "c"}
+
+    smaller = ConsistentHashRing(["a", "b"])
+    for key, owner in owners.items():
+        if owner != "c":
+            assert smaller.owner(key) == owner
+    assert ConsistentHashRing([]).owner("x") is None
+
+
+async def _acquire(session_factory, worker: MeetingOwnership, now: datetime) -> set[str]:
+    async with session_factory() as session:
+        return await worker.acquire(session, MEETINGS, now)
+
+
+async def test_workers_never_share_a_meeting_and_converge(async_session_factory):
+    first = MeetingOwnership("worker-1", lease_seconds=30)
+    second = MeetingOwnership("worker-2", lease_seconds=30)
+
+    # Alone, the first worker owns everything
+    assert await _acquire(async_session_factory, first, NOW) == set(MEETINGS)
+
+    # The second worker joins but has to wait until leases are handed over
+    assert await _acquire(async_session_factory, second, NOW) == set()
+    owned_first = await _acquire(async_session_factory, first, NOW + timedelta(seconds=10))
+    owned_second = await _acquire(async_session_factory, second, NOW + timedelta(seconds=10))
+
+    assert owned_first.isdisjoint(owned_second)
+    assert owned_first | owned_second == set(MEETINGS)
+    assert owned_first and owned_second
+
+
+async def test_meetings_fail_over_when_a_worker_dies(async_session_factory):
+    first = MeetingOwnership("worker-1", lease_seconds=30)
+    second = MeetingOwnership("worker-2", lease_seconds=30)
+    await _acquire(async_session_factory, first, NOW)
+    await _acquire(async_session_factory, second, NOW)
+    await _acquire(async_session_factory, first, NOW)
+    assert await _acquire(async_session_factory, second, NOW) != set()
+
+    # The second worker stops heartbeating; its leases are honoured until they expire
+    owned = await _acquire(async_session_factory, first, NOW + timedelta(seconds=20))
+    assert owned != set(MEETINGS)
+    owned = await _acquire(async_session_factory, first, NOW + timedelta(seconds=31))
+    assert owned == set(MEETINGS)
+
+
+async def test_leaving_worker_hands_over_immediately(async_session_factory):
+    first = MeetingOwnership("worker-1", lease_seconds=30)
+    second = MeetingOwnership("worker-2", lease_seconds=30)
+    await _acquire(async_session_factory, first, NOW)
+    await _acquire(async_session_factory, second, NOW)
+    await _acquire(async_session_factory, first, NOW)
+    await _acquire(async_session_factory, second, NOW)
+
+    async with async_session_factory() as session:
+        await second.leave(session)
+    assert await _acquire(async_session_factory, first, NOW + timedelta(seconds=1)) == set(MEETINGS)
+
+
+async def test_leases_expire_by_the_database_clock(async_session_factory):
+    # This worker's clock lags far behind the database's
+    lagging = MeetingOwnership("worker-1", lease_seconds=30)
+    current = MeetingOwnership("worker-2", lease_seconds=30)
+    assert await _acquire(async_session_factory, lagging, NOW) == set(MEETINGS)
+
+    async with async_session_factory() as session:
+        owned = await current.acquire(session, MEETINGS)
+    assert owned == set(MEETINGS)
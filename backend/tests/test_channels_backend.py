@@ -0,0 +1,99 @@
+"""Tests for channels backend selection."""
+
+import asyncio
+import json
+from datetime import UTC, datetime
+
+import anyio
+import pytest
+from litestar.channels.backends.asyncpg import AsyncPgChannelsBackend
+from litestar.channels.backends.memory import MemoryChannelsBackend
+
+from app.config import Settings
+from app.schema.engagement.messages import RollupData
+from app.ws.repos.broadcast import BroadcastRepo
+from app.ws.repos.sequencer import DeltaSequencer
+from app.ws.repos.subscription import SubscriptionRepo
+from app.ws.shared.channels import (
+    NOTIFY_PAYLOAD_LIMIT,
+    NotifyChannelsBackend,
+    create_channels_backend,
+    create_channels_plugin,
+)
+
+BUCKET = datetime(2025, 1, 1, 10, 0, tzinfo=UTC)
+
+
+def test_memory_backend_is_default():
+    config = Settings(database_url="sqlite:///:memory:", channels_backend="memory")
+    assert isinstance(create_channels_backend(config), MemoryChannelsBackend)
+    assert config.live_state_max_age_seconds is None
+
+
+def test_postgres_backend_uses_database_dsn():
+    config = Settings(
+        database_url="postgresql+psycopg2://bsbox:secret@db:5432/bsbox",
+        channels_backend="postgres",
+    )
+    backend = create_channels_backend(config)
+    assert isinstance(backend, AsyncPgChannelsBackend)
+    assert config.live_state_max_age_seconds == 10.0
+
+
+def test_redis_backend():
+    pytest.importorskip("redis")
+    from litestar.channels.backends.redis import RedisChannelsStreamBackend
+
+    config = Settings(channels_backend="redis", redis_url="redis://localhost:6379/0")
+    plugin = create_channels_plugin(config)
+    assert isinstance(plugin._backend, RedisChannelsStreamBackend)
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="Unknown channels backend"):
+        create_channels_backend(Settings(channels_backend="kafka"))
+
+
+async def test_postgres_backend_drops_payloads_over_the_notify_limit():
+    backend = create_channels_backend(
+        Settings(database_url="postgresql://bsbox@db/bsbox", channels_backend="postgres")
+    )
+    assert isinstance(backend, NotifyChannelsBackend)
+    dropped = backend.dropped.value
+
+    # Rejected before any connection is made
+    await backend.publish(b"x" * NOTIFY_PAYLOAD_LIMIT, ["meeting:m1:delta"])
+
+    assert backend.dropped.value == dropped + 1
+
+
+async def test_redis_backend_fans_broadcasts_out_across_workers(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    from redis.asyncio import Redis
+
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(Redis, "from_url", lambda url: fakeredis.aioredis.FakeRedis(server=server))
+    config = Settings(channels_backend="redis", redis_url="redis://localhost:6379/0")
+    publisher, subscriber = create_channels_plugin(config), create_channels_plugin(config)
+
+    async with publisher, subscriber:
+        repo = SubscriptionRepo(subscriber)
+        stream = repo.subscribe_to_meeting("m1", anyio.Event())
+        received = asyncio.ensure_future(anext(stream))
+        while repo._deltas is None:
+            await asyncio.sleep(0)
+
+        rollup = RollupData(
+            meeting_id="m1", bucket=BUCKET, overall=100.0, participants={"a": 100.0}
+        )
+        BroadcastRepo(publisher, sequencer=DeltaSequencer()).publish("m1", rollup)
+
+        event = json.loads(await asyncio.wait_for(received, timeout=5))
+        assert event["type"] == "delta"
+        assert event["data"]["participants"] == {"a": 100.0}
+        await stream.aclose()
+    # Let fakeredis finish the blocking XREAD the stopped workers left behind
+    leftover = asyncio.all_tasks() - {asyncio.current_task()}
+    if leftover:
+        await asyncio.wait(leftover, timeout=1)
@@ -0,0 +1,49 @@
+"""Tests for connection pool telemetry."""
+
+import logging
+import threading
+import time
+
+from sqlalchemy import create_engine, text
+
+from app.db_pool import PoolTelemetry, TimedQueuePool
+from app.utils.metrics import MetricsRegistry
+
+
+def test_pool_telemetry_reports_usage_and_slow_checkouts(tmp_path, caplog):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=TimedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=5,
+    )
+    registry = MetricsRegistry()
+    telemetry = PoolTelemetry("test", slow_checkout_seconds=0.1, registry=registry)
+    telemetry.instrument(engine)
+
+    first = engine.connect()
+    second = engine.connect()
+    first.execute(text("SELECT 1"))
+    assert telemetry.in_use.value == 2
+    assert telemetry.overflow.value == 1
+    assert telemetry.slow_checkouts.value == 0
+
+    # The pool is exhausted: the next checkout waits until a connection returns
+    threading.Timer(0.2, first.close).start()
+    started = time.perf_counter()
+    with caplog.at_level(logging.WARNING, logger="app.db_pool"):
+        third = engine.connect()
+    assert time.perf_counter() - started >= 0.2
+    assert telemetry.slow_checkouts.value == 1
+    assert "Waited" in caplog.text
+
+    third.close()
+    second.close()
+    assert telemetry.in_use.value == 0
+    assert telemetry.overflow.value == 0
+
+    waits = registry.collect()["db_pool_test_checkout_wait_seconds"]
+    assert waits["count"] == 3
+    assert waits["buckets"]["0.1"] == 2
+    engine.dispose()
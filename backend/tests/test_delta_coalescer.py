@@ -0,0 +1,122 @@
+"""Tests for per-meeting delta coalescing."""
+
+import asyncio
+import threading
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+from app.models import Meeting, Participant
+from app.schema.engagement.messages import RollupData
+from app.services.engagement.state import LiveStateRegistry
+from app.ws.background.delta_coalescer import DeltaCoalescer
+from app.ws.background.periodic_broadcaster import PeriodicBroadcaster
+from app.ws.repos.broadcast import BroadcastRepo
+
+BUCKET = datetime(2025, 1, 1, 10, 0, tzinfo=UTC)
+
+
+async def test_burst_emits_single_delta_with_latest_state():
+    registry = LiveStateRegistry()
+    registry.load_statuses("m1", [Participant(id="a", meeting_id="m1", device_fingerprint="a")], {})
+    broadcast_repo = MagicMock(spec=BroadcastRepo)
+    coalescer = DeltaCoalescer(MagicMock(), broadcast_repo, registry, window_seconds=0.05)
+    await coalescer.start()
+
+    for status in ("engaged", "disengaged", "speaking"):
+        registry.record_status("m1", "a", status)
+        coalescer.mark_dirty("m1", BUCKET)
+    coalescer.mark_dirty("m1", BUCKET + timedelta(minutes=1))
+    await asyncio.sleep(0.15)
+    await coalescer.stop()
+
+    broadcast_repo.publish.assert_called_once()
+    meeting_id, rollup = broadcast_repo.publish.call_args.args
+    assert meeting_id == "m1"
+    assert isinstance(rollup, RollupData)
+    assert rollup.bucket == BUCKET + timedelta(minutes=1)
+    assert rollup.participants == {"a": 100.0}
+
+
+async def test_cache_miss_rebuilds_state_from_database(async_session_factory):
+    now = datetime.now(tz=UTC)
+    async with async_session_factory() as session:
+        session.add(Meeting(id="m1", start_ts=now, end_ts=now + timedelta(hours=1)))
+        session.add(
+            Participant(id="a", meeting_id="m1", device_fingerprint="a", last_status="engaged")
+        )
+        await session.commit()
+
+    registry = LiveStateRegistry()
+    broadcast_repo = MagicMock(spec=BroadcastRepo)
+    coalescer = DeltaCoalescer(async_session_factory, broadcast_repo, registry)
+
+    coalescer.mark_dirty("m1", BUCKET)
+    assert coalescer.pending_count == 1
+    assert await coalescer.flush(force=True) == 1
+
+    assert registry.get("m1") is not None
+    assert broadcast_repo.publish.call_args.args[1].overall == 100.0
+
+
+async def test_rollups_run_on_the_broadcaster_pool_within_its_deadline(monkeypatch):
+    registry = LiveStateRegistry()
+    for meeting_id in ("fast", "slow"):
+        registry.load_statuses(
+            meeting_id,
+            [Participant(id=f"{meeting_id}-a", meeting_id=meeting_id, device_fingerprint="a")],
+            {},
+        )
+    broadcast_repo = MagicMock(spec=BroadcastRepo)
+    coalescer = DeltaCoalescer(MagicMock(), broadcast_repo, registry, window_seconds=0)
+    broadcast_repo.coalescer = coalescer
+    broadcaster = PeriodicBroadcaster(
+        session_factory=MagicMock(),
+        broadcast_repo=broadcast_repo,
+        bucket_manager=MagicMock(),
+        smoothing_strategy=MagicMock(),
+        live_state=registry,
+        interval_seconds=10,
+        tick_deadline_seconds=0.05,
+        max_workers=2,
+    )
+    await broadcaster.start()
+    compute_rollup = broadcaster._compute_rollup
+    threads = []
+    release = threading.Event()
+
+    def compute(meeting_id, bucket):
+        threads.append(threading.current_thread())
+        if meeting_id == "slow":
+            release.wait(1)
+        return compute_rollup(meeting_id, bucket)
+
+    monkeypatch.setattr(broadcaster, "_compute_rollup", compute)
+    skipped = broadcaster.skipped_rollups.value
+    try:
+        coalescer.mark_dirty("fast", BUCKET)
+        coalescer.mark_dirty("slow", BUCKET)
+        assert await coalescer.flush() == 1
+    finally:
+        release.set()
+        await broadcaster.stop()
+
+    assert threading.main_thread() not in threads
+    assert broadcast_repo.publish.call_args.args[0] == "fast"
+    assert broadcaster.skipped_rollups.value == skipped + 1
+    # The skipped meeting is emitted by a later flush
+    assert coalescer.pending_count == 1
+    assert await coalescer.flush(force=True) == 1
+    assert broadcast_repo.publish.call_args.args[0] == "slow"
+
+
+def test_publish_rollup_marks_meeting_dirty_when_coalescing():
+    coalescer = MagicMock(spec=DeltaCoalescer)
+    channels = MagicMock()
+    engagement_service = MagicMock()
+    meeting = Meeting(id="m1")
+
+    BroadcastRepo(channels, coalescer).publish_rollup(meeting, BUCKET, engagement_service)
+
+    coalescer.mark_dirty.assert_called_once_with("m1", BUCKET)
+    engagement_service.bucket_rollup.assert_not_called()
+    channels.publish.assert_not_called()
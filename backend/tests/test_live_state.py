@@ -0,0 +1,90 @@
+"""Tests for the in-memory live engagement state used by bucket rollups."""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+from app.models import Participant
+from app.services.engagement.bucketing import BucketManager
+from app.services.engagement.smoothing.no_smoothing import NoSmoothingStrategy
+from app.services.engagement.state import LiveStateRegistry, MeetingEngagementState
+from app.services.engagement.summary.snapshot_builder import SnapshotBuilder
+
+
+def _participant(pid: str, last_status: str | None = None) -> Participant:
+    participant = Participant(id=pid, meeting_id="test-meeting", device_fingerprint=pid)
+    participant.last_status = last_status
+    return participant
+
+
+def test_state_tracks_engaged_count_incrementally():
+    """Status transitions adjust the engaged count without rescanning."""
+    state = MeetingEngagementState("test-meeting")
+    state.add_participant("a")
+    state.add_participant("b", "speaking")
+    assert state.engaged_count == 1
+
+    state.set_status("a", "engaged")
+    state.set_status("b", "disengaged")
+    state.set_status("a", "speaking")
+    assert state.engaged_count == 1
+
+    rollup = state.rollup(datetime(2025, 1, 1, 10, 0, tzinfo=UTC))
+    assert rollup.participants == {"a": 100.0, "b": 0.0}
+    assert rollup.overall == 50.0
+
+
+def test_registry_load_overlays_latest_status():
+    """Rebuild seeds last_status and overlays the latest sample's status."""
+    registry = LiveStateRegistry()
+    latest = {"a": "disengaged", "ghost": "engaged"}
+
+    state = registry.load_statuses(
+        "m", [_participant("a", "engaged"), _participant("b", "speaking")], latest
+    )
+
+    assert state.statuses == {"a": "disengaged", "b": "speaking"}
+    assert state.engaged_count == 1
+    assert registry.get("m") is state
+
+
+def test_bucket_rollup_reads_live_state_after_first_load():
+    """Only a cache miss touches the repositories; updates are applied in memory."""
+    engagement_repo = MagicMock()
+    participant_repo = MagicMock()
+    participant_repo.get_for_meeting.return_value = [_participant("a"), _participant("b")]
+    engagement_repo.get_latest_statuses.return_value = {}
+
+    registry = LiveStateRegistry()
+    builder = SnapshotBuilder(
+        engagement_repo=engagement_repo,
+        participant_repo=participant_repo,
+        bucket_manager=BucketManager(),
+        smoothing_strategy=NoSmoothingStrategy(),
+        live_state=registry,
+    )
+    meeting = MagicMock(id="test-meeting")
+    now = datetime.now(tz=UTC)
+
+    assert builder.bucket_rollup(meeting, now)["overall"] == 0.0
+
+    registry.record_status("test-meeting", "a", "engaged")
+    registry.add_participant("test-meeting", "c", None)
+    result = builder.bucket_rollup(meeting, now)
+
+    assert result["participants"] == {"a": 100.0, "b": 0.0, "c": 0.0}
+    assert participant_repo.get_for_meeting.call_count == 1
+    assert engagement_repo.get_latest_statuses.call_count == 1
+
+    registry.retain([])
+    builder.bucket_rollup(meeting, now)
+    assert participant_repo.get_for_meeting.call_count == 2
+
+
+def test_registry_expires_states_after_max_age(monkeypatch):
+    """States older than max_age_seconds are treated as cache misses."""
+    registry = LiveStateRegistry(max_age_seconds=5)
+    state = registry.load_statuses("m", [_participant("a")], {})
+    assert registry.get("m") is state
+
+    monkeypatch.setattr(state, "loaded_at", state.loaded_at - 6)
+    assert registry.get("m") is None
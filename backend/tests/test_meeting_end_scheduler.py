@@ -0,0 +1,150 @@
+"""Tests for the central meeting end scheduler."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import anyio
+
+from app.models import Meeting
+from app.utils.metrics import Gauge
+from app.ws.background import MeetingEndScheduler
+
+
+class FakeClock:
+    """Monotonic clock advanced by the test."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _meeting(meeting_id: str) -> Meeting:
+    now = datetime.now(tz=UTC)
+    return Meeting(id=meeting_id, start_ts=now, end_ts=now + timedelta(seconds=1))
+
+
+async def _fire_due(scheduler: MeetingEndScheduler) -> None:
+    """Fire the due timers and wait until their sockets are closed."""
+    await asyncio.gather(*scheduler._fire_due())
+
+
+async def test_one_timer_per_meeting_closes_all_sockets():
+    clock = FakeClock()
+    gauge = Gauge("pending", "")
+    scheduler = MeetingEndScheduler(close_batch_size=2, gauge=gauge, clock=clock)
+    ended = []
+
+    async def on_end(meeting):
+        ended.append(meeting.id)
+
+    connections = []
+    for meeting_id, delay in (("early", 20), ("late", 80)):
+        meeting = _meeting(meeting_id)
+        for _ in range(5):
+            socket, is_closed = AsyncMock(), anyio.Event()
+            scheduler.register(meeting, socket, is_closed, delay, on_end)
+            connections.append((meeting_id, socket, is_closed))
+
+    assert scheduler.pending_timers == 2
+    assert gauge.value == 2
+
+    clock.advance(19)
+    await _fire_due(scheduler)
+    assert ended == []
+
+    clock.advance(1)
+    await _fire_due(scheduler)
+    assert ended == ["early"]
+    assert scheduler.pending_timers == 1
+    assert gauge.value == 1
+    for meeting_id, _socket, is_closed in connections:
+        assert is_closed.is_set() == (meeting_id == "early")
+
+    clock.advance(60)
+    await _fire_due(scheduler)
+    assert ended == ["early", "late"]
+    assert gauge.value == 0
+    for _, socket, is_closed in connections:
+        assert is_closed.is_set()
+        socket.close.assert_called_once_with(code=1000, reason="Meeting ended")
+
+
+async def test_unregistered_connections_are_not_closed():
+    clock = FakeClock()
+    scheduler = MeetingEndScheduler(gauge=Gauge("pending", ""), clock=clock)
+    on_end = AsyncMock(return_value=None)
+    meeting = _meeting("m1")
+    kept, dropped = AsyncMock(), AsyncMock()
+
+    scheduler.register(meeting, kept, anyio.Event(), 20, on_end)
+    scheduler.register(meeting, dropped, anyio.Event(), 20, on_end)
+    scheduler.unregister("m1", dropped)
+    assert scheduler.pending_timers == 1
+
+    clock.advance(20)
+    await _fire_due(scheduler)
+    kept.close.assert_called_once()
+    dropped.close.assert_not_called()
+    on_end.assert_awaited_once_with(meeting)
+
+    # The last connection leaving drops the meeting's timer altogether
+    scheduler.register(meeting, dropped, anyio.Event(), 20, on_end)
+    scheduler.unregister("m1", dropped)
+    assert scheduler.pending_timers == 0
+    clock.advance(20)
+    await _fire_due(scheduler)
+    dropped.close.assert_not_called()
+    on_end.assert_awaited_once()
+
+
+async def test_summary_of_another_worker_is_sent_before_closing():
+    clock = FakeClock()
+    scheduler = MeetingEndScheduler(gauge=Gauge("pending", ""), clock=clock)
+    message = {"type": "meeting_ended", "summary": {"max_participants": 3}}
+    # Another worker stored the summary and broadcast before these sockets subscribed
+    on_end = AsyncMock(return_value=message)
+    meeting = _meeting("m1")
+    open_socket, closed_socket = AsyncMock(), AsyncMock()
+    closed = anyio.Event()
+
+    scheduler.register(meeting, open_socket, anyio.Event(), 20, on_end)
+    scheduler.register(meeting, closed_socket, closed, 20, on_end)
+    closed.set()
+
+    clock.advance(20)
+    await _fire_due(scheduler)
+    on_end.assert_awaited_once_with(meeting)
+    open_socket.send_json.assert_awaited_once_with(message)
+    open_socket.close.assert_called_once_with(code=1000, reason="Meeting ended")
+    closed_socket.send_json.assert_not_called()
+    closed_socket.close.assert_not_called()
+
+
+async def test_earlier_meeting_registered_later_fires_first():
+    clock = FakeClock()
+    scheduler = MeetingEndScheduler(gauge=Gauge("pending", ""), clock=clock)
+    await scheduler.start()
+    ended = []
+    fired = asyncio.Event()
+
+    async def on_end(meeting):
+        ended.append(meeting.id)
+        fired.set()
+
+    try:
+        scheduler.register(_meeting("later"), AsyncMock(), anyio.Event(), 3600, on_end)
+        await asyncio.sleep(0)
+        # The timer task sleeps until "later" is due; an earlier timer must wake it
+        clock.advance(10)
+        scheduler.register(_meeting("sooner"), AsyncMock(), anyio.Event(), 0, on_end)
+        await asyncio.wait_for(fired.wait(), timeout=5)
+        assert ended == ["sooner"]
+        assert scheduler.pending_timers == 1
+    finally:
+        await scheduler.stop()
@@ -1,7 +1,7 @@
 """Tests for meeting timing validation (start/end checks)."""
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -166,9 +166,10 @@ async def test_status_handler_accepts_during_meeting():
     # Mock context
     context = MagicMock(spec=WSContext)
     context.participant = participant
+    context.participant_id = participant.id
     context.meeting = meeting
-    context.session = MagicMock()
-    context.session.commit = MagicMock()
+    context.session = AsyncMock()
+    context.run_sync = AsyncMock(side_effect=lambda fn, *args, **kwargs: fn(*args, **kwargs))
 
     # Mock engagement service
     engagement_service = MagicMock(spec=EngagementService)
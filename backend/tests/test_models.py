@@ -1,6 +1,6 @@
 from datetime import UTC, datetime, timedelta
 
-from app.repos import EngagementRepo, MeetingRepo, ParticipantRepo
+from app.repos import EngagementRepo, MeetingRepo, MeetingSummaryRepo, ParticipantRepo
 from app.schema.visit.requests import VisitRequest
 from app.schema.websocket.requests import JoinRequest, StatusUpdateRequest
 from app.services import EngagementService, ParticipantService
@@ -101,3 +101,144 @@ def test_participant_new_for_different_fingerprint(session_factory):
         join_request2 = JoinRequest(fingerprint="fp-two")
         second = participant_service.create_or_reuse_for_connection(meeting, join_request2)
         assert first.id != second.id
+
+
+def test_upsert_sample_updates_existing_bucket(session_factory):
+    with session_factory() as session:
+        meeting_repo = MeetingRepo(session)
+        participant_repo = ParticipantRepo(session)
+        engagement_repo = EngagementRepo(session)
+
+        start = datetime(2025, 1, 1, 14, 0, tzinfo=UTC)
+        visit_request = VisitRequest(ms_teams_input="https://teams.microsoft.com/meet/upsert_test")
+        meeting = meeting_repo.get_or_create(
+            start_ts=start, end_ts=start + timedelta(hours=1), request=visit_request
+        )
+        first = participant_repo.create(meeting_id=meeting.id, request=JoinRequest(fingerprint="a"))
+        second = participant_repo.create(
+            meeting_id=meeting.id, request=JoinRequest(fingerprint="b")
+        )
+        bucket = start + timedelta(minutes=5)
+
+        created = engagement_repo.upsert_sample(
+            meeting.id, first.id, bucket, StatusUpdateRequest(status="engaged")
+        )
+        updated = engagement_repo.upsert_sample(
+            meeting.id, first.id, bucket, StatusUpdateRequest(status="speaking")
+        )
+        assert updated.id == created.id
+        assert updated.status == "speaking"
+
+        samples = engagement_repo.bulk_upsert_samples(
+            [
+                {
+                    "meeting_id": meeting.id,
+                    "participant_id": first.id,
+                    "bucket": bucket,
+                    "status": "disengaged",
+                },
+                {
+                    "meeting_id": meeting.id,
+                    "participant_id": second.id,
+                    "bucket": bucket,
+                    "status": "engaged",
+                },
+            ]
+        )
+        assert sorted(s.status for s in samples) == ["disengaged", "engaged"]
+
+        stored = engagement_repo.get_samples_for_meeting(meeting.id)
+        assert sorted((s.participant_id == first.id, s.status) for s in stored) == [
+            (False, "engaged"),
+            (True, "disengaged"),
+        ]
+
+        # Rows repeating a (participant_id, bucket) collapse into the last one
+        later = bucket + timedelta(minutes=1)
+        samples = engagement_repo.bulk_upsert_samples(
+            [
+                {
+                    "meeting_id": meeting.id,
+                    "participant_id": first.id,
+                    "bucket": later,
+                    "status": status,
+                }
+                for status in ("engaged", "speaking", "disengaged")
+            ]
+        )
+        assert [s.status for s in samples] == ["disengaged"]
+        assert engagement_repo.get_latest_statuses([meeting.id])[meeting.id][first.id] == (
+            "disengaged"
+        )
+
+
+def test_latest_statuses_return_one_row_per_participant(session_factory):
+    with session_factory() as session:
+        participant_repo = ParticipantRepo(session)
+        engagement_repo = EngagementRepo(session)
+
+        start = datetime(2025, 1, 1, 16, 0, tzinfo=UTC)
+        meeting = MeetingRepo(session).get_or_create(
+            start_ts=start,
+            end_ts=start + timedelta(hours=1),
+            request=VisitRequest(ms_teams_input="https://teams.microsoft.com/meet/latest_test"),
+        )
+        first = participant_repo.create(meeting_id=meeting.id, request=JoinRequest(fingerprint="a"))
+        second = participant_repo.create(
+            meeting_id=meeting.id, request=JoinRequest(fingerprint="b")
+        )
+        idle = participant_repo.create(meeting_id=meeting.id, request=JoinRequest(fingerprint="c"))
+        rows = [
+            (first, 1, "engaged"),
+            (first, 3, "speaking"),
+            (first, 5, "disengaged"),
+            (second, 2, "speaking"),
+        ]
+        engagement_repo.bulk_upsert_samples(
+            [
+                {
+                    "meeting_id": meeting.id,
+                    "participant_id": participant.id,
+                    "bucket": start + timedelta(minutes=minutes),
+                    "status": status,
+                }
+                for participant, minutes, status in rows
+            ]
+        )
+
+        cutoff = start + timedelta(minutes=4)
+        latest = engagement_repo.get_latest_statuses([meeting.id], end=cutoff)
+        assert latest == {meeting.id: {first.id: "speaking", second.id: "speaking"}}
+        assert engagement_repo.get_latest_statuses([meeting.id])[meeting.id][first.id] == (
+            "disengaged"
+        )
+
+        snapshot_builder = SnapshotBuilder(
+            engagement_repo=engagement_repo,
+            participant_repo=participant_repo,
+            bucket_manager=BucketManager(),
+            smoothing_strategy=SmoothingFactory.create(SmoothingAlgorithm.KALMAN),
+        )
+        rollup = snapshot_builder.bucket_rollup(meeting, cutoff)
+        assert rollup["participants"] == {first.id: 100.0, second.id: 100.0, idle.id: 0.0}
+
+
+def test_meeting_summary_create_if_absent_guards_existing_row(session_factory):
+    with session_factory() as session:
+        start = datetime.now(tz=UTC)
+        meeting = MeetingRepo(session).get_or_create(
+            start_ts=start,
+            end_ts=start + timedelta(hours=1),
+            request=VisitRequest(ms_teams_input="https://teams.microsoft.com/meet/summary_guard"),
+        )
+        repo = MeetingSummaryRepo(session)
+
+        created = repo.create_if_absent(meeting.id, 4, 0.6, "healthy")
+        assert created is not None
+        assert created.engagement_level == "healthy"
+
+        # A second writer does not overwrite the existing summary
+        assert repo.create_if_absent(meeting.id, 9, 0.1, "low") is None
+        stored = repo.get(meeting.id)
+        assert stored is not None
+        assert stored.max_participants == 4
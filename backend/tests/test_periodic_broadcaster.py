@@ -0,0 +1,230 @@
+"""Tests for periodic rollups computed on the broadcaster's thread pool."""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import event
+
+from app.models import EngagementSample, Meeting, Participant
+from app.services.engagement.bucketing import BucketManager
+from app.services.engagement.smoothing import SmoothingAlgorithm, SmoothingFactory
+from app.services.engagement.state import LiveStateRegistry
+from app.ws.background import PeriodicBroadcaster, periodic_broadcaster
+
+BUCKET = datetime(2025, 6, 1, 9, 30, tzinfo=UTC)
+
+
+@pytest.fixture()
+async def broadcaster():
+    live_state = LiveStateRegistry()
+    broadcast_repo = MagicMock(coalescer=None)
+    broadcaster = PeriodicBroadcaster(
+        session_factory=MagicMock(),
+        broadcast_repo=broadcast_repo,
+        bucket_manager=BucketManager(),
+        smoothing_strategy=SmoothingFactory.create(SmoothingAlgorithm.NONE),
+        live_state=live_state,
+        interval_seconds=3600,
+        max_workers=2,
+    )
+    await broadcaster.start()
+    yield broadcaster
+    await broadcaster.stop()
+
+
+def _meetings(live_state: LiveStateRegistry, count: int) -> list[Meeting]:
+    meetings = []
+    for idx in range(count):
+        meeting = Meeting(id=f"m{idx}", start_ts=BUCKET, end_ts=BUCKET)
+        state = live_state.load_statuses(meeting.id, [], {})
+        state.set_status("p1", "engaged")
+        state.set_status("p2", "disengaged")
+        meetings.append(meeting)
+    return meetings
+
+
+async def test_rollups_are_computed_on_pool_and_published_in_order(broadcaster):
+    meetings = _meetings(broadcaster.live_state, 5)
+
+    await broadcaster._publish_rollups(meetings, BUCKET, deadline=None)
+
+    calls = broadcaster.broadcast_repo.publish.call_args_list
+    assert [call.args[0] for call in calls] == [meeting.id for meeting in meetings]
+    rollup = calls[0].args[1]
+    assert rollup.overall == 50.0
+    assert rollup.participants == {"p1": 100.0, "p2": 0.0}
+
+
+async def test_rollups_missing_the_deadline_are_skipped_and_counted(broadcaster, monkeypatch):
+    meetings = _meetings(broadcaster.live_state, 3)
+    compute = broadcaster._compute_rollup
+
+    def slow_for_m1(meeting_id, bucket):
+        if meeting_id == "m1":
+            time.sleep(0.3)
+        return compute(meeting_id, bucket)
+
+    monkeypatch.setattr(broadcaster, "_compute_rollup", slow_for_m1)
+    skipped = broadcaster.skipped_rollups.value
+
+    deadline = asyncio.get_running_loop().time() + 0.1
+    await broadcaster._publish_rollups(meetings, BUCKET, deadline=deadline)
+
+    published = [call.args[0] for call in broadcaster.broadcast_repo.publish.call_args_list]
+    assert published == ["m0", "m2"]
+    assert broadcaster.skipped_rollups.value == skipped + 1
+
+
+def test_overrunning_tick_skips_missed_ticks(broadcaster):
+    missed = broadcaster.missed_ticks.value
+
+    # On time: the next tick follows the previous one by one interval
+    assert broadcaster._next_tick(0.0, 10.0) == 3600.0
+    assert broadcaster.missed_ticks.value == missed
+
+    # A tick that ran 2.5 intervals long resumes on the schedule without overlap
+    assert broadcaster._next_tick(0.0, 3600.0 * 2.5) == 3600.0 * 3
+    assert broadcaster.missed_ticks.value == missed + 2
+
+
+async def test_tick_duration_histogram_records_ticks(monkeypatch):
+    broadcaster = PeriodicBroadcaster(
+        session_factory=MagicMock(),
+        broadcast_repo=MagicMock(coalescer=None),
+        bucket_manager=BucketManager(),
+        smoothing_strategy=SmoothingFactory.create(SmoothingAlgorithm.NONE),
+        live_state=LiveStateRegistry(),
+        interval_seconds=0.02,
+    )
+
+    async def tick(deadline=None):
+        return None
+
+    monkeypatch.setattr(broadcaster, "_broadcast_active_meetings", tick)
+    count = broadcaster.tick_duration.count
+    await broadcaster.start()
+    await asyncio.sleep(0.07)
+    await broadcaster.stop()
+
+    assert broadcaster.tick_duration.count >= count + 2
+    buckets = broadcaster.tick_duration.collect()["buckets"]
+    assert isinstance(buckets, dict)
+    assert buckets["inf"] == broadcaster.tick_duration.count
+
+
+async def test_unchanged_meetings_are_not_rebroadcast(async_session_factory, monkeypatch):
+    now = datetime.now(tz=UTC)
+    async with async_session_factory() as session:
+        session.add(
+            Meeting(
+                id="quiet", start_ts=now - timedelta(minutes=5), end_ts=now + timedelta(hours=1)
+            )
+        )
+        await session.commit()
+
+    live_state = LiveStateRegistry()
+    broadcast_repo = MagicMock(coalescer=None)
+    broadcaster = PeriodicBroadcaster(
+        session_factory=async_session_factory,
+        broadcast_repo=broadcast_repo,
+        bucket_manager=BucketManager(),
+        smoothing_strategy=SmoothingFactory.create(SmoothingAlgorithm.NONE),
+        live_state=live_state,
+        interval_seconds=3600,
+        heartbeat_seconds=60,
+    )
+    await broadcaster.start()
+    publish = broadcast_repo.publish
+    try:
+        await broadcaster._broadcast_active_meetings()
+        live_state.add_participant("quiet", "p1", "engaged")
+        await broadcaster._broadcast_active_meetings()
+        assert publish.call_count == 2
+
+        # Nothing changed: suppressed
+        suppressed = broadcaster.suppressed_rollups.value
+        await broadcaster._broadcast_active_meetings()
+        assert publish.call_count == 2
+        assert broadcaster.suppressed_rollups.value == suppressed + 1
+
+        # A rebuilt state with the same content is still unchanged
+        live_state.load_statuses("quiet", [], {})
+        live_state.add_participant("quiet", "p1", "engaged")
+        await broadcaster._broadcast_active_meetings()
+        assert publish.call_count == 2
+
+        # Heartbeat: unchanged meetings are re-sent once it is due
+        real_monotonic = time.monotonic
+        monkeypatch.setattr(periodic_broadcaster.time, "monotonic", lambda: real_monotonic() + 61)
+        await broadcaster._broadcast_active_meetings()
+        assert publish.call_count == 3
+    finally:
+        await broadcaster.stop()
+
+
+async def test_tick_query_count_does_not_grow_with_meetings(async_session_factory):
+    now = datetime.now(tz=UTC)
+    bucket = BucketManager().bucketize(now)
+
+    async def seed(first: int, count: int) -> None:
+        async with async_session_factory() as session:
+            for idx in range(first, first + count):
+                session.add(
+                    Meeting(
+                        id=f"m{idx}",
+                        start_ts=now - timedelta(minutes=5),
+                        end_ts=now + timedelta(hours=1),
+                    )
+                )
+                session.add(
+                    Participant(id=f"p{idx}", meeting_id=f"m{idx}", device_fingerprint=f"fp{idx}")
+                )
+            await session.flush()
+            for idx in range(first, first + count):
+                session.add(
+                    EngagementSample(
+                        participant_id=f"p{idx}",
+                        meeting_id=f"m{idx}",
+                        bucket=bucket,
+                        status="engaged" if idx % 2 else "speaking",
+                    )
+                )
+            await session.commit()
+
+    async def count_tick_queries() -> int:
+        live_state = LiveStateRegistry()
+        broadcaster = PeriodicBroadcaster(
+            session_factory=async_session_factory,
+            broadcast_repo=MagicMock(coalescer=None),
+            bucket_manager=BucketManager(),
+            smoothing_strategy=SmoothingFactory.create(SmoothingAlgorithm.NONE),
+            live_state=live_state,
+            interval_seconds=3600,
+        )
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = async_session_factory.kw["bind"].sync_engine
+        await broadcaster.start()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            await broadcaster._broadcast_active_meetings()
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+            await broadcaster.stop()
+
+        first, second = live_state.get("m1"), live_state.get("m2")
+        assert first is not None and second is not None
+        assert first.statuses == {"p1": "engaged"}
+        assert second.statuses == {"p2": "speaking"}
+        return len(statements)
+
+    await seed(0, 3)
+    few = await count_tick_queries()
+    await seed(3, 20)
+    assert await count_tick_queries() == few
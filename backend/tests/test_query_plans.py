@@ -0,0 +1,124 @@
+"""Query plan regression tests for the per-meeting sample scans.
+
+Runs against SQLite and, when ``TEST_POSTGRES_URL`` points to a scratch
+database (``postgresql+asyncpg://...``), against Postgres as well.
+"""
+
+import os
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.models import Base, EngagementSample, Meeting, Participant
+from app.repos import EngagementRepo
+
+INDEX = "ix_engagement_samples_meeting_bucket"
+BUCKET = datetime(2025, 6, 1, 9, 30, tzinfo=UTC)
+
+BACKENDS = [
+    pytest.param("sqlite+aiosqlite:///:memory:", id="sqlite"),
+    pytest.param(
+        os.environ.get("TEST_POSTGRES_URL"),
+        id="postgres",
+        marks=pytest.mark.skipif(
+            not os.environ.get("TEST_POSTGRES_URL"), reason="TEST_POSTGRES_URL is not set"
+        ),
+    ),
+]
+
+
+@pytest.fixture(params=BACKENDS)
+async def engine(request):
+    url = request.param
+    kwargs = {"poolclass": StaticPool} if url.startswith("sqlite") else {}
+    engine = create_async_engine(url, **kwargs)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with async_sessionmaker(bind=engine)() as session:
+        for meeting_idx in range(3):
+            meeting_id = f"m{meeting_idx}"
+            session.add(Meeting(id=meeting_id, start_ts=BUCKET, end_ts=BUCKET))
+            for participant_idx in range(3):
+                session.add(
+                    Participant(
+                        id=f"{meeting_id}-p{participant_idx}",
+                        meeting_id=meeting_id,
+                        device_fingerprint=f"{meeting_id}-{participant_idx}",
+                    )
+                )
+        await session.flush()
+        for meeting_idx in range(3):
+            for participant_idx in range(3):
+                for minute in range(5):
+                    session.add(
+                        EngagementSample(
+                            meeting_id=f"m{meeting_idx}",
+                            participant_id=f"m{meeting_idx}-p{participant_idx}",
+                            bucket=BUCKET + timedelta(minutes=minute),
+                            status="engaged",
+                        )
+                    )
+        await session.commit()
+
+    yield engine
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+async def _plan(engine, query) -> str:
+    """Run a repo query and return the plan of the SELECT it issued."""
+    selects = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        async with async_sessionmaker(bind=engine)() as session:
+            await session.run_sync(lambda sync_session: query(EngagementRepo(sync_session)))
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+    statement, parameters = selects[-1]
+
+    async with engine.connect() as conn:
+        if engine.dialect.name == "sqlite":
+            rows = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            return "\n".join(row[-1] for row in rows)
+        # The test tables are tiny; make the planner show whether the index is usable
+        await conn.exec_driver_sql("ANALYZE engagement_samples")
+        await conn.exec_driver_sql("SET enable_seqscan = off")
+        rows = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+        return "\n".join(row[0] for row in rows)
+
+
+async def test_rollup_scan_uses_index_in_bucket_order(engine):
+    plan = await _plan(
+        engine,
+        lambda repo: repo.get_samples_for_meeting(
+            "m1", start=BUCKET, end=BUCKET + timedelta(minutes=3)
+        ),
+    )
+    assert INDEX in plan
+    if engine.dialect.name == "sqlite":
+        assert "TEMP B-TREE" not in plan
+    else:
+        assert "Sort" not in plan
+
+
+async def test_latest_status_query_is_answered_from_index(engine):
+    plan = await _plan(
+        engine,
+        lambda repo: repo.get_latest_statuses(["m0", "m2"], end=BUCKET + timedelta(minutes=3)),
+    )
+    assert INDEX in plan
+    if engine.dialect.name == "sqlite":
+        assert f"COVERING INDEX {INDEX}" in plan
+    else:
+        assert "Index Only Scan" in plan
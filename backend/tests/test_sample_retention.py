@@ -0,0 +1,189 @@
+"""Tests for sample partitioning helpers and the retention job."""
+
+import os
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.db_partitions import (
+    add_months,
+    archive_name,
+    attached_partitions,
+    has_default_partition,
+    is_partitioned,
+    month_start,
+    partition_month,
+    partition_name,
+    partition_samples_table,
+)
+from app.models import Base, EngagementSample, Meeting, MeetingSummary, Participant
+from app.ws.background import SampleRetention
+from scripts.partition_samples import convert
+
+NOW = datetime(2025, 6, 15, 12, 0, tzinfo=UTC)
+OLD = datetime(2025, 3, 10, 9, 0, tzinfo=UTC)
+
+
+def test_monthly_partition_naming():
+    month = month_start(datetime(2024, 12, 31, 23, 59, tzinfo=UTC))
+    assert month == datetime(2024, 12, 1, tzinfo=UTC)
+    assert add_months(month, 1) == datetime(2025, 1, 1, tzinfo=UTC)
+    assert add_months(month, -12) == datetime(2023, 12, 1, tzinfo=UTC)
+    assert partition_name(month) == "engagement_samples_p202412"
+    assert partition_month("engagement_samples_p202412") == month
+    assert partition_month("engagement_samples_default") is None
+    assert archive_name(month) == "engagement_samples_archive_202412"
+
+
+async def _seed(session_factory) -> None:
+    async with session_factory() as session:
+        for meeting_id in ("summarized", "unsummarized"):
+            session.add(Meeting(id=meeting_id, start_ts=OLD, end_ts=OLD + timedelta(hours=1)))
+            session.add(
+                Participant(
+                    id=f"{meeting_id}-p", meeting_id=meeting_id, device_fingerprint=meeting_id
+                )
+            )
+        session.add(
+            MeetingSummary(
+                meeting_id="summarized",
+                max_participants=1,
+                normalized_engagement=0.5,
+                engagement_level="healthy",
+                computed_at=OLD,
+            )
+        )
+        await session.flush()
+        for meeting_id in ("summarized", "unsummarized"):
+            for bucket in (OLD, NOW - timedelta(days=1)):
+                session.add(
+                    EngagementSample(
+                        meeting_id=meeting_id,
+                        participant_id=f"{meeting_id}-p",
+                        bucket=bucket,
+                        status="engaged",
+                    )
+                )
+        await session.commit()
+
+
+async def _remaining(session_factory) -> list[tuple[str, bool]]:
+    async with session_factory() as session:
+        rows = await session.execute(
+            select(EngagementSample.meeting_id, EngagementSample.bucket).order_by(
+                EngagementSample.meeting_id, EngagementSample.bucket
+            )
+        )
+        return [(meeting_id, bucket.month == OLD.month) for meeting_id, bucket in rows]
+
+
+async def test_compaction_deletes_old_samples_of_summarized_meetings(async_session_factory):
+    await _seed(async_session_factory)
+
+    report = await SampleRetention(async_session_factory, retention_days=30).run_once(NOW)
+
+    assert report.samples_deleted == 1
+    assert report.partitions_created == [] and report.partitions_archived == []
+    assert await _remaining(async_session_factory) == [
+        ("summarized", False),
+        ("unsummarized", True),
+        ("unsummarized", False),
+    ]
+
+
+async def test_zero_retention_keeps_all_samples(async_session_factory):
+    await _seed(async_session_factory)
+
+    report = await SampleRetention(async_session_factory, retention_days=0).run_once(NOW)
+
+    assert report.samples_deleted == 0
+    assert len(await _remaining(async_session_factory)) == 4
+
+
+@pytest.mark.skipif(not os.environ.get("TEST_POSTGRES_URL"), reason="TEST_POSTGRES_URL is not set")
+async def test_old_partitions_are_detached_once_summarized():
+    engine = create_async_engine(os.environ["TEST_POSTGRES_URL"])
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    archived_months = [month_start(OLD), add_months(month_start(OLD), 1)]
+    try:
+        # Samples are copied into monthly partitions from March to July
+        await _seed(session_factory)
+        async with engine.begin() as conn:
+            await conn.run_sync(partition_samples_table, 1, NOW)
+            assert await conn.run_sync(is_partitioned)
+
+        retention = SampleRetention(session_factory, retention_days=30, months_ahead=2)
+        # March still holds a meeting without a summary; April is empty
+        report = await retention.run_once(NOW)
+        assert report.partitions_created == [partition_name(add_months(month_start(NOW), 2))]
+        assert report.partitions_archived == [partition_name(archived_months[1])]
+
+        async with session_factory() as session:
+            await session.execute(
+                text("DELETE FROM engagement_samples WHERE meeting_id = 'unsummarized'")
+            )
+            await session.commit()
+        report = await retention.run_once(NOW)
+        assert report.partitions_archived == [partition_name(archived_months[0])]
+
+        async with engine.connect() as conn:
+            attached = await conn.run_sync(attached_partitions)
+            assert partition_name(archived_months[0]) not in attached
+            archived = await conn.scalar(
+                text(f"SELECT count(*) FROM {archive_name(archived_months[0])}")
+            )
+            assert archived == 1
+        async with session_factory() as session:
+            assert await session.scalar(select(func.count(EngagementSample.id))) == 1
+    finally:
+        async with engine.begin() as conn:
+            for month in archived_months:
+                await conn.execute(text(f"DROP TABLE IF EXISTS {archive_name(month)}"))
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+
+def test_partitioning_requires_postgres():
+    with pytest.raises(RuntimeError, match="requires PostgreSQL"):
+        convert(create_engine("sqlite://"), months_ahead=1)
+
+
+@pytest.mark.skipif(not os.environ.get("TEST_POSTGRES_URL"), reason="TEST_POSTGRES_URL is not set")
+async def test_samples_in_the_default_partition_move_to_their_new_partition():
+    engine = create_async_engine(os.environ["TEST_POSTGRES_URL"])
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(partition_samples_table, 0, NOW)
+    later = add_months(month_start(NOW), 3)
+    try:
+        async with session_factory() as session:
+            session.add(Meeting(id="m", start_ts=later, end_ts=later + timedelta(hours=1)))
+            session.add(Participant(id="p", meeting_id="m", device_fingerprint="fp"))
+            await session.flush()
+            session.add(
+                EngagementSample(meeting_id="m", participant_id="p", bucket=later, status="engaged")
+            )
+            await session.commit()
+
+        report = await SampleRetention(session_factory, retention_days=0, months_ahead=3).run_once(
+            NOW
+        )
+
+        assert partition_name(later) in report.partitions_created
+        async with engine.connect() as conn:
+            assert await conn.run_sync(has_default_partition)
+            moved = await conn.scalar(text(f"SELECT count(*) FROM {partition_name(later)}"))
+            assert moved == 1
+            left = await conn.scalar(text("SELECT count(*) FROM engagement_samples_default"))
+            assert left == 0
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
@@ -0,0 +1,213 @@
+"""Tests for the incremental per-meeting snapshot cache."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.repos import EngagementRepo, MeetingRepo, ParticipantRepo
+from app.schema.participant.types import StatusLiteral
+from app.schema.visit.requests import VisitRequest
+from app.schema.websocket.requests import JoinRequest, StatusUpdateRequest
+from app.services import EngagementService
+from app.services.engagement.bucketing import BucketManager
+from app.services.engagement.smoothing import SmoothingAlgorithm, SmoothingFactory
+from app.services.engagement.smoothing.base import SmoothingStrategy
+from app.services.engagement.smoothing.kalman import KalmanSmoothingStrategy
+from app.services.engagement.state import LiveStateRegistry
+from app.services.engagement.summary import SnapshotBuilder, SnapshotCache
+from app.services.engagement.summary import snapshot_builder as snapshot_builder_module
+
+NOW = datetime(2025, 3, 3, 11, 0, 30, tzinfo=UTC)
+
+
+class _Clock(datetime):
+    current = NOW
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.current
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    _Clock.current = NOW
+    monkeypatch.setattr(snapshot_builder_module, "datetime", _Clock)
+    return _Clock
+
+
+def _service(
+    session,
+    cache: SnapshotCache | None,
+    strategy: SmoothingStrategy | None = None,
+    live_state: LiveStateRegistry | None = None,
+) -> EngagementService:
+    engagement_repo = EngagementRepo(session)
+    participant_repo = ParticipantRepo(session)
+    bucket_manager = BucketManager()
+    return EngagementService(
+        engagement_repo=engagement_repo,
+        participant_repo=participant_repo,
+        bucket_manager=bucket_manager,
+        snapshot_builder=SnapshotBuilder(
+            engagement_repo=engagement_repo,
+            participant_repo=participant_repo,
+            bucket_manager=bucket_manager,
+            smoothing_strategy=strategy or SmoothingFactory.create(SmoothingAlgorithm.KALMAN),
+            live_state=live_state,
+            snapshot_cache=cache,
+        ),
+    )
+
+
+def _meeting(session):
+    start = NOW.replace(second=0) - timedelta(hours=1)
+    return MeetingRepo(session).get_or_create(
+        start_ts=start,
+        end_ts=start + timedelta(hours=2),
+        request=VisitRequest(ms_teams_input="https://teams.microsoft.com/meet/snapshot_cache"),
+    )
+
+
+def _join(session, service: EngagementService, meeting, fingerprint: str):
+    participant = ParticipantRepo(session).create(
+        meeting_id=meeting.id, request=JoinRequest(fingerprint=fingerprint)
+    )
+    service.register_participant(participant)
+    return participant
+
+
+def _status(
+    service: EngagementService, participant, status: StatusLiteral, minutes_ago: int
+) -> None:
+    service.record_status(
+        participant, StatusUpdateRequest(status=status), NOW - timedelta(minutes=minutes_ago)
+    )
+
+
+def test_cached_summary_matches_fresh_build_after_updates(session_factory, clock):
+    """Incremental updates produce exactly what a rebuild from the DB produces."""
+    with session_factory() as session:
+        cache = SnapshotCache()
+        service = _service(session, cache)
+        meeting = _meeting(session)
+        first = _join(session, service, meeting, "fp-1")
+        second = _join(session, service, meeting, "fp-2")
+        _status(service, first, "engaged", 50)
+        _status(service, second, "speaking", 20)
+
+        initial = service.build_engagement_summary(meeting)
+        assert initial == _service(session, None).build_engagement_summary(meeting)
+
+        # New participants, status changes and a few more minutes of meeting
+        third = _join(session, service, meeting, "fp-3")
+        _status(service, first, "disengaged", 10)
+        _status(service, third, "engaged", 0)
+        clock.current = NOW + timedelta(minutes=4)
+
+        cached = service.build_engagement_summary(meeting)
+        fresh = _service(session, None).build_engagement_summary(meeting)
+        assert cached == fresh
+        assert len(cached.overall) == len(initial.overall) + 4
+        # Closed buckets that did not change keep their points
+        assert cached.participants[1].series[0] is initial.participants[1].series[0]
+
+
+def test_wave_of_joins_builds_snapshot_once(session_factory, clock, monkeypatch):
+    """Joins only append participants; the history is loaded from the DB once."""
+    with session_factory() as session:
+        cache = SnapshotCache()
+        service = _service(session, cache)
+        meeting = _meeting(session)
+        _status(service, _join(session, service, meeting, "fp-0"), "engaged", 30)
+
+        calls = []
+        load = service.snapshot_builder._load_sample_map
+
+        def counting_load(*args, **kwargs):
+            calls.append(args)
+            return load(*args, **kwargs)
+
+        monkeypatch.setattr(service.snapshot_builder, "_load_sample_map", counting_load)
+
+        for idx in range(1, 20):
+            _join(session, service, meeting, f"fp-{idx}")
+            summary = service.build_engagement_summary(meeting)
+
+        assert len(calls) == 1
+        assert len(summary.participants) == 20
+        assert summary == _service(session, None).build_engagement_summary(meeting)
+        # Without changes the very same summary object is served
+        assert service.build_engagement_summary(meeting) is summary
+
+
+def test_cache_is_keyed_by_bucket_size_and_rebuilt_on_reschedule(session_factory, clock):
+    with session_factory() as session:
+        cache = SnapshotCache()
+        service = _service(session, cache)
+        meeting = _meeting(session)
+        _status(service, _join(session, service, meeting, "fp-1"), "engaged", 7)
+
+        per_minute = service.build_engagement_summary(meeting)
+        per_five = service.build_engagement_summary(meeting, bucket_minutes=5)
+        assert len(per_minute.overall) == 61
+        assert len(per_five.overall) == 13
+
+        meeting.start_ts = meeting.start_ts + timedelta(minutes=30)
+        rescheduled = service.build_engagement_summary(meeting)
+        assert rescheduled == _service(session, None).build_engagement_summary(meeting)
+        assert len(rescheduled.overall) == 31
+
+
+def test_unknown_participant_drops_snapshot(session_factory, clock):
+    """A status from a participant the snapshot never saw forces a rebuild."""
+    with session_factory() as session:
+        cache = SnapshotCache()
+        service = _service(session, cache)
+        meeting = _meeting(session)
+        service.build_engagement_summary(meeting)
+
+        # Joined through a service without the cache (e.g. another worker)
+        late = _join(session, _service(session, None), meeting, "fp-late")
+        _status(service, late, "engaged", 1)
+
+        strategy = service.snapshot_builder.smoothing_strategy
+        assert cache.get((meeting.id, 1, strategy.cache_key)) is None
+        summary = service.build_engagement_summary(meeting)
+        assert [p.participant_id for p in summary.participants] == [late.id]
+
+
+def test_strategies_with_different_parameters_do_not_share_snapshots(session_factory, clock):
+    with session_factory() as session:
+        cache = SnapshotCache()
+        meeting = _meeting(session)
+        participant = _join(session, _service(session, None), meeting, "fp-1")
+        _status(_service(session, None), participant, "engaged", 30)
+
+        for strategy in (KalmanSmoothingStrategy(), KalmanSmoothingStrategy(process_variance=0.1)):
+            cached = _service(session, cache, strategy).build_engagement_summary(meeting)
+            assert cached == _service(session, None, strategy).build_engagement_summary(meeting)
+
+
+class _PendingSamples:
+    def __init__(self, samples):
+        self.samples = samples
+
+    def pending_samples(self, meeting_id):
+        return self.samples
+
+
+def test_snapshot_rebuild_includes_buffered_updates(session_factory, clock):
+    """Updates still waiting in the write-behind queue are part of a rebuilt snapshot."""
+    with session_factory() as session:
+        meeting = _meeting(session)
+        participant = _join(session, _service(session, None), meeting, "fp-1")
+        live_state = LiveStateRegistry()
+        bucket = BucketManager().bucketize(NOW - timedelta(minutes=5))
+        live_state.pending_source = _PendingSamples([(participant.id, bucket, "engaged")])
+
+        cached = _service(session, SnapshotCache(), live_state=live_state)
+        summary = cached.build_engagement_summary(meeting)
+
+        # Once the update is persisted, a build from the database matches
+        _status(_service(session, None), participant, "engaged", 5)
+        assert summary == _service(session, None).build_engagement_summary(meeting)
@@ -0,0 +1,151 @@
+"""Tests for pre-serialized snapshot payloads spliced into join responses."""
+
+import gc
+import weakref
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+from app.models import Meeting, Participant
+from app.schema.engagement.messages import SparseRollupData
+from app.schema.engagement.models import (
+    EngagementPoint,
+    EngagementSummary,
+    ParticipantEngagementSeries,
+)
+from app.schema.websocket import JoinedResponse, JoinRequest
+from app.ws.repos import encoding, snapshot_payload
+from app.ws.repos.broadcast import BroadcastRepo
+from app.ws.repos.encoding import PreEncodedResponse, encode_joined_response
+from app.ws.repos.snapshot_payload import SnapshotPayloadCache
+from app.ws.services.join import JoinService
+from app.ws.transport.context import WSContext
+
+START = datetime(2025, 1, 1, 10, 0, tzinfo=UTC)
+
+
+def _summary(meeting_id: str = "m1", minutes: int = 3) -> EngagementSummary:
+    buckets = [START + timedelta(minutes=idx) for idx in range(minutes)]
+    return EngagementSummary(
+        meeting_id=meeting_id,
+        start=buckets[0],
+        end=buckets[-1],
+        bucket_minutes=1,
+        overall=[EngagementPoint(bucket=bucket, value=50.0) for bucket in buckets],
+        participants=[
+            ParticipantEngagementSeries(
+                participant_id="p1",
+                device_fingerprint="fp",
+                series=[EngagementPoint(bucket=bucket, value=50.0) for bucket in buckets],
+            )
+        ],
+    )
+
+
+def test_spliced_join_response_matches_model_serialization():
+    summary = _summary()
+    sync = SparseRollupData(
+        meeting_id="m1", bucket=START, overall=50.0, participants={"p1": 50.0}, seq=4, stream="s"
+    )
+    snapshot = SnapshotPayloadCache(max_bytes=1 << 20).encode(summary)
+
+    for baseline in (None, sync):
+        expected = JoinedResponse(
+            participant_id="p1", meeting_id="m1", snapshot=summary, sync=baseline
+        )
+        spliced = encode_joined_response("p1", "m1", snapshot, baseline)
+        assert spliced.decode() == expected.model_dump_json()
+
+
+def test_payload_is_encoded_once_per_summary_version(monkeypatch):
+    calls = []
+
+    def counting_encode(summary):
+        calls.append(summary)
+        return encoding.encode_message(summary)
+
+    monkeypatch.setattr(snapshot_payload, "encode_message", counting_encode)
+    cache = SnapshotPayloadCache(max_bytes=1 << 20)
+    summary = _summary()
+
+    first = cache.encode(summary)
+    assert cache.encode(summary) is first
+    assert len(calls) == 1
+
+    # A new summary object is a new meeting version and replaces the entry
+    updated = _summary(minutes=4)
+    assert cache.encode(updated) != first
+    assert len(calls) == 2
+    assert len(cache) == 1
+    assert cache.total_bytes == len(cache.encode(updated))
+
+
+def test_entries_do_not_keep_summaries_alive():
+    cache = SnapshotPayloadCache(max_bytes=1 << 20)
+    summary = _summary()
+    first = cache.encode(summary)
+    ref = weakref.ref(summary)
+
+    del summary
+    gc.collect()
+    assert ref() is None
+    # The payload stays counted until it is replaced or evicted
+    assert cache.total_bytes == len(first)
+    assert cache.encode(_summary(minutes=4)) != first
+    assert len(cache) == 1
+
+
+def test_cache_evicts_least_recently_used_over_byte_budget():
+    size = len(SnapshotPayloadCache(max_bytes=1 << 20).encode(_summary("a")))
+    cache = SnapshotPayloadCache(max_bytes=2 * size + size // 2)
+    summaries = {meeting_id: _summary(meeting_id) for meeting_id in "abc"}
+
+    cache.encode(summaries["a"])
+    cache.encode(summaries["b"])
+    cache.encode(summaries["a"])  # refresh "a"
+    cache.encode(summaries["c"])
+
+    assert len(cache) == 2
+    assert cache.total_bytes <= cache.max_bytes
+    cache.discard("a")
+    assert len(cache) == 1
+    assert cache.total_bytes == size
+
+    cache.retain(["a", "b"])
+    assert len(cache) == 0
+    assert cache.total_bytes == 0
+
+    # Payloads larger than the whole budget are not cached
+    tiny = SnapshotPayloadCache(max_bytes=10)
+    tiny.encode(summaries["a"])
+    assert len(tiny) == 0
+    assert tiny.total_bytes == 0
+
+
+async def test_join_service_returns_pre_encoded_response_with_payload_cache():
+    now = datetime.now(tz=UTC)
+    meeting = Meeting(id="m1", start_ts=now - timedelta(minutes=5), end_ts=now + timedelta(hours=1))
+    participant = Participant(id="p1", meeting_id="m1", device_fingerprint="fp")
+    summary = _summary()
+
+    participant_service = MagicMock()
+    participant_service.create_or_reuse_for_connection.return_value = participant
+    engagement_service = MagicMock()
+    engagement_service.build_engagement_summary.return_value = summary
+    engagement_service.bucket_manager.bucketize.return_value = now
+
+    context = MagicMock(spec=WSContext)
+    context.meeting = meeting
+    context.session = AsyncMock()
+    context.run_sync = AsyncMock(side_effect=lambda fn, *args, **kwargs: fn(*args, **kwargs))
+
+    join_service = JoinService(
+        participant_service=participant_service,
+        engagement_service=engagement_service,
+        broadcast_repo=MagicMock(spec=BroadcastRepo),
+        payload_cache=SnapshotPayloadCache(max_bytes=1 << 20),
+    )
+    response = await join_service.execute(JoinRequest(fingerprint="fp"), context)
+
+    assert isinstance(response, PreEncodedResponse)
+    expected = JoinedResponse(participant_id="p1", meeting_id="m1", snapshot=summary)
+    assert response.model_dump_json() == expected.model_dump_json()
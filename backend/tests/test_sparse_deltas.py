@@ -0,0 +1,154 @@
+"""Tests for sparse engagement deltas (protocol v2)."""
+
+import asyncio
+import json
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import anyio
+from litestar.channels import ChannelsPlugin
+from litestar.channels.backends.memory import MemoryChannelsBackend
+
+from app.models import Meeting, Participant
+from app.schema.engagement.messages import RollupData, SparseDeltaMessage
+from app.schema.engagement.models import EngagementSummary
+from app.schema.websocket import JoinedResponse, JoinRequest, ResyncRequest
+from app.ws.repos.broadcast import BroadcastRepo
+from app.ws.repos.sequencer import DeltaSequencer
+from app.ws.repos.subscription import SubscriptionRepo
+from app.ws.services.join import JoinService
+from app.ws.services.resync import ResyncService
+from app.ws.transport.context import WSContext
+
+BUCKET = datetime(2025, 1, 1, 10, 0, tzinfo=UTC)
+
+
+def _rollup(participants: dict[str, float]) -> RollupData:
+    overall = sum(participants.values()) / len(participants)
+    return RollupData(meeting_id="m1", bucket=BUCKET, overall=overall, participants=participants)
+
+
+def _context(meeting: Meeting) -> MagicMock:
+    context = MagicMock(spec=WSContext)
+    context.meeting = meeting
+    context.participant = Participant(id="p1", meeting_id=meeting.id, device_fingerprint="fp")
+    context.session = AsyncMock()
+    context.run_sync = AsyncMock(side_effect=lambda fn, *args, **kwargs: fn(*args, **kwargs))
+    return context
+
+
+def test_sequencer_reports_only_changed_values():
+    sequencer = DeltaSequencer()
+
+    assert sequencer.advance("m1", {"a": 0.0, "b": 100.0}) == (1, {"a": 0.0, "b": 100.0})
+    assert sequencer.advance("m1", {"a": 100.0, "b": 100.0}) == (2, {"a": 100.0})
+    assert sequencer.advance("m1", {"a": 100.0, "b": 100.0, "c": 0.0}, 66.7) == (3, {"c": 0.0})
+    assert sequencer.snapshot("m1") == (3, 66.7, {"a": 100.0, "b": 100.0, "c": 0.0})
+
+    sequencer.retain([])
+    assert sequencer.snapshot("m1") is None
+
+
+def test_publish_emits_full_and_sparse_delta_on_separate_channels():
+    channels = MagicMock()
+    sequencer = DeltaSequencer()
+    repo = BroadcastRepo(channels, sequencer=sequencer)
+
+    repo.publish("m1", _rollup({"a": 0.0, "b": 100.0}))
+    repo.publish("m1", _rollup({"a": 100.0, "b": 100.0}))
+
+    calls = channels.publish.call_args_list
+    assert [call.kwargs["channels"] for call in calls] == [
+        ["meeting:m1:delta"],
+        ["meeting:m1:sparse_delta"],
+    ] * 2
+    payloads = [json.loads(call.kwargs["data"]) for call in calls]
+    assert [p["type"] for p in payloads] == ["delta", "sparse_delta"] * 2
+    assert payloads[2]["data"]["participants"] == {"a": 100.0, "b": 100.0}
+    sparse = payloads[3]["data"]
+    assert sparse["participants"] == {"a": 100.0}
+    assert sparse["overall"] == 100.0
+    assert (sparse["seq"], sparse["stream"], sparse["full"]) == (2, sequencer.stream, False)
+
+
+async def test_subscription_follows_delta_channel_of_negotiated_protocol():
+    plugin = ChannelsPlugin(backend=MemoryChannelsBackend(), arbitrary_channels_allowed=True)
+    async with plugin:
+        publisher = BroadcastRepo(plugin, sequencer=DeltaSequencer())
+        repo = SubscriptionRepo(plugin)
+        stream = repo.subscribe_to_meeting("m1", anyio.Event())
+
+        async def next_type(publish) -> str:
+            received = asyncio.ensure_future(anext(stream))
+            while repo._deltas is None:
+                await asyncio.sleep(0)
+            publish()
+            return str(json.loads(await asyncio.wait_for(received, timeout=5))["type"])
+
+        assert await next_type(lambda: publisher.publish("m1", _rollup({"a": 100.0}))) == "delta"
+        await repo.set_protocol(2)
+        assert (
+            await next_type(lambda: publisher.publish("m1", _rollup({"a": 0.0}))) == "sparse_delta"
+        )
+        assert (
+            await next_type(lambda: publisher.send_to_meeting("m1", {"type": "meeting_started"}))
+            == "meeting_started"
+        )
+        await stream.aclose()
+
+
+async def test_join_with_protocol_2_returns_sync_baseline():
+    now = datetime.now(tz=UTC)
+    meeting = Meeting(id="m1", start_ts=now - timedelta(minutes=5), end_ts=now + timedelta(hours=1))
+    context = _context(meeting)
+    context.protocol_version = 1
+
+    participant_service = MagicMock()
+    participant_service.create_or_reuse_for_connection.return_value = context.participant
+    engagement_service = MagicMock()
+    engagement_service.bucket_manager.bucketize.return_value = BUCKET
+    engagement_service.build_engagement_summary.return_value = EngagementSummary(
+        meeting_id="m1", start=BUCKET, end=BUCKET, bucket_minutes=1, overall=[], participants=[]
+    )
+    engagement_service.bucket_rollup.return_value = {
+        "overall": 100.0,
+        "participants": {"p1": 100.0},
+    }
+    sequencer = DeltaSequencer()
+    sequencer.advance("m1", {"p1": 0.0})
+    broadcast_repo = BroadcastRepo(MagicMock(), sequencer=sequencer)
+
+    join_service = JoinService(participant_service, engagement_service, broadcast_repo)
+    response = await join_service.execute(JoinRequest(fingerprint="fp", protocol=2), context)
+
+    context.set_protocol.assert_awaited_once_with(2)
+    assert isinstance(response, JoinedResponse)
+    assert response.sync is not None
+    assert response.sync.full is True
+    # Join's own delta is published first, so the baseline already includes it
+    assert (response.sync.seq, response.sync.participants) == (2, {"p1": 100.0})
+
+    resync = await ResyncService(engagement_service, broadcast_repo).execute(
+        ResyncRequest(), context
+    )
+    assert isinstance(resync, SparseDeltaMessage)
+    assert resync.data.full is True
+    assert resync.data.stream == sequencer.stream
+
+
+def test_sync_baseline_takes_overall_and_participants_from_the_same_rollup():
+    meeting = Meeting(id="m1", start_ts=BUCKET, end_ts=BUCKET + timedelta(hours=1))
+    engagement_service = MagicMock()
+    engagement_service.bucket_rollup.return_value = {
+        "overall": 100.0,
+        "participants": {"p1": 100.0},
+    }
+    sequencer = DeltaSequencer()
+    repo = BroadcastRepo(MagicMock(), sequencer=sequencer)
+
+    fresh = repo.sync_data(meeting, BUCKET, engagement_service)
+    assert (fresh.seq, fresh.overall, fresh.participants) == (0, 100.0, {"p1": 100.0})
+
+    repo.publish("m1", _rollup({"p1": 0.0}))
+    published = repo.sync_data(meeting, BUCKET, engagement_service)
+    assert (published.seq, published.overall, published.participants) == (1, 0.0, {"p1": 0.0})
@@ -0,0 +1,166 @@
+"""Tests for the SQLite pragma profile and the single-writer thread."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, event, func, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.db_utils import apply_sqlite_pragmas, sqlite_pragmas
+from app.models import Base, EngagementSample, Meeting, Participant
+from app.repos import AsyncMeetingRepo, ParticipantRepo
+from app.schema.websocket import PongResponse
+from app.services.engagement.state import live_state_registry
+from app.ws.background import SQLiteWriter, StatusWriteBehind
+from app.ws.controllers.connection import _handle_message
+from app.ws.repos.broadcast import BroadcastRepo
+from app.ws.shared.factory import WSServiceFactory
+from app.ws.transport.context import WSContext
+
+
+@pytest.fixture()
+def sqlite_file(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'bsbox.db'}"
+    monkeypatch.setattr(settings, "database_url", url)
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+    apply_sqlite_pragmas(engine, sqlite_pragmas())
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_pragma_profile_is_applied_on_connect(sqlite_file):
+    with sqlite_file.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == settings.sqlite_busy_timeout_ms
+        assert conn.execute(text("PRAGMA cache_size")).scalar() == -settings.sqlite_cache_size_kib
+
+
+def test_memory_databases_skip_file_pragmas(monkeypatch):
+    monkeypatch.setattr(settings, "database_url", "sqlite:///:memory:")
+    pragmas = sqlite_pragmas()
+    assert not any("journal_mode" in pragma or "mmap_size" in pragma for pragma in pragmas)
+
+
+async def test_writer_serializes_concurrent_writes(sqlite_file):
+    writer = SQLiteWriter(sessionmaker(bind=sqlite_file))
+    writer.start()
+    now = datetime.now(tz=UTC)
+    try:
+        await writer.run(
+            lambda session: session.add(
+                Meeting(id="m1", start_ts=now, end_ts=now + timedelta(hours=1))
+            )
+        )
+
+        def add_participant(idx: int):
+            return lambda session: session.add(
+                Participant(id=f"p{idx}", meeting_id="m1", device_fingerprint=f"fp{idx}")
+            )
+
+        await asyncio.gather(*(writer.run(add_participant(idx)) for idx in range(200)))
+
+        def fail(session):
+            session.add(Participant(id="rolled-back", meeting_id="m1", device_fingerprint="x"))
+            raise ValueError("job failed")
+
+        with pytest.raises(ValueError):
+            await writer.run(fail)
+
+        count = await writer.run(lambda session: session.scalar(select(func.count(Participant.id))))
+        assert count == 200
+    finally:
+        await writer.stop()
+
+    with pytest.raises(RuntimeError):
+        writer.submit(lambda session: None)
+
+
+async def test_write_behind_flushes_through_writer(sqlite_file):
+    now = datetime.now(tz=UTC)
+    bucket = now.replace(second=0, microsecond=0)
+    session_factory = sessionmaker(bind=sqlite_file)
+    with session_factory.begin() as session:
+        session.add(Meeting(id="m1", start_ts=now, end_ts=now + timedelta(hours=1)))
+        session.add(Participant(id="p1", meeting_id="m1", device_fingerprint="fp"))
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{sqlite_file.url.database}")
+    writer = SQLiteWriter(session_factory)
+    writer.start()
+    status_writer = StatusWriteBehind(
+        async_sessionmaker(bind=async_engine), flush_interval_seconds=60, writer=writer
+    )
+    try:
+        status_writer.enqueue("m1", "p1", bucket, "engaged")
+        assert await status_writer.flush() == 1
+    finally:
+        await writer.stop()
+        await async_engine.dispose()
+
+    with session_factory() as session:
+        samples = session.scalars(select(EngagementSample)).all()
+        assert [(s.participant_id, s.status) for s in samples] == [("p1", "engaged")]
+        assert ParticipantRepo(session).get_for_meeting("m1")[0].last_status == "engaged"
+
+
+async def test_status_and_ping_are_written_through_writer_without_write_behind(sqlite_file):
+    now = datetime.now(tz=UTC)
+    session_factory = sessionmaker(bind=sqlite_file)
+    with session_factory.begin() as session:
+        session.add(
+            Meeting(
+                id="sw-hot", start_ts=now - timedelta(minutes=5), end_ts=now + timedelta(hours=1)
+            )
+        )
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{sqlite_file.url.database}")
+    async_session_factory = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+    async with async_session_factory() as async_session:
+        meeting = await AsyncMeetingRepo(async_session).get_with_participants("sw-hot")
+    assert meeting is not None
+
+    writer = SQLiteWriter(session_factory)
+    writer.start()
+    broadcast_repo = MagicMock(spec=BroadcastRepo)
+    lifecycle = MagicMock(status_writer=None, sqlite_writer=writer)
+    lifecycle.create_factory.side_effect = lambda session: WSServiceFactory(
+        session, broadcast_repo, None, writer
+    )
+    context = WSContext(socket=MagicMock(), meeting=meeting, session_factory=async_session_factory)
+    writes: list[str] = []
+    try:
+        await _handle_message({"type": "join", "fingerprint": "fp"}, context, lifecycle)
+        await _handle_message({"type": "status", "status": "speaking"}, context, lifecycle)
+
+        # Hot-path writes no longer go through the units of work's sessions
+        event.listen(
+            async_engine.sync_engine,
+            "before_cursor_execute",
+            lambda *args: writes.append(args[2]) if not args[2].startswith("SELECT") else None,
+        )
+        for status in ["engaged", "disengaged", "engaged"]:
+            response = await _handle_message(
+                {"type": "status", "status": status}, context, lifecycle
+            )
+            assert response is None
+        response = await _handle_message({"type": "ping"}, context, lifecycle)
+        assert isinstance(response, PongResponse)
+    finally:
+        await writer.stop()
+        await async_engine.dispose()
+        live_state_registry.discard("sw-hot")
+
+    assert writes == []
+    with session_factory() as session:
+        participant = session.get(Participant, context.participant_id)
+        assert participant is not None
+        assert participant.last_status == "engaged"
+        assert participant.last_seen_at is not None
+        assert participant.last_seen_at >= now.replace(tzinfo=None)
+        samples = session.scalars(select(EngagementSample)).all()
+        assert [s.status for s in samples] == ["engaged"]
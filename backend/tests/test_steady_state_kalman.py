@@ -0,0 +1,66 @@
+"""Tests for the steady-state Kalman smoothing strategy."""
+
+import random
+
+import pytest
+
+from app.services.engagement.smoothing import SmoothingAlgorithm, SmoothingFactory
+from app.services.engagement.smoothing.kalman import KalmanSmoothingStrategy
+from app.services.engagement.smoothing.steady_state_kalman import (
+    SteadyStateKalmanSmoothingStrategy,
+    gain_schedule,
+)
+
+
+def _flags(length: int, seed: int = 11) -> list[int]:
+    rng = random.Random(seed)
+    return [rng.randint(0, 1) for _ in range(length)]
+
+
+def test_factory_creates_steady_state_strategy():
+    strategy = SmoothingFactory.create(SmoothingAlgorithm("steady_state_kalman"))
+    assert isinstance(strategy, SteadyStateKalmanSmoothingStrategy)
+
+
+def test_transient_matches_kalman_exactly():
+    """Before convergence the cached gains reproduce the textbook filter."""
+    flags = _flags(120)
+    strategy = SteadyStateKalmanSmoothingStrategy()
+
+    assert strategy.smooth(flags, len(flags)) == KalmanSmoothingStrategy().smooth(flags, len(flags))
+
+
+def test_steady_state_stays_close_to_kalman():
+    """After switching to the steady-state gain the results barely move."""
+    flags = _flags(8 * 60)
+    expected = KalmanSmoothingStrategy().smooth(flags, len(flags))
+
+    actual = SteadyStateKalmanSmoothingStrategy().smooth(flags, len(flags))
+
+    assert actual == pytest.approx(expected, abs=1e-4)
+
+
+def test_gain_schedule_is_shared_and_stops_growing():
+    """Strategies with the same parameters share one bounded gain schedule."""
+    first = SteadyStateKalmanSmoothingStrategy(process_variance=2e-5)
+    second = SteadyStateKalmanSmoothingStrategy(process_variance=2e-5)
+    assert first.schedule is second.schedule is gain_schedule(2e-5, 1e-2, 1e-9)
+
+    first.smooth(_flags(10), 10)
+    assert len(first.schedule.transient(0)) == 10
+    assert not first.schedule.converged
+
+    first.smooth(_flags(5000), 5000)
+    assert first.schedule.converged
+    assert len(first.schedule.transient(10_000)) < 5000
+
+
+def test_smooth_many_matches_smooth_per_row():
+    np = pytest.importorskip("numpy")
+    strategy = SteadyStateKalmanSmoothingStrategy()
+    flags = np.random.default_rng(5).integers(0, 2, size=(20, 600), dtype=np.int8)
+
+    smoothed = strategy.smooth_many(flags)
+
+    for row, row_flags in enumerate(flags.tolist()):
+        assert smoothed[row].tolist() == strategy.smooth(row_flags, len(row_flags))
@@ -0,0 +1,243 @@
+"""Tests for write-behind batching of WS status updates."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy import event, select
+
+from app.models import EngagementSample, Meeting, Participant
+from app.repos import AsyncMeetingRepo
+from app.schema.websocket import StatusUpdateRequest
+from app.services import EngagementService
+from app.services.engagement.state import LiveStateRegistry, live_state_registry
+from app.ws.background.write_behind import StatusWriteBehind
+from app.ws.controllers.connection import _handle_message
+from app.ws.repos.broadcast import BroadcastRepo
+from app.ws.services.status import StatusService
+from app.ws.shared.factory import WSServiceFactory
+from app.ws.transport.context import WSContext
+
+
+async def _seed(async_session_factory, now: datetime) -> None:
+    async with async_session_factory() as session:
+        session.add(
+            Meeting(id="m1", start_ts=now - timedelta(minutes=5), end_ts=now + timedelta(hours=1))
+        )
+        session.add_all(
+            [
+                Participant(id="p1", meeting_id="m1", device_fingerprint="fp-1"),
+                Participant(id="p2", meeting_id="m1", device_fingerprint="fp-2"),
+            ]
+        )
+        await session.commit()
+
+
+async def test_flush_coalesces_per_participant_bucket(async_session_factory):
+    now = datetime.now(tz=UTC)
+    bucket = now.replace(second=0, microsecond=0)
+    await _seed(async_session_factory, now)
+
+    async with async_session_factory() as session:
+        session.add(
+            EngagementSample(participant_id="p2", meeting_id="m1", bucket=bucket, status="engaged")
+        )
+        await session.commit()
+
+    writer = StatusWriteBehind(async_session_factory, flush_interval_seconds=60)
+    writer.enqueue("m1", "p1", bucket - timedelta(minutes=1), "speaking")
+    writer.enqueue("m1", "p1", bucket, "engaged")
+    writer.enqueue("m1", "p1", bucket, "disengaged")
+    writer.enqueue("m1", "p2", bucket, "speaking")
+    assert writer.pending_count == 3
+
+    assert await writer.flush() == 3
+    assert writer.pending_count == 0
+
+    async with async_session_factory() as session:
+        samples = (
+            await session.scalars(
+                select(EngagementSample).order_by(
+                    EngagementSample.participant_id, EngagementSample.bucket
+                )
+            )
+        ).all()
+        assert [(s.participant_id, s.status) for s in samples] == [
+            ("p1", "speaking"),
+            ("p1", "disengaged"),
+            ("p2", "speaking"),
+        ]
+        participants = (await session.scalars(select(Participant).order_by(Participant.id))).all()
+        assert [p.last_status for p in participants] == ["disengaged", "speaking"]
+
+
+async def test_stop_flushes_pending_updates(async_session_factory):
+    now = datetime.now(tz=UTC)
+    await _seed(async_session_factory, now)
+
+    writer = StatusWriteBehind(async_session_factory, flush_interval_seconds=60)
+    await writer.start()
+    writer.enqueue("m1", "p1", now.replace(second=0, microsecond=0), "engaged")
+    await writer.stop()
+
+    assert writer.pending_count == 0
+    async with async_session_factory() as session:
+        assert len((await session.scalars(select(EngagementSample))).all()) == 1
+
+
+async def test_status_service_enqueues_instead_of_committing():
+    now = datetime.now(tz=UTC)
+    meeting = Meeting(id="m1", start_ts=now - timedelta(minutes=5), end_ts=now + timedelta(hours=1))
+    participant = Participant(id="p1", meeting_id="m1", device_fingerprint="fp-1")
+    participant.meeting = meeting
+
+    context = MagicMock(spec=WSContext)
+    context.meeting = meeting
+    # Buffered status updates don't load the participant
+    context.participant = None
+    context.participant_id = participant.id
+    context.session = AsyncMock()
+    context.run_sync = AsyncMock(side_effect=lambda fn, *args, **kwargs: fn(*args, **kwargs))
+
+    engagement_service = MagicMock(spec=EngagementService)
+    engagement_service.apply_status.return_value = now
+    status_writer = MagicMock(spec=StatusWriteBehind)
+
+    service = StatusService(engagement_service, MagicMock(spec=BroadcastRepo), status_writer)
+    assert await service.execute(StatusUpdateRequest(status="engaged"), context) is None
+
+    engagement_service.record_status.assert_not_called()
+    engagement_service.apply_status.assert_called_once()
+    assert engagement_service.apply_status.call_args.kwargs["meeting"] is meeting
+    assert engagement_service.apply_status.call_args.kwargs["participant_id"] == "p1"
+    context.commit.assert_not_called()
+    status_writer.enqueue.assert_called_once()
+    assert status_writer.enqueue.call_args.args == ("m1", "p1", now, "engaged")
+    assert status_writer.enqueue.call_args.kwargs["seen_at"] >= now
+
+
+async def test_bad_row_is_isolated_and_dropped_after_max_attempts(async_session_factory):
+    now = datetime.now(tz=UTC)
+    bucket = now.replace(second=0, microsecond=0)
+    await _seed(async_session_factory, now)
+
+    writer = StatusWriteBehind(async_session_factory, flush_interval_seconds=60, max_attempts=2)
+    writer.enqueue("m1", "p1", bucket, "engaged")
+    # Violates the NOT NULL constraint on status
+    writer.enqueue("m1", "p2", bucket, None)  # type: ignore[arg-type]
+
+    assert await writer.flush() == 1
+    assert writer.pending_count == 1
+    assert await writer.flush() == 0
+    assert writer.pending_count == 0
+    assert writer.dropped.value >= 1
+
+    async with async_session_factory() as session:
+        samples = (await session.scalars(select(EngagementSample))).all()
+        assert [(s.participant_id, s.status) for s in samples] == [("p1", "engaged")]
+
+
+def test_buffer_drops_oldest_entries_beyond_max_pending(async_session_factory):
+    bucket = datetime.now(tz=UTC).replace(second=0, microsecond=0)
+    writer = StatusWriteBehind(async_session_factory, flush_interval_seconds=60, max_pending=2)
+    for minute in range(3):
+        writer.enqueue("m1", "p1", bucket + timedelta(minutes=minute), "engaged")
+    writer.enqueue("m2", "p2", bucket, "speaking")
+
+    assert writer.pending_count == 2
+    assert writer.pending_samples("m1") == [("p1", bucket + timedelta(minutes=2), "engaged")]
+    assert writer.pending_samples("m2") == [("p2", bucket, "speaking")]
+
+
+async def test_rebuilt_live_state_includes_buffered_updates(async_session_factory):
+    now = datetime.now(tz=UTC)
+    bucket = now.replace(second=0, microsecond=0)
+    await _seed(async_session_factory, now)
+
+    writer = StatusWriteBehind(async_session_factory, flush_interval_seconds=60)
+    writer.enqueue("m1", "p1", bucket - timedelta(minutes=1), "disengaged")
+    writer.enqueue("m1", "p1", bucket, "speaking")
+    registry = LiveStateRegistry()
+    registry.pending_source = writer
+
+    participants = [
+        Participant(id="p1", meeting_id="m1", device_fingerprint="fp-1"),
+        Participant(id="p2", meeting_id="m1", device_fingerprint="fp-2"),
+    ]
+    state = registry.load_statuses("m1", participants, {"p1": "engaged", "p2": "engaged"})
+    assert state.statuses == {"p1": "speaking", "p2": "engaged"}
+
+
+async def test_buffered_status_messages_do_not_touch_the_database(async_session_factory):
+    now = datetime.now(tz=UTC)
+    async with async_session_factory() as session:
+        session.add(
+            Meeting(
+                id="wb-burst", start_ts=now - timedelta(minutes=5), end_ts=now + timedelta(hours=1)
+            )
+        )
+        await session.commit()
+    async with async_session_factory() as session:
+        meeting = await AsyncMeetingRepo(session).get_with_participants("wb-burst")
+    assert meeting is not None
+
+    writer = StatusWriteBehind(async_session_factory, flush_interval_seconds=60)
+    broadcast_repo = MagicMock(spec=BroadcastRepo)
+    lifecycle = MagicMock(status_writer=writer, sqlite_writer=None)
+    lifecycle.create_factory.side_effect = lambda session: WSServiceFactory(
+        session, broadcast_repo, writer
+    )
+    context = WSContext(socket=MagicMock(), meeting=meeting, session_factory=async_session_factory)
+
+    engine = async_session_factory.kw["bind"].sync_engine
+    statements: list[str] = []
+    commits: list[int] = []
+    try:
+        await _handle_message({"type": "join", "fingerprint": "fp"}, context, lifecycle)
+        # The first status loads the meeting's live state
+        await _handle_message({"type": "status", "status": "engaged"}, context, lifecycle)
+
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        event.listen(engine, "commit", lambda *args: commits.append(1))
+        for status in ["speaking", "disengaged", "engaged"] * 10:
+            response = await _handle_message(
+                {"type": "status", "status": status}, context, lifecycle
+            )
+            assert response is None
+        assert statements == []
+        assert commits == []
+
+        assert await writer.flush() == 1
+        assert len(commits) == 1
+    finally:
+        live_state_registry.discard("wb-burst")
+
+    async with async_session_factory() as session:
+        participant = await session.get(Participant, context.participant_id)
+        assert participant is not None
+        assert participant.last_status == "engaged"
+        assert participant.last_seen_at is not None
+
+
+async def test_flush_moves_last_seen_forward_only(async_session_factory):
+    now = datetime.now(tz=UTC)
+    bucket = now.replace(second=0, microsecond=0)
+    await _seed(async_session_factory, now)
+    async with async_session_factory() as session:
+        participant = await session.get(Participant, "p2")
+        assert participant is not None
+        # e.g. left after its last buffered status update
+        participant.last_seen_at = now + timedelta(seconds=10)
+        await session.commit()
+
+    writer = StatusWriteBehind(async_session_factory, flush_interval_seconds=60)
+    writer.enqueue("m1", "p1", bucket, "engaged", seen_at=now)
+    writer.enqueue("m1", "p1", bucket, "speaking", seen_at=now - timedelta(seconds=1))
+    writer.enqueue("m1", "p2", bucket, "engaged", seen_at=now)
+    assert await writer.flush() == 2
+
+    async with async_session_factory() as session:
+        last_seen = dict(
+            (await session.execute(select(Participant.id, Participant.last_seen_at))).all()
+        )
+    assert last_seen["p1"] == now.replace(tzinfo=None)
+    assert last_seen["p2"] == (now + timedelta(seconds=10)).replace(tzinfo=None)
@@ -1,5 +1,6 @@
 """Tests for WebSocket lifecycle components."""
 
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
 
@@ -8,12 +9,26 @@ import pytest
 
 from app.models import Meeting
 from app.schema.websocket import MeetingCountdownResponse, MeetingEndedResponse
+from app.services.engagement.state import LiveStateRegistry
+from app.ws.background import MeetingEndJobs
+from app.ws.repos.snapshot_payload import SnapshotPayloadCache
 from app.ws.repos.subscription import SubscriptionRepo
 from app.ws.transport.lifecycle import (
     ConnectionValidator,
     MeetingEndWatcher,
     MeetingTimingValidator,
 )
+from app.ws.transport.lifecycle import watcher as watcher_module
+
+
+def _session_factory(session):
+    """Session factory handing out the given (mock) session."""
+
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    return factory
 
 
 class TestMeetingTimingValidator:
@@ -212,7 +227,11 @@ class TestSubscriptionRepo:
                 break
 
         assert events == ["event1", "event2"]
-        channels.start_subscription.assert_called_once_with(["meeting:test-meeting"])
+        # Meeting channel, plus the delta channel of the default protocol
+        assert [call.args for call in channels.start_subscription.call_args_list] == [
+            (["meeting:test-meeting"],),
+            (["meeting:test-meeting:delta"],),
+        ]
 
     @pytest.mark.asyncio
     async def test_event_stream_stops_when_closed(self):
@@ -295,9 +314,23 @@ class TestMeetingEndWatcher:
         mock_summary.max_participants = 5
         mock_summary.normalized_engagement = 0.75
         mock_summary.engagement_level = "high"
-        meeting_summary_service.persist_summary.return_value = mock_summary
+        meeting_summary_service.persist_summary_once.return_value = (mock_summary, True)
 
-        watcher = MeetingEndWatcher(meeting_summary_service, broadcast_repo)
+        session = MagicMock()
+        session.run_sync = AsyncMock(side_effect=lambda fn: fn(MagicMock()))
+        session.commit = AsyncMock()
+
+        payload_cache = MagicMock(spec=SnapshotPayloadCache)
+        live_state = LiveStateRegistry()
+        live_state.load_statuses("test-meeting", [], {})
+        watcher = MeetingEndWatcher(
+            lambda _session: meeting_summary_service,
+            broadcast_repo,
+            _session_factory(session),
+            jobs=MeetingEndJobs(),
+            payload_cache=payload_cache,
+            live_state=live_state,
+        )
 
         # Run watcher with short timeout
         await watcher.watch(meeting, socket, is_closed, seconds_remaining=0.1)
@@ -320,6 +353,8 @@ class TestMeetingEndWatcher:
         assert message["summary"]["engagement_level"] == "high"
 
         socket.close.assert_called_once_with(code=1000, reason="Meeting ended")
+        payload_cache.discard.assert_called_once_with("test-meeting")
+        assert live_state.get("test-meeting") is None
 
     @pytest.mark.asyncio
     async def test_watcher_skips_if_already_closed(self):
@@ -343,14 +378,122 @@ class TestMeetingEndWatcher:
         meeting_summary_service = MagicMock()
         broadcast_repo = MagicMock()
 
-        watcher = MeetingEndWatcher(meeting_summary_service, broadcast_repo)
+        session = MagicMock()
+        session.run_sync = AsyncMock(side_effect=lambda fn: fn(MagicMock()))
+
+        watcher = MeetingEndWatcher(
+            lambda _session: meeting_summary_service,
+            broadcast_repo,
+            _session_factory(session),
+            jobs=MeetingEndJobs(),
+        )
 
         # Run watcher
         await watcher.watch(meeting, socket, is_closed, seconds_remaining=0.1)
 
         # Should not have done anything since already closed
         broadcast_repo.send_to_meeting.assert_not_called()
-        meeting_summary_service.persist_summary.assert_not_called()
+        meeting_summary_service.persist_summary_once.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_watchers_summarize_and_broadcast_once(self):
+        """All connections of a meeting share one end-of-meeting job."""
+        now = datetime.now(tz=UTC)
+        meeting = Meeting(id="test-meeting", start_ts=now, end_ts=now + timedelta(seconds=1))
+        meeting.city = None  # type: ignore[assignment]
+        meeting.meeting_room = None  # type: ignore[assignment]
+        meeting.ms_teams_meeting = None
+
+        summary = MagicMock(max_participants=3, normalized_engagement=0.5, engagement_level="low")
+        jobs = MeetingEndJobs()
+        services, broadcast_repos, sockets = [], [], []
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(5):
+                service = MagicMock()
+                service.persist_summary_once.return_value = (summary, True)
+                session = MagicMock()
+                session.commit = AsyncMock()
+
+                async def run_sync(fn):
+                    await anyio.sleep(0.01)  # Yield like a real DB round-trip
+                    return fn(MagicMock())
+
+                session.run_sync = run_sync
+                broadcast_repo = MagicMock()
+                socket = AsyncMock()
+
+                def create_summary_service(_session, service=service):
+                    return service
+
+                watcher = MeetingEndWatcher(
+                    create_summary_service,
+                    broadcast_repo,
+                    _session_factory(session),
+                    jobs=jobs,
+                )
+                tg.start_soon(watcher.watch, meeting, socket, anyio.Event(), 0.05)
+                services.append(service)
+                broadcast_repos.append(broadcast_repo)
+                sockets.append(socket)
+
+        assert sum(s.persist_summary_once.call_count for s in services) == 1
+        assert sum(r.send_to_meeting.call_count for r in broadcast_repos) == 1
+        for socket in sockets:
+            socket.close.assert_called_once_with(code=1000, reason="Meeting ended")
+
+    @pytest.mark.asyncio
+    async def test_watcher_sends_summary_produced_by_another_worker(self, monkeypatch):
+        """With shared channels, a worker losing the summary race notifies its own socket."""
+        monkeypatch.setattr(watcher_module.settings, "channels_backend", "redis")
+        now = datetime.now(tz=UTC)
+        meeting = Meeting(id="test-meeting", start_ts=now, end_ts=now + timedelta(seconds=1))
+        meeting.city = None  # type: ignore[assignment]
+        meeting.meeting_room = None  # type: ignore[assignment]
+        meeting.ms_teams_meeting = None
+
+        summary = MagicMock(max_participants=3, normalized_engagement=0.5, engagement_level="low")
+        service = MagicMock()
+        service.persist_summary_once.return_value = (summary, False)
+        session = MagicMock()
+        session.run_sync = AsyncMock(side_effect=lambda fn: fn(MagicMock()))
+        session.commit = AsyncMock()
+        broadcast_repo = MagicMock()
+        socket = AsyncMock()
+        watcher = MeetingEndWatcher(
+            lambda _session: service,
+            broadcast_repo,
+            _session_factory(session),
+            jobs=MeetingEndJobs(),
+        )
+
+        await watcher.watch(meeting, socket, anyio.Event(), seconds_remaining=0.01)
+
+        broadcast_repo.send_to_meeting.assert_not_called()
+        message = socket.send_json.call_args.args[0]
+        assert message["type"] == "meeting_ended"
+        assert message["summary"]["engagement_level"] == "low"
+        calls = [name for name, _args, _kwargs in socket.mock_calls]
+        assert calls.index("send_json") < calls.index("close")
+
+    @pytest.mark.asyncio
+    async def test_failed_job_is_retried_by_next_watcher(self):
+        jobs = MeetingEndJobs()
+        calls = []
+
+        async def failing():
+            calls.append("fail")
+            raise RuntimeError("database unavailable")
+
+        async def succeeding():
+            calls.append("ok")
+            return "summary"
+
+        with pytest.raises(RuntimeError):
+            await jobs.run("m1", failing)
+        assert await jobs.run("m1", succeeding) == "summary"
+        assert await jobs.run("m1", failing) == "summary"
+        assert calls == ["fail", "ok"]
 
 
 class TestLifecycleIntegration:
@@ -359,7 +502,7 @@ class TestLifecycleIntegration:
     @pytest.mark.asyncio
     async def test_coordinator_setup_active_meeting(self):
         """Test coordinator setup with active meeting."""
-        from app.services import MeetingService
+        from app.repos import AsyncMeetingRepo
         from app.ws.transport.lifecycle import LifecycleCoordinator
 
         # Create active meeting
@@ -378,22 +521,23 @@ class TestLifecycleIntegration:
         socket.path_params = {"meeting_id": "test-meeting"}
 
         channels = MagicMock()
-        session = MagicMock()
+        session_factory = MagicMock()
 
-        meeting_service = MagicMock(spec=MeetingService)
-        meeting_service.get_meeting.return_value = meeting
+        meeting_repo = MagicMock(spec=AsyncMeetingRepo)
+        meeting_repo.get_with_participants.return_value = meeting
 
         timing_validator = MeetingTimingValidator()
         connection_validator = ConnectionValidator(timing_validator)
 
-        coordinator = LifecycleCoordinator(connection_validator, meeting_service)
+        coordinator = LifecycleCoordinator(connection_validator, meeting_repo)
 
         # Setup lifecycle
-        result = await coordinator.setup(socket, channels, session)
+        result = await coordinator.setup(socket, channels, session_factory)
 
         assert result is not None
         assert result.context.meeting == meeting
-        assert result.factory is not None
+        assert result.context.session is None  # Sessions are opened per message
+        assert result.create_factory(MagicMock()) is not None
         assert result.subscription_repo is not None
         assert result.watcher is not None
         assert result.seconds_remaining > 0
@@ -401,7 +545,7 @@ class TestLifecycleIntegration:
     @pytest.mark.asyncio
     async def test_coordinator_setup_ended_meeting(self):
         """Test coordinator setup with ended meeting returns None."""
-        from app.services import MeetingService
+        from app.repos import AsyncMeetingRepo
         from app.ws.transport.lifecycle import LifecycleCoordinator
 
         # Create ended meeting
@@ -420,18 +564,18 @@ class TestLifecycleIntegration:
         socket.path_params = {"meeting_id": "test-meeting"}
 
         channels = MagicMock()
-        session = MagicMock()
+        session_factory = MagicMock()
 
-        meeting_service = MagicMock(spec=MeetingService)
-        meeting_service.get_meeting.return_value = meeting
+        meeting_repo = MagicMock(spec=AsyncMeetingRepo)
+        meeting_repo.get_with_participants.return_value = meeting
 
         timing_validator = MeetingTimingValidator()
         connection_validator = ConnectionValidator(timing_validator)
 
-        coordinator = LifecycleCoordinator(connection_validator, meeting_service)
+        coordinator = LifecycleCoordinator(connection_validator, meeting_repo)
 
         # Setup lifecycle
-        result = await coordinator.setup(socket, channels, session)
+        result = await coordinator.setup(socket, channels, session_factory)
 
         # Should return None for ended meeting
         assert result is None
@@ -119,6 +119,7 @@ async def test_processor_validates_participant_before_execution():
     # Mock context without participant
     context = MagicMock(spec=WSContext)
     context.participant = None  # Not joined
+    context.participant_id = None
     context.meeting = meeting
 
     # Mock factory
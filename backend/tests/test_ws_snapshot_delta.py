@@ -1,7 +1,7 @@
 """Tests for WebSocket snapshot/delta message optimization."""
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -61,8 +61,8 @@ async def test_join_service_returns_snapshot_in_response():
     # Mock context
     context = MagicMock(spec=WSContext)
     context.meeting = meeting
-    context.session = MagicMock()
-    context.session.commit = MagicMock()
+    context.session = AsyncMock()
+    context.run_sync = AsyncMock(side_effect=lambda fn, *args, **kwargs: fn(*args, **kwargs))
     context.set_participant = MagicMock()
 
     # Create join service
@@ -112,7 +112,7 @@ def test_bucket_rollup_carries_last_status_forward():
     participant_b.last_status = None
 
     participant_repo.get_for_meeting.return_value = [participant_a, participant_b]
-    engagement_repo.get_samples_for_meeting.return_value = []
+    engagement_repo.get_latest_statuses.return_value = {}
 
     builder = SnapshotBuilder(
         engagement_repo=engagement_repo,
@@ -167,8 +167,8 @@ async def test_join_service_broadcasts_delta_not_snapshot():
     # Mock context
     context = MagicMock(spec=WSContext)
     context.meeting = meeting
-    context.session = MagicMock()
-    context.session.commit = MagicMock()
+    context.session = AsyncMock()
+    context.run_sync = AsyncMock(side_effect=lambda fn, *args, **kwargs: fn(*args, **kwargs))
     context.set_participant = MagicMock()
 
     # Create join service
@@ -255,7 +255,8 @@ def test_joined_response_includes_snapshot():
     assert "snapshot" in json_data
 
 
-def test_leave_service_updates_and_broadcasts():
+@pytest.mark.asyncio
+async def test_leave_service_updates_and_broadcasts():
     """Test that LeaveService updates participant and broadcasts delta."""
     now = datetime.now(tz=UTC)
     past_start = now - timedelta(minutes=30)
@@ -285,12 +286,13 @@ def test_leave_service_updates_and_broadcasts():
     context = MagicMock(spec=WSContext)
     context.meeting = meeting
     context.participant = participant
+    context.run_sync = AsyncMock(side_effect=lambda fn, *args, **kwargs: fn(*args, **kwargs))
 
     # Create leave service
     leave_service = LeaveService(mock_engagement_service, mock_broadcast_repo)
 
     # Handle leave
-    leave_service.handle_leave(context)
+    await leave_service.handle_leave(context)
 
     # Verify participant's last_seen_at was updated
     assert participant.last_seen_at is not None
@@ -302,7 +304,8 @@ def test_leave_service_updates_and_broadcasts():
     assert call_args[0][2] == mock_engagement_service
 
 
-def test_leave_service_handles_no_participant():
+@pytest.mark.asyncio
+async def test_leave_service_handles_no_participant():
     """Test that LeaveService gracefully handles context without participant."""
     mock_engagement_service = MagicMock()
     mock_broadcast_repo = MagicMock(spec=BroadcastRepo)
@@ -315,7 +318,7 @@ def test_leave_service_handles_no_participant():
     leave_service = LeaveService(mock_engagement_service, mock_broadcast_repo)
 
     # Handle leave - should not raise exception
-    leave_service.handle_leave(context)
+    await leave_service.handle_leave(context)
 
     # Verify nothing was broadcast
     mock_broadcast_repo.publish_rollup.assert_not_called()
@@ -0,0 +1,117 @@
+"""Tests for the per-message units of work of WebSocket connections."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import event, select
+
+from app.models import EngagementSample, Meeting, Participant
+from app.repos import AsyncMeetingRepo
+from app.schema.websocket import ErrorResponse, JoinRequest, StatusUpdateRequest
+from app.ws.controllers.connection import _handle_message
+from app.ws.repos.broadcast import BroadcastRepo
+from app.ws.services.status import StatusService
+from app.ws.shared.factory import WSServiceFactory
+from app.ws.transport.context import WSContext
+
+
+async def test_messages_hold_a_connection_only_during_their_unit_of_work(async_session_factory):
+    now = datetime.now(tz=UTC)
+    async with async_session_factory() as session:
+        session.add(
+            Meeting(id="uow", start_ts=now - timedelta(minutes=5), end_ts=now + timedelta(hours=1))
+        )
+        await session.commit()
+    async with async_session_factory() as session:
+        meeting = await AsyncMeetingRepo(session).get_with_participants("uow")
+    assert meeting is not None
+
+    engine = async_session_factory.kw["bind"].sync_engine
+    checked_out = []
+    event.listen(engine, "checkout", lambda *args: checked_out.append(1))
+    event.listen(engine, "checkin", lambda *args: checked_out.pop())
+
+    context = WSContext(socket=MagicMock(), meeting=meeting, session_factory=async_session_factory)
+    broadcast_repo = MagicMock(spec=BroadcastRepo)
+
+    async with context.unit_of_work() as session:
+        join_service = WSServiceFactory(session, broadcast_repo).get_service("join")
+        assert join_service is not None
+        response = await join_service.execute(JoinRequest(fingerprint="fp"), context)
+    assert not isinstance(response, ErrorResponse)
+    assert context.participant is not None
+    assert context.session is None
+    assert checked_out == []
+
+    async with context.unit_of_work() as session:
+        status_service = WSServiceFactory(session, broadcast_repo).get_service("status")
+        assert status_service is not None
+        await status_service.execute(StatusUpdateRequest(status="engaged"), context)
+    assert checked_out == []
+
+    # Changes to the connection's participant are flushed by the unit of work
+    async with async_session_factory() as session:
+        participant = await session.get(Participant, context.participant.id)
+        assert participant.last_seen_at is not None
+        samples = (await session.scalars(select(EngagementSample))).all()
+        assert [sample.status for sample in samples] == ["engaged"]
+
+
+async def test_unit_of_work_rolls_back_on_error(async_session_factory):
+    now = datetime.now(tz=UTC)
+    meeting = Meeting(id="uow", start_ts=now, end_ts=now + timedelta(hours=1))
+    context = WSContext(socket=MagicMock(), meeting=meeting, session_factory=async_session_factory)
+
+    with pytest.raises(RuntimeError):
+        async with context.unit_of_work() as session:
+            session.add(meeting)
+            await session.flush()
+            raise RuntimeError("handler failed")
+
+    assert context.session is None
+    async with async_session_factory() as session:
+        assert await session.get(Meeting, "uow") is None
+    with pytest.raises(RuntimeError):
+        await context.run_sync(lambda: None)
+
+
+async def test_failed_message_does_not_break_the_next_one(async_session_factory, monkeypatch):
+    now = datetime.now(tz=UTC)
+    async with async_session_factory() as session:
+        session.add(
+            Meeting(id="uow", start_ts=now - timedelta(minutes=5), end_ts=now + timedelta(hours=1))
+        )
+        await session.commit()
+    async with async_session_factory() as session:
+        meeting = await AsyncMeetingRepo(session).get_with_participants("uow")
+    assert meeting is not None
+
+    context = WSContext(socket=MagicMock(), meeting=meeting, session_factory=async_session_factory)
+    broadcast_repo = MagicMock(spec=BroadcastRepo)
+    lifecycle = MagicMock(status_writer=None, sqlite_writer=None)
+    lifecycle.create_factory.side_effect = lambda session: WSServiceFactory(session, broadcast_repo)
+
+    response = await _handle_message({"type": "join", "fingerprint": "fp"}, context, lifecycle)
+    assert not isinstance(response, ErrorResponse)
+
+    async def failing_execute(self, request, context):
+        context.participant.last_status = "speaking"
+        await context.session.flush()
+        raise RuntimeError("write failed")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(StatusService, "execute", failing_execute)
+        response = await _handle_message(
+            {"type": "status", "status": "speaking"}, context, lifecycle
+        )
+    assert isinstance(response, ErrorResponse)
+
+    response = await _handle_message({"type": "status", "status": "engaged"}, context, lifecycle)
+    assert not isinstance(response, ErrorResponse)
+
+    async with async_session_factory() as session:
+        participant = await session.get(Participant, context.participant_id)
+        assert participant.last_status == "engaged"
+        samples = (await session.scalars(select(EngagementSample))).all()
+        assert [sample.status for sample in samples] == ["engaged"]
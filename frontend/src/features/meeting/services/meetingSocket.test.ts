@@ -218,3 +218,102 @@ describe("MeetingSocket - Snapshot/Delta Handling", () => {
   });
 });
 
+describe("MeetingSocket - Sparse Deltas (protocol 2)", () => {
+  let socket: MeetingSocket;
+  let mockWebSocket: MockWebSocket;
+
+  const sparse = (seq: number, participants: Record<string, number>, full = false) => ({
+    type: "sparse_delta",
+    data: {
+      meeting_id: "test-meeting",
+      bucket: "2024-01-01T10:05:00Z",
+      overall: 50,
+      participants,
+      seq,
+      stream: "s1",
+      full,
+    },
+  });
+
+  beforeEach(() => {
+    mockWebSocket = new MockWebSocket("ws://test");
+    // Keep readyState constants so MeetingSocket.send() reaches the mock
+    vi.stubGlobal(
+      "WebSocket",
+      Object.assign(vi.fn(() => mockWebSocket), { OPEN: WebSocket.OPEN, CLOSED: WebSocket.CLOSED })
+    );
+    socket = new MeetingSocket();
+  });
+
+  afterEach(() => {
+    socket.disconnect();
+    vi.unstubAllGlobals();
+  });
+
+  it("should request sparse deltas when joining", async () => {
+    const sendSpy = vi.spyOn(mockWebSocket, "send");
+    await socket.connect("test-meeting");
+
+    void socket.join("fp-1").catch(() => undefined);
+
+    expect(JSON.parse(sendSpy.mock.calls[0][0])).toEqual({
+      type: "join",
+      fingerprint: "fp-1",
+      protocol: 2,
+    });
+  });
+
+  it("should expand sparse deltas on top of the join baseline", async () => {
+    const deltaHandler = vi.fn();
+    socket.onDelta(deltaHandler);
+    await socket.connect("test-meeting");
+
+    mockWebSocket.simulateMessage({
+      type: "joined",
+      participant_id: "p1",
+      meeting_id: "test-meeting",
+      snapshot: {
+        meeting_id: "test-meeting",
+        start: "2024-01-01T10:00:00Z",
+        end: "2024-01-01T11:00:00Z",
+        bucket_minutes: 1,
+        overall: [],
+        participants: [],
+      },
+      sync: sparse(3, { p1: 100, p2: 0 }, true).data,
+    });
+    expect(deltaHandler).not.toHaveBeenCalled();
+
+    mockWebSocket.simulateMessage(sparse(4, { p2: 100 }));
+    mockWebSocket.simulateMessage(sparse(3, { p1: 0 }));
+
+    expect(deltaHandler).toHaveBeenCalledTimes(1);
+    expect(deltaHandler).toHaveBeenCalledWith({
+      meeting_id: "test-meeting",
+      bucket: "2024-01-01T10:05:00Z",
+      overall: 50,
+      participants: { p1: 100, p2: 100 },
+    });
+  });
+
+  it("should request a resync once on a sequence gap", async () => {
+    const deltaHandler = vi.fn();
+    socket.onDelta(deltaHandler);
+    const sendSpy = vi.spyOn(mockWebSocket, "send");
+    await socket.connect("test-meeting");
+
+    mockWebSocket.simulateMessage(sparse(1, { p1: 100 }));
+    mockWebSocket.simulateMessage(sparse(3, { p2: 0 }));
+    mockWebSocket.simulateMessage(sparse(5, { p3: 0 }));
+
+    const resyncs = sendSpy.mock.calls.filter(
+      ([data]) => JSON.parse(data).type === "resync"
+    );
+    expect(resyncs).toHaveLength(1);
+
+    mockWebSocket.simulateMessage(sparse(6, { p1: 0, p2: 100 }, true));
+    expect(deltaHandler).toHaveBeenLastCalledWith(
+      expect.objectContaining({ participants: { p1: 0, p2: 100 } })
+    );
+  });
+});
@@ -3,15 +3,23 @@
  *
  * Handles connection lifecycle, message routing, and automatic reconnection.
  * Uses connection-based identity (no fingerprints needed).
+ *
+ * With delta protocol 2 the server only sends participants whose value
+ * changed; the socket keeps the full participant map and hands complete
+ * deltas to `onDelta` handlers, requesting a resync when it detects a gap.
  */
 
 import type { EngagementSummaryDto, StatusLiteral } from "../types/dto";
-import type { DeltaMessageData } from "../types/ws";
+import type { DeltaMessageData, SparseDeltaMessageData } from "../types/ws";
+
+/** Delta protocol negotiated in the join message */
+export type DeltaProtocol = 1 | 2;
 
 /** Messages sent from client to server */
 type WSMessage =
-  | { type: "join"; fingerprint: string }
+  | { type: "join"; fingerprint: string; protocol: DeltaProtocol }
   | { type: "status"; status: StatusLiteral }
+  | { type: "resync" }
   | { type: "ping" };
 
 /** MS Teams meeting info */
@@ -46,7 +54,14 @@ export type MeetingSummaryData = {
 type WSResponse =
   | { type: "snapshot"; data: EngagementSummaryDto }
   | { type: "delta"; data: DeltaMessageData }
-  | { type: "joined"; participant_id: string; meeting_id: string; snapshot: EngagementSummaryDto }
+  | { type: "sparse_delta"; data: SparseDeltaMessageData }
+  | {
+      type: "joined";
+      participant_id: string;
+      meeting_id: string;
+      snapshot: EngagementSummaryDto;
+      sync?: SparseDeltaMessageData | null;
+    }
   | { type: "pong"; server_time: string }
   | { type: "error"; message: string }
   | { type: "meeting_ended"; message?: string; end_time?: string; summary?: MeetingSummaryData | null }
@@ -77,6 +92,17 @@ export class MeetingSocket {
   private reconnectTimeout: number | null = null;
   private reconnectAttempts = 0;
   private connectionState: ConnectionState = "disconnected";
+  /** Latest value per participant, reconstructed from sparse deltas */
+  private participantValues: Record<string, number> = {};
+  /** Last applied sequence number per server stream */
+  private streamSeqs = new Map<string, number>();
+  private resyncPending = false;
+  private readonly protocol: DeltaProtocol;
+
+  /** @param protocol Delta protocol to request on join (2 = sparse deltas) */
+  constructor(protocol: DeltaProtocol = 2) {
+    this.protocol = protocol;
+  }
 
   private handlers = {
     snapshot: [] as ((data: EngagementSummaryDto) => void)[],
@@ -122,6 +148,7 @@ export class MeetingSocket {
     }
 
     this.meetingId = meetingId;
+    this.resetDeltaState();
     this.setConnectionState("connecting");
 
     const protocol = window.location.protocol === "https:" ? "wss" : "ws";
@@ -186,7 +213,7 @@ export class MeetingSocket {
     }
 
     this.deviceFingerprint = fingerprint;
-    this.send({ type: "join", fingerprint });
+    this.send({ type: "join", fingerprint, protocol: this.protocol });
 
     return new Promise((resolve, reject) => {
       const timeout = setTimeout(() => {
@@ -332,8 +359,15 @@ export class MeetingSocket {
       case "delta":
         this.handlers.delta.forEach((h) => h(response.data));
         break;
+      case "sparse_delta":
+        this.applySparseDelta(response.data, true);
+        break;
       case "joined":
         this.participantId = response.participant_id;
+        if (response.sync) {
+          // Baseline only; the embedded snapshot below already renders it
+          this.applySparseDelta(response.sync, false);
+        }
         // Trigger snapshot handlers with embedded snapshot data
         if (response.snapshot) {
           this.handlers.snapshot.forEach((h) => h(response.snapshot));
@@ -374,6 +408,50 @@ export class MeetingSocket {
     }
   }
 
+  /**
+   * Merge a sparse delta into the participant map and emit a full delta.
+   * Stale messages are ignored; a gap in a stream's sequence triggers a resync.
+   */
+  private applySparseDelta(data: SparseDeltaMessageData, emit: boolean): void {
+    const lastSeq = this.streamSeqs.get(data.stream);
+
+    if (data.full) {
+      this.participantValues = { ...data.participants };
+      this.resyncPending = false;
+    } else {
+      if (lastSeq !== undefined && data.seq <= lastSeq) {
+        return;
+      }
+      if (lastSeq !== undefined && data.seq !== lastSeq + 1) {
+        this.requestResync();
+      }
+      Object.assign(this.participantValues, data.participants);
+    }
+    this.streamSeqs.set(data.stream, data.seq);
+
+    if (!emit) return;
+    const delta: DeltaMessageData = {
+      meeting_id: data.meeting_id,
+      bucket: data.bucket,
+      overall: data.overall,
+      participants: { ...this.participantValues },
+    };
+    this.handlers.delta.forEach((h) => h(delta));
+  }
+
+  private requestResync(): void {
+    if (this.resyncPending) return;
+    this.resyncPending = true;
+    console.warn("[WS] Delta sequence gap detected, requesting resync");
+    this.send({ type: "resync" });
+  }
+
+  private resetDeltaState(): void {
+    this.participantValues = {};
+    this.streamSeqs.clear();
+    this.resyncPending = false;
+  }
+
   private setConnectionState(state: ConnectionState): void {
     if (this.connectionState !== state) {
       this.connectionState = state;
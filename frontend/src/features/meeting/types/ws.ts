@@ -17,6 +17,22 @@ export type DeltaMessage = {
   data: DeltaMessageData;
 };
 
+/**
+ * Sparse delta (protocol 2): only participants whose value changed.
+ * `seq` increases by one per message within a `stream`; `full` marks a
+ * complete baseline (join sync or resync reply).
+ */
+export type SparseDeltaMessageData = DeltaMessageData & {
+  seq: number;
+  stream: string;
+  full: boolean;
+};
+
+export type SparseDeltaMessage = {
+  type: "sparse_delta";
+  data: SparseDeltaMessageData;
+};
+
 export type PongMessage = {
   type: "pong";
 };
@@ -30,5 +46,10 @@ export type MeetingCountdownMessage = {
   meeting_room_name?: string | null;
 };
 
-export type EngagementMessage = SnapshotMessage | DeltaMessage | PongMessage | MeetingCountdownMessage;
+export type EngagementMessage =
+  | SnapshotMessage
+  | DeltaMessage
+  | SparseDeltaMessage
+  | PongMessage
+  | MeetingCountdownMessage;
 